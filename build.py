@@ -20,6 +20,12 @@ def build_game():
     # Get project root
     project_root = Path(__file__).parent
     
+    # Record resolved asset paths so the game doesn't scan folders at startup
+    os.chdir(project_root)
+    from utils.asset_manifest import MANIFEST_PATH, write_manifest
+    write_manifest()
+    print(f"📋 Asset manifest written to {MANIFEST_PATH}")
+    
     # PyInstaller command
     cmd = [
         "pyinstaller",
@@ -8,9 +8,17 @@ import pygame
 
 import settings as S
 from entities.bullet import Bullet
+from utils.frame_cache import get_transformed_frame
 from utils.sprites import get_sprite_loader
 
 
+# Phase-based tints multiplied into the boss sprite (RGB only)
+PHASE_TINTS = {
+    2: (255, 150, 50, 20),  # Orange tint for phase 2
+    3: (255, 50, 50, 30),  # Red tint for phase 3
+}
+
+
 class Boss(pygame.sprite.Sprite):
     """Boss enemy with multiple phases and attack patterns."""
     
@@ -32,10 +40,8 @@ class Boss(pygame.sprite.Sprite):
                 self._scale_factor = min(128 / w, 128 / h)
             else:
                 self._scale_factor = 1.5  # Scale up boss
-            if self._scale_factor != 1.0:
-                # Use regular scale for boss (smoothscale is expensive)
-                sprite = pygame.transform.scale(sprite, (int(w * self._scale_factor), int(h * self._scale_factor)))
-            self.image = sprite
+            # Use regular scale for boss (smoothscale is expensive)
+            self.image = self._transformed_frame(sprite)
         else:
             # Fallback placeholder - larger for boss
             self.image = pygame.Surface((80, 100))
@@ -154,17 +160,25 @@ class Boss(pygame.sprite.Sprite):
             if self.attack_cooldown == 0:
                 self._perform_attack(bullets_group)
     
+    def _transformed_frame(self, sprite: pygame.Surface, tint=None, flip_x: bool = False) -> pygame.Surface:
+        """Scaled, tinted and optionally mirrored animation frame (shared, from the frame cache)."""
+        size = None
+        if self._scale_factor and self._scale_factor != 1.0:
+            w, h = sprite.get_size()
+            size = (int(w * self._scale_factor), int(h * self._scale_factor))
+        return get_transformed_frame(sprite, size, tint=tint, tint_flags=pygame.BLEND_MULT, flip_x=flip_x)
+
     def _update_sprite(self) -> None:
         """Update boss sprite with visual effects."""
         # Update animation controller
         self.anim_controller.update(1.0 / 60.0)
         sprite = self.anim_controller.get_frame()
-        if sprite:
-            if self._scale_factor and self._scale_factor != 1.0:
-                w, h = sprite.get_size()
-                new_w = int(w * self._scale_factor)
-                new_h = int(h * self._scale_factor)
-                sprite = pygame.transform.scale(sprite, (new_w, new_h))
+        if sprite and not (self.phase_transition_timer > 0 or self.charge_timer > 0 or self.flash_timer > 0):
+            # Steady state: the tinted, flipped frame comes straight from the cache
+            self.image = self._transformed_frame(sprite, PHASE_TINTS.get(self.phase), self.facing < 0)
+        elif sprite:
+            # Flashes change every frame, so draw them on a copy of the cached frame
+            sprite = self._transformed_frame(sprite).copy()
             
             # Apply visual effects
             if self.phase_transition_timer > 0:
@@ -189,21 +203,13 @@ class Boss(pygame.sprite.Sprite):
                 sprite.blit(flash_surf, (0, 0), special_flags=pygame.BLEND_ADD)
             
             # Phase-based tint
-            if self.phase == 3:
-                # Red tint for phase 3
-                tint_surf = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
-                tint_surf.fill((255, 50, 50, 30))
-                sprite.blit(tint_surf, (0, 0), special_flags=pygame.BLEND_MULT)
-            elif self.phase == 2:
-                # Orange tint for phase 2
-                tint_surf = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
-                tint_surf.fill((255, 150, 50, 20))
-                sprite.blit(tint_surf, (0, 0), special_flags=pygame.BLEND_MULT)
+            if self.phase in PHASE_TINTS:
+                sprite.fill(PHASE_TINTS[self.phase], special_flags=pygame.BLEND_MULT)
             
-            self._base_image = sprite
-        
-        # Flip sprite based on facing
-        self.image = pygame.transform.flip(self._base_image, self.facing < 0, False)
+            # Flip sprite based on facing
+            self.image = pygame.transform.flip(sprite, self.facing < 0, False)
+        else:
+            self.image = pygame.transform.flip(self._base_image, self.facing < 0, False)
         old_center = self.rect.center
         self.rect = self.image.get_rect()
         self.rect.center = old_center
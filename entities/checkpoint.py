@@ -4,6 +4,25 @@ from __future__ import annotations
 import pygame
 
 import settings as S
+from utils.image_registry import get_shared_image
+
+
+def _draw_checkpoint_flag() -> pygame.Surface:
+    # Create checkpoint flag sprite
+    image = pygame.Surface((24, 32), pygame.SRCALPHA)
+    # Draw flag pole
+    pygame.draw.rect(image, (100, 100, 100), (10, 0, 4, 32))
+    # Draw flag - Bitcoin orange
+    flag_points = [
+        (14, 4),
+        (24, 8),
+        (14, 12)
+    ]
+    pygame.draw.polygon(image, S.BITCOIN_ORANGE, flag_points)
+    pygame.draw.polygon(image, S.BITCOIN_GOLD, flag_points, 1)
+    # Add Bitcoin symbol on flag
+    pygame.draw.circle(image, (255, 255, 255), (18, 8), 3)
+    return image
 
 
 class Checkpoint(pygame.sprite.Sprite):
@@ -14,20 +33,7 @@ class Checkpoint(pygame.sprite.Sprite):
         self.x = x
         self.y = y
         
-        # Create checkpoint flag sprite
-        self.image = pygame.Surface((24, 32), pygame.SRCALPHA)
-        # Draw flag pole
-        pygame.draw.rect(self.image, (100, 100, 100), (10, 0, 4, 32))
-        # Draw flag - Bitcoin orange
-        flag_points = [
-            (14, 4),
-            (24, 8),
-            (14, 12)
-        ]
-        pygame.draw.polygon(self.image, S.BITCOIN_ORANGE, flag_points)
-        pygame.draw.polygon(self.image, S.BITCOIN_GOLD, flag_points, 1)
-        # Add Bitcoin symbol on flag
-        pygame.draw.circle(self.image, (255, 255, 255), (18, 8), 3)
+        self.image = get_shared_image("checkpoint_flag", _draw_checkpoint_flag)
         
         self.rect = self.image.get_rect(center=(x, y))
         self.activated = False
@@ -7,28 +7,65 @@ import pygame
 
 import settings as S
 from utils.animations import load_image
+from utils.image_registry import get_shared_image
+
+
+# Coins spin through this many precomputed angles (5 degree steps)
+COIN_ROTATION_STEPS = 72
+
+
+def _draw_bitcoin_coin() -> pygame.Surface:
+    # Create Bitcoin sprite (Bitcoin orange circle with B symbol)
+    image = pygame.Surface((16, 16), pygame.SRCALPHA)
+    # Draw Bitcoin orange circle
+    pygame.draw.circle(image, S.BITCOIN_ORANGE, (8, 8), 7)
+    pygame.draw.circle(image, S.BITCOIN_GOLD, (8, 8), 7, 1)
+    # Add Bitcoin "B" symbol
+    pygame.draw.circle(image, (255, 255, 255), (8, 8), 4)
+    # Simple B shape
+    pygame.draw.rect(image, S.BITCOIN_ORANGE, (6, 5, 4, 6))
+    pygame.draw.rect(image, S.BITCOIN_ORANGE, (7, 5, 2, 2))
+    pygame.draw.rect(image, S.BITCOIN_ORANGE, (7, 9, 2, 2))
+    return image
+
+
+_COIN_STYLES = {"bitcoin": _draw_bitcoin_coin}
+
+
+def _build_coin_rotation_strip(style: str) -> list[pygame.Surface]:
+    base = _COIN_STYLES[style]()
+    return [pygame.transform.rotate(base, step * 360 / COIN_ROTATION_STEPS) for step in range(COIN_ROTATION_STEPS)]
+
+
+def _draw_key() -> pygame.Surface:
+    # Create private key sprite (Bitcoin-themed)
+    image = pygame.Surface((20, 20), pygame.SRCALPHA)
+    # Draw key shape with Bitcoin colors
+    # Key head (circle) - Bitcoin orange
+    pygame.draw.circle(image, S.BITCOIN_ORANGE, (10, 8), 6)
+    pygame.draw.circle(image, S.BITCOIN_GOLD, (10, 8), 6, 1)
+    # Key shaft
+    pygame.draw.rect(image, S.BITCOIN_ORANGE, (8, 12, 4, 6))
+    # Key teeth
+    pygame.draw.rect(image, S.BITCOIN_ORANGE, (10, 14, 3, 2))
+    return image
+
+
+def get_coin_rotation_strip(style: str = "bitcoin") -> list[pygame.Surface]:
+    """The coin image rotated to each of COIN_ROTATION_STEPS angles (shared, don't modify)."""
+    return get_shared_image("coin_rotation_strip", _build_coin_rotation_strip, style)
 
 
 class Coin(pygame.sprite.Sprite):
     """Bitcoin/Satoshi collectible that adds to score."""
     
-    def __init__(self, x: int, y: int, value: int = 10):
+    def __init__(self, x: int, y: int, value: int = 10, style: str = "bitcoin"):
         super().__init__()
         self.value = value
         
-        # Create Bitcoin sprite (Bitcoin orange circle with B symbol)
-        self.image = pygame.Surface((16, 16), pygame.SRCALPHA)
-        # Draw Bitcoin orange circle
-        import settings as S
-        pygame.draw.circle(self.image, S.BITCOIN_ORANGE, (8, 8), 7)
-        pygame.draw.circle(self.image, S.BITCOIN_GOLD, (8, 8), 7, 1)
-        # Add Bitcoin "B" symbol
-        pygame.draw.circle(self.image, (255, 255, 255), (8, 8), 4)
-        # Simple B shape
-        pygame.draw.rect(self.image, S.BITCOIN_ORANGE, (6, 5, 4, 6))
-        pygame.draw.rect(self.image, S.BITCOIN_ORANGE, (7, 5, 2, 2))
-        pygame.draw.rect(self.image, S.BITCOIN_ORANGE, (7, 9, 2, 2))
-        
+        # Spinning is a lookup into the shared rotation strip
+        self._rotation_frames = get_coin_rotation_strip(style)
+        self.image = self._rotation_frames[0]
         self.rect = self.image.get_rect(center=(x, y))
         
         # Animation/bobbing and rotation
@@ -37,7 +74,6 @@ class Coin(pygame.sprite.Sprite):
         self.rotation = 0.0
         self.rotation_speed = 2.0
         self._base_y = y
-        self._base_image = self.image.copy()
     
     def update(self, *args, **kwargs) -> None:
         """Animate the coin (bobbing and rotation)."""
@@ -52,10 +88,11 @@ class Coin(pygame.sprite.Sprite):
         bob_amount = math.sin(math.radians(self.bob_offset)) * 4
         self.rect.y = int(self._base_y + bob_amount)
         
-        # Rotate coin
-        self.image = pygame.transform.rotate(self._base_image, self.rotation)
+        # Rotate coin: pick the nearest precomputed angle, keeping the rect centered
+        step = int(self.rotation * COIN_ROTATION_STEPS / 360) % COIN_ROTATION_STEPS
+        self.image = self._rotation_frames[step]
         old_center = self.rect.center
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.center = old_center
     
     def collect(self, player) -> bool:
@@ -72,16 +109,7 @@ class Key(pygame.sprite.Sprite):
         super().__init__()
         self.key_id = key_id
         
-        # Create private key sprite (Bitcoin-themed)
-        self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
-        # Draw key shape with Bitcoin colors
-        # Key head (circle) - Bitcoin orange
-        pygame.draw.circle(self.image, S.BITCOIN_ORANGE, (10, 8), 6)
-        pygame.draw.circle(self.image, S.BITCOIN_GOLD, (10, 8), 6, 1)
-        # Key shaft
-        pygame.draw.rect(self.image, S.BITCOIN_ORANGE, (8, 12, 4, 6))
-        # Key teeth
-        pygame.draw.rect(self.image, S.BITCOIN_ORANGE, (10, 14, 3, 2))
+        self.image = get_shared_image("key", _draw_key)
         
         self.rect = self.image.get_rect(center=(x, y))
         
@@ -5,6 +5,11 @@ import pygame
 import settings as S
 from utils.sprites import get_sprite_loader
 from utils.animations import AnimationController
+from utils.frame_cache import get_transformed_frame
+
+
+# Red tint (subtle - 20% opacity) multiplied into enemy sprites
+ENEMY_TINT = (255, 50, 50, 50)
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -30,22 +35,14 @@ class Enemy(pygame.sprite.Sprite):
             else:
                 self._scale_factor = 1.0
             
-            if self._scale_factor != 1.0:
-                new_w = int(w * self._scale_factor)
-                new_h = int(h * self._scale_factor)
-                # Use smoothscale for better quality
-                sprite = pygame.transform.smoothscale(sprite, (new_w, new_h))
-            
-            # Apply red tint to make enemies look more menacing
-            sprite = self._apply_enemy_tint(sprite)
-            self.image = sprite
+            # Scale and apply red tint to make enemies look more menacing
+            self.image = self._transformed_frame(sprite)
         else:
             # Better fallback placeholder - more detailed
             self.image = self._create_fallback_sprite()
             self._scale_factor = 1.0
         
         self.rect = self.image.get_rect(topleft=(x, y))
-        self._base_image = self.image.copy()
         self.position = pygame.Vector2(self.rect.x, self.rect.y)
         self.velocity = pygame.Vector2(speed, 0)
         self.left_bound = left_bound
@@ -65,16 +62,16 @@ class Enemy(pygame.sprite.Sprite):
         self._shoot_cooldown = 0
         self.player_target = None  # Reference to player when detected
     
-    def _apply_enemy_tint(self, sprite: pygame.Surface) -> pygame.Surface:
-        """Apply a red/menacing tint to enemy sprite."""
-        # Create a tinted copy
-        tinted = sprite.copy()
-        # Create a red overlay with alpha
-        overlay = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
-        # Red tint (subtle - 20% opacity)
-        overlay.fill((255, 50, 50, 50))
-        tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        return tinted
+    def _transformed_frame(self, sprite: pygame.Surface, flip_x: bool = False) -> pygame.Surface:
+        """Scaled, red-tinted and optionally mirrored animation frame (shared, from the frame cache)."""
+        size = None
+        smooth = False
+        if self._scale_factor and self._scale_factor != 1.0:
+            w, h = sprite.get_size()
+            size = (int(w * self._scale_factor), int(h * self._scale_factor))
+            # Only use smoothscale if significantly different size, otherwise use regular scale for performance
+            smooth = abs(size[0] - w) > 2 or abs(size[1] - h) > 2
+        return get_transformed_frame(sprite, size, smooth, ENEMY_TINT, flip_x=flip_x)
     
     def _create_fallback_sprite(self) -> pygame.Surface:
         """Create a better-looking fallback sprite."""
@@ -110,8 +107,10 @@ class Enemy(pygame.sprite.Sprite):
         if self.hp == 0:
             self.kill()
 
-    def _collide_axis(self, solids: list[pygame.Rect], axis: str) -> None:
-        hits = [r for r in solids if self.rect.colliderect(r)]
+    def _collide_axis(self, solids, axis: str) -> None:
+        # A Level answers "what overlaps this rect" from its tile index
+        candidates = solids.query_solids(self.rect) if hasattr(solids, "query_solids") else solids
+        hits = [r for r in candidates if self.rect.colliderect(r)]
         for tile in hits:
             if axis == "x":
                 if self.velocity.x > 0:
@@ -162,12 +161,12 @@ class Enemy(pygame.sprite.Sprite):
         bullets_group.add(bullet)
         self._shoot_cooldown = self.shoot_cooldown_frames
     
-    def update(self, _keys, solids: list[pygame.Rect] | None = None, player=None, bullets_group=None) -> None:
+    def update(self, _keys, solids=None, player=None, bullets_group=None) -> None:
         """Update enemy AI and movement.
         
         Args:
             _keys: Unused (for compatibility with sprite group update)
-            solids: List of solid rectangles for collision
+            solids: List of solid rectangles for collision, or a Level to query its tile index
             player: Player sprite to detect and engage
             bullets_group: Group to add bullets to when shooting
         """
@@ -249,25 +248,11 @@ class Enemy(pygame.sprite.Sprite):
         
         sprite = self.anim_controller.get_frame()
         if sprite:
-            # Only scale if needed and cache the scaled version
-            if self._scale_factor and self._scale_factor != 1.0:
-                w, h = sprite.get_size()
-                new_w = int(w * self._scale_factor)
-                new_h = int(h * self._scale_factor)
-                # Only use smoothscale if significantly different size, otherwise use regular scale for performance
-                if abs(new_w - w) > 2 or abs(new_h - h) > 2:
-                    sprite = pygame.transform.smoothscale(sprite, (new_w, new_h))
-                elif new_w != w or new_h != h:
-                    sprite = pygame.transform.scale(sprite, (new_w, new_h))
-            # Apply tint each frame
-            sprite = self._apply_enemy_tint(sprite)
-            self._base_image = sprite
+            # Scaled, tinted and flipped based on facing; each variant is built once
+            self.image = self._transformed_frame(sprite, self.facing < 0)
         else:
             # Use fallback sprite
-            self._base_image = self._create_fallback_sprite()
-        
-        # Flip based on facing
-        self.image = pygame.transform.flip(self._base_image, self.facing < 0, False)
+            self.image = pygame.transform.flip(self._create_fallback_sprite(), self.facing < 0, False)
         old_center = self.rect.center
         self.rect = self.image.get_rect()
         self.rect.center = old_center
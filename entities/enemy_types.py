@@ -81,20 +81,9 @@ class FlyingEnemy(Enemy):
         self.anim_controller.update(1.0 / 60.0)
         sprite = self.anim_controller.get_frame()
         if sprite:
-            if self._scale_factor and self._scale_factor != 1.0:
-                w, h = sprite.get_size()
-                new_w = int(w * self._scale_factor)
-                new_h = int(h * self._scale_factor)
-                if abs(new_w - w) > 2 or abs(new_h - h) > 2:
-                    sprite = pygame.transform.smoothscale(sprite, (new_w, new_h))
-                elif new_w != w or new_h != h:
-                    sprite = pygame.transform.scale(sprite, (new_w, new_h))
-            sprite = self._apply_enemy_tint(sprite)
-            self._base_image = sprite
+            self.image = self._transformed_frame(sprite, self.facing < 0)
         else:
-            self._base_image = self._create_fallback_sprite()
-        
-        self.image = pygame.transform.flip(self._base_image, self.facing < 0, False)
+            self.image = pygame.transform.flip(self._create_fallback_sprite(), self.facing < 0, False)
         old_center = self.rect.center
         self.rect = self.image.get_rect()
         self.rect.center = old_center
@@ -4,6 +4,70 @@ import pygame
 
 import settings as S
 from utils.animations import load_image
+from utils.image_registry import get_shared_image
+
+
+def _draw_ammo_pack() -> pygame.Surface:
+    # Load ammo pack sprite
+    pickup_path = "assets/sprites/pickups/ammo_pack.png"
+    sprite = load_image(pickup_path)
+    
+    if sprite:
+        w, h = sprite.get_size()
+        # Scale if too large
+        if w > 32 or h > 32:
+            scale = min(32 / w, 32 / h)
+            sprite = pygame.transform.scale(sprite, (int(w * scale), int(h * scale)))
+        return sprite
+    # Fallback placeholder
+    image = pygame.Surface((24, 24))
+    image.fill((200, 200, 50))
+    # Draw a simple "A" for ammo
+    pygame.draw.rect(image, (255, 255, 0), (4, 4, 16, 16))
+    return image
+
+
+def _draw_health_cross() -> pygame.Surface:
+    # Create a simple health pickup sprite (red cross)
+    image = pygame.Surface((24, 24), pygame.SRCALPHA)
+    # Draw red cross
+    pygame.draw.rect(image, (255, 50, 50), (10, 4, 4, 16))
+    pygame.draw.rect(image, (255, 50, 50), (4, 10, 16, 4))
+    return image
+
+
+def _draw_shield() -> pygame.Surface:
+    # Create a simple shield pickup sprite (blue shield)
+    image = pygame.Surface((24, 24), pygame.SRCALPHA)
+    # Draw blue shield shape
+    pygame.draw.circle(image, (100, 150, 255), (12, 12), 10, 2)
+    pygame.draw.arc(image, (150, 200, 255), (4, 4, 16, 16), 0, 3.14, 2)
+    return image
+
+
+def _draw_speed_arrow() -> pygame.Surface:
+    # Create speed pickup sprite (green arrow)
+    image = pygame.Surface((24, 24), pygame.SRCALPHA)
+    # Draw green arrow pointing right
+    pygame.draw.polygon(image, (50, 255, 50), [(4, 12), (16, 6), (16, 10), (20, 10), (20, 14), (16, 14), (16, 18)])
+    return image
+
+
+def _draw_damage_star() -> pygame.Surface:
+    import math
+    # Create damage boost sprite (red star)
+    image = pygame.Surface((24, 24), pygame.SRCALPHA)
+    # Draw red star
+    center = (12, 12)
+    outer_radius = 10
+    inner_radius = 5
+    points = []
+    for i in range(10):
+        angle = math.radians(i * 36 - 90)
+        radius = outer_radius if i % 2 == 0 else inner_radius
+        points.append((center[0] + radius * math.cos(angle), center[1] + radius * math.sin(angle)))
+    pygame.draw.polygon(image, (255, 50, 50), points)
+    return image
 
 
 class AmmoPickup(pygame.sprite.Sprite):
@@ -13,23 +77,7 @@ class AmmoPickup(pygame.sprite.Sprite):
         super().__init__()
         self.ammo_amount = ammo_amount
         
-        # Load ammo pack sprite
-        pickup_path = "assets/sprites/pickups/ammo_pack.png"
-        sprite = load_image(pickup_path)
-        
-        if sprite:
-            w, h = sprite.get_size()
-            # Scale if too large
-            if w > 32 or h > 32:
-                scale = min(32 / w, 32 / h)
-                sprite = pygame.transform.scale(sprite, (int(w * scale), int(h * scale)))
-            self.image = sprite
-        else:
-            # Fallback placeholder
-            self.image = pygame.Surface((24, 24))
-            self.image.fill((200, 200, 50))
-            # Draw a simple "A" for ammo
-            pygame.draw.rect(self.image, (255, 255, 0), (4, 4, 16, 16))
+        self.image = get_shared_image("ammo_pack", _draw_ammo_pack)
         
         self.rect = self.image.get_rect(center=(x, y))
         
@@ -70,11 +118,7 @@ class HealthPickup(pygame.sprite.Sprite):
         super().__init__()
         self.health_amount = health_amount
         
-        # Create a simple health pickup sprite (red cross)
-        self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-        # Draw red cross
-        pygame.draw.rect(self.image, (255, 50, 50), (10, 4, 4, 16))
-        pygame.draw.rect(self.image, (255, 50, 50), (4, 10, 16, 4))
+        self.image = get_shared_image("health_cross", _draw_health_cross)
         
         self.rect = self.image.get_rect(center=(x, y))
         
@@ -109,11 +153,7 @@ class ShieldPickup(pygame.sprite.Sprite):
         super().__init__()
         self.shield_duration = shield_duration  # Frames of shield
         
-        # Create a simple shield pickup sprite (blue shield)
-        self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-        # Draw blue shield shape
-        pygame.draw.circle(self.image, (100, 150, 255), (12, 12), 10, 2)
-        pygame.draw.arc(self.image, (150, 200, 255), (4, 4, 16, 16), 0, 3.14, 2)
+        self.image = get_shared_image("shield", _draw_shield)
         
         self.rect = self.image.get_rect(center=(x, y))
         
@@ -149,10 +189,7 @@ class SpeedPickup(pygame.sprite.Sprite):
         self.duration = duration
         self.speed_multiplier = speed_multiplier
         
-        # Create speed pickup sprite (green arrow)
-        self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-        # Draw green arrow pointing right
-        pygame.draw.polygon(self.image, (50, 255, 50), [(4, 12), (16, 6), (16, 10), (20, 10), (20, 14), (16, 14), (16, 18)])
+        self.image = get_shared_image("speed_arrow", _draw_speed_arrow)
         
         self.rect = self.image.get_rect(center=(x, y))
         self.bob_offset = 0.0
@@ -188,21 +225,7 @@ class DamageBoostPickup(pygame.sprite.Sprite):
         self.duration = duration
         self.damage_multiplier = damage_multiplier
         
-        # Create damage boost sprite (red star)
-        self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-        # Draw red star
-        import math
-        center = (12, 12)
-        outer_radius = 10
-        inner_radius = 5
-        points = []
-        for i in range(10):
-            angle = math.radians(i * 36 - 90)
-            radius = outer_radius if i % 2 == 0 else inner_radius
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
-        pygame.draw.polygon(self.image, (255, 50, 50), points)
+        self.image = get_shared_image("damage_star", _draw_damage_star)
         
         self.rect = self.image.get_rect(center=(x, y))
         self.bob_offset = 0.0
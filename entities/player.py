@@ -7,6 +7,7 @@ import pygame
 import settings as S
 from utils.sprites import get_sprite_loader
 from utils.animations import AnimationController
+from utils.frame_cache import get_transformed_frame
 
 
 @dataclass
@@ -37,16 +38,13 @@ class Player(pygame.sprite.Sprite):
                 self._scale_factor = min(64 / w, 96 / h)
             else:
                 self._scale_factor = 1.0
-            if self._scale_factor != 1.0:
-                sprite = pygame.transform.scale(sprite, (int(w * self._scale_factor), int(h * self._scale_factor)))
-            self.image = sprite
+            self.image = self._transformed_frame(sprite)
         else:
             # Fallback placeholder
             self.image = pygame.Surface((32, 48))
             self.image.fill(S.BLUE)
             self._scale_factor = 1.0
         self.rect = self.image.get_rect(topleft=(x, y))
-        self._base_image = self.image.copy()  # Store for flipping
 
         # Sub-pixel precise position and velocity
         self.position = pygame.Vector2(self.rect.x, self.rect.y)
@@ -133,8 +131,12 @@ class Player(pygame.sprite.Sprite):
         self.hp = max(0, self.hp - amount)
         self._iframes_counter = self.iframes_frames
 
-    def _collide_axis(self, solids: list[pygame.Rect], axis: str) -> None:
-        hits = [r for r in solids if self.rect.colliderect(r)]
+    def _collide_axis(self, solids, axis: str, extra: list[pygame.Rect] | None = None) -> None:
+        # A Level answers "what overlaps this rect" from its tile index
+        candidates = solids.query_solids(self.rect) if hasattr(solids, "query_solids") else solids
+        hits = [r for r in candidates if self.rect.colliderect(r)]
+        if extra:
+            hits.extend(r for r in extra if self.rect.colliderect(r))
         for tile in hits:
             if axis == "x":
                 if self.velocity.x > 0:
@@ -152,6 +154,14 @@ class Player(pygame.sprite.Sprite):
                 self.position.y = self.rect.y
                 self.velocity.y = 0
 
+    def _transformed_frame(self, sprite: pygame.Surface, flip_x: bool = False) -> pygame.Surface:
+        """Scaled and optionally mirrored animation frame (shared, from the frame cache)."""
+        size = None
+        if self._scale_factor and self._scale_factor != 1.0:
+            w, h = sprite.get_size()
+            size = (int(w * self._scale_factor), int(h * self._scale_factor))
+        return get_transformed_frame(sprite, size, flip_x=flip_x)
+
     def _update_sprite(self, dt: float = 0.016) -> None:
         """Update sprite based on current state and animate frames."""
         state = "idle"
@@ -172,26 +182,27 @@ class Player(pygame.sprite.Sprite):
         # Update animation frame
         self.anim_controller.update(dt)
         
-        # Get current frame and scale if needed
+        # Get current frame, scaled if needed and flipped based on facing direction
         sprite = self.anim_controller.get_frame()
         if sprite:
-            if self._scale_factor and self._scale_factor != 1.0:
-                w, h = sprite.get_size()
-                sprite = pygame.transform.scale(sprite, (int(w * self._scale_factor), int(h * self._scale_factor)))
-            self._base_image = sprite
+            self.image = self._transformed_frame(sprite, self.facing < 0)
         else:
             # Fallback if animation failed
-            self._base_image = pygame.Surface((32, 48))
-            self._base_image.fill(S.BLUE)
-        
-        # Flip sprite based on facing direction
-        self.image = pygame.transform.flip(self._base_image, self.facing < 0, False)
+            fallback = pygame.Surface((32, 48))
+            fallback.fill(S.BLUE)
+            self.image = pygame.transform.flip(fallback, self.facing < 0, False)
         # Keep rect size consistent
         old_center = self.rect.center
         self.rect = self.image.get_rect()
         self.rect.center = old_center
     
-    def update(self, keys: pygame.key.ScancodeWrapper, solids: list[pygame.Rect] | None = None, moving_platforms: list | None = None) -> None:
+    def update(self, keys: pygame.key.ScancodeWrapper, solids=None, moving_platforms: list | None = None) -> None:
+        """Move the player and resolve collisions.
+
+        solids is either a list of solid rects or a Level, which is queried
+        through its tile index. When a Level is given, moving platform rects
+        are collided as well (a plain list is expected to include them).
+        """
         self.handle_input(keys)
         self.apply_gravity()
         self.apply_friction()
@@ -219,18 +230,21 @@ class Player(pygame.sprite.Sprite):
 
         # Integrate with axis separation and resolve collisions if solids provided
         self.on_ground = False
+        platform_rects = None
+        if moving_platforms and hasattr(solids, "query_solids"):
+            platform_rects = [platform.rect for platform in moving_platforms]
 
         # Move X
         self.position.x += self.velocity.x
         self.rect.x = round(self.position.x)
         if solids:
-            self._collide_axis(solids, "x")
+            self._collide_axis(solids, "x", platform_rects)
 
         # Move Y
         self.position.y += self.velocity.y
         self.rect.y = round(self.position.y)
         if solids:
-            self._collide_axis(solids, "y")
+            self._collide_axis(solids, "y", platform_rects)
         else:
             # Fallback: simple bottom-of-screen floor
             ground_y = S.HEIGHT - 32
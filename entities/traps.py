@@ -4,6 +4,32 @@ from __future__ import annotations
 import pygame
 
 import settings as S
+from utils.image_registry import get_shared_image
+
+
+def _draw_spikes(width: int, height: int) -> pygame.Surface:
+    image = pygame.Surface((width, height), pygame.SRCALPHA)
+    # Draw triangular spikes
+    spike_count = width // 10
+    for i in range(spike_count):
+        spike_x = i * 10
+        points = [
+            (spike_x, height),
+            (spike_x + 5, 0),
+            (spike_x + 10, height)
+        ]
+        pygame.draw.polygon(image, (150, 150, 150), points)
+        pygame.draw.polygon(image, (200, 50, 50), points, 1)
+    return image
+
+
+def _draw_lava(width: int, height: int) -> pygame.Surface:
+    image = pygame.Surface((width, height), pygame.SRCALPHA)
+    # Base lava color
+    image.fill((200, 50, 0))
+    # Add simple border
+    pygame.draw.rect(image, (255, 100, 0), (0, 0, width, height), 2)
+    return image
 
 
 class Spike(pygame.sprite.Sprite):
@@ -14,19 +40,8 @@ class Spike(pygame.sprite.Sprite):
         self.width = width
         self.height = height
         
-        # Create spike sprite
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        # Draw triangular spikes
-        spike_count = width // 10
-        for i in range(spike_count):
-            spike_x = i * 10
-            points = [
-                (spike_x, height),
-                (spike_x + 5, 0),
-                (spike_x + 10, height)
-            ]
-            pygame.draw.polygon(self.image, (150, 150, 150), points)
-            pygame.draw.polygon(self.image, (200, 50, 50), points, 1)
+        # Spike sprite, shared by all spikes of this size
+        self.image = get_shared_image("spikes", _draw_spikes, width, height)
         
         self.rect = self.image.get_rect(topleft=(x, y))
         self.damage = 1
@@ -62,12 +77,8 @@ class Lava(pygame.sprite.Sprite):
         self.width = width
         self.height = height
         
-        # Create lava sprite
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        # Base lava color
-        self.image.fill((200, 50, 0))
-        # Add simple border
-        pygame.draw.rect(self.image, (255, 100, 0), (0, 0, width, height), 2)
+        # Lava sprite, shared by all lava pits of this size
+        self.image = get_shared_image("lava", _draw_lava, width, height)
         
         self.rect = self.image.get_rect(topleft=(x, y))
         self.damage = 1
@@ -7,6 +7,35 @@ import pygame
 
 from entities.weapon import Shotgun, Laser, Rocket
 import settings as S
+from utils.image_registry import get_shared_image
+
+
+def _draw_weapon_pickup(weapon_type: str) -> pygame.Surface:
+    # Create weapon pickup sprite based on type
+    image = pygame.Surface((28, 28), pygame.SRCALPHA)
+    
+    if weapon_type == "shotgun":
+        # Bitcoin orange for Mining Rig
+        pygame.draw.rect(image, S.BITCOIN_ORANGE, (4, 4, 20, 20))
+        pygame.draw.rect(image, S.BITCOIN_GOLD, (4, 4, 20, 20), 2)
+        # Draw mining rig (box with lines)
+        pygame.draw.rect(image, S.BITCOIN_DARK, (6, 6, 16, 16))
+        pygame.draw.line(image, S.BITCOIN_GOLD, (8, 10), (18, 10), 1)
+        pygame.draw.line(image, S.BITCOIN_GOLD, (8, 14), (18, 14), 1)
+    elif weapon_type == "laser":
+        # Cyan/blue for Lightning Network
+        pygame.draw.rect(image, (50, 200, 255), (4, 4, 20, 20))
+        pygame.draw.rect(image, (100, 240, 255), (4, 4, 20, 20), 2)
+        # Draw lightning bolt
+        pygame.draw.polygon(image, (255, 255, 255), [(10, 6), (14, 12), (10, 12), (14, 18)])
+    elif weapon_type == "rocket":
+        # Bitcoin orange/red for ASIC Miner
+        pygame.draw.rect(image, S.BITCOIN_ORANGE, (4, 4, 20, 20))
+        pygame.draw.rect(image, S.BITCOIN_GOLD, (4, 4, 20, 20), 2)
+        # Draw ASIC chip shape
+        pygame.draw.rect(image, S.BITCOIN_DARK, (6, 6, 16, 16))
+        pygame.draw.circle(image, S.BITCOIN_GOLD, (14, 14), 3)
+    return image
 
 
 class WeaponPickup(pygame.sprite.Sprite):
@@ -16,30 +45,7 @@ class WeaponPickup(pygame.sprite.Sprite):
         super().__init__()
         self.weapon_type = weapon_type  # "shotgun", "laser", "rocket"
         
-        # Create weapon pickup sprite based on type
-        self.image = pygame.Surface((28, 28), pygame.SRCALPHA)
-        
-        if weapon_type == "shotgun":
-            # Bitcoin orange for Mining Rig
-            pygame.draw.rect(self.image, S.BITCOIN_ORANGE, (4, 4, 20, 20))
-            pygame.draw.rect(self.image, S.BITCOIN_GOLD, (4, 4, 20, 20), 2)
-            # Draw mining rig (box with lines)
-            pygame.draw.rect(self.image, S.BITCOIN_DARK, (6, 6, 16, 16))
-            pygame.draw.line(self.image, S.BITCOIN_GOLD, (8, 10), (18, 10), 1)
-            pygame.draw.line(self.image, S.BITCOIN_GOLD, (8, 14), (18, 14), 1)
-        elif weapon_type == "laser":
-            # Cyan/blue for Lightning Network
-            pygame.draw.rect(self.image, (50, 200, 255), (4, 4, 20, 20))
-            pygame.draw.rect(self.image, (100, 240, 255), (4, 4, 20, 20), 2)
-            # Draw lightning bolt
-            pygame.draw.polygon(self.image, (255, 255, 255), [(10, 6), (14, 12), (10, 12), (14, 18)])
-        elif weapon_type == "rocket":
-            # Bitcoin orange/red for ASIC Miner
-            pygame.draw.rect(self.image, S.BITCOIN_ORANGE, (4, 4, 20, 20))
-            pygame.draw.rect(self.image, S.BITCOIN_GOLD, (4, 4, 20, 20), 2)
-            # Draw ASIC chip shape
-            pygame.draw.rect(self.image, S.BITCOIN_DARK, (6, 6, 16, 16))
-            pygame.draw.circle(self.image, S.BITCOIN_GOLD, (14, 14), 3)
+        self.image = get_shared_image("weapon_pickup", _draw_weapon_pickup, weapon_type)
         
         self.rect = self.image.get_rect(center=(x, y))
         
@@ -4,230 +4,488 @@ import csv
 from pathlib import Path
 from typing import List, Tuple
 
+import numpy as np
 import pygame
 
 import settings as S
+from levels import level_cache
 from utils.tileset import Tileset, find_tileset_in_folder
 
 
 TILE_SIZE = 30  # chosen to evenly divide 960x540 (32x18 grid)
+CHUNK_TILES = 16  # Foreground is baked into CHUNK_TILES x CHUNK_TILES surfaces
+BACKGROUND_TILE_WIDTH = 512  # Width of the repeating parallax textures
+
+
+def _as_grid_array(grid) -> np.ndarray:
+    """Convert rows of tile values into a 2D uint8 (or uint16) array.
+
+    Ragged rows are padded with empty cells.
+    """
+    if isinstance(grid, np.ndarray) and grid.ndim == 2:
+        values = grid
+    else:
+        rows = [list(row) for row in grid]
+        width = max((len(row) for row in rows), default=0)
+        values = np.zeros((len(rows), width), dtype=np.int64)
+        for y, row in enumerate(rows):
+            values[y, :len(row)] = row
+    if values.size and (values.min() < 0 or values.max() > 0xFFFF):
+        raise ValueError("Tile values must be in the range 0..65535")
+    dtype = np.uint8 if not values.size or values.max() < 0x100 else np.uint16
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def _draw_wrapped_circle(surface: pygame.Surface, color, center: tuple[int, int], radius: int, width: int) -> None:
+    """Draw a circle outline on a repeating texture, wrapping across its edges."""
+    tex_w, tex_h = surface.get_size()
+    for dx in (-tex_w, 0, tex_w):
+        for dy in (-tex_h, 0, tex_h):
+            pygame.draw.circle(surface, color, (center[0] + dx, center[1] + dy), radius, width)
+
+
+def _mesh_solids(mask: np.ndarray, first_col: int = 0) -> List[pygame.Rect]:
+    """Greedy-mesh a solid mask: merge each row into runs, then stack runs
+    with identical spans from consecutive rows into one taller rect.
+
+    first_col is the level column of mask[:, 0], for meshing a slice.
+    """
+    rects: List[pygame.Rect] = []
+    # Run boundaries are where the padded mask steps up (start) or down (end)
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    steps = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(steps == 1)
+    _, run_ends = np.nonzero(steps == -1)
+
+    open_runs: dict[tuple[int, int], pygame.Rect] = {}
+    runs: dict[tuple[int, int], pygame.Rect] = {}
+    current_row = -1
+    for y, start, end in zip(run_rows.tolist(), run_starts.tolist(), run_ends.tolist()):
+        if y != current_row:
+            # Runs only stack onto the row directly above
+            open_runs = runs if y == current_row + 1 else {}
+            runs = {}
+            current_row = y
+        rect = open_runs.get((start, end))
+        if rect is not None:
+            rect.height += TILE_SIZE
+        else:
+            rect = pygame.Rect((first_col + start) * TILE_SIZE, y * TILE_SIZE, (end - start) * TILE_SIZE, TILE_SIZE)
+            rects.append(rect)
+        runs[(start, end)] = rect
+    return rects
 
 
 class Level:
-    def __init__(self, grid: List[List[int]], tileset: Tileset | None = None) -> None:
-        self.grid = grid
+    def __init__(
+        self,
+        grid: List[List[int]] | np.ndarray,
+        tileset: Tileset | None = None,
+        merge_solids: bool = False,
+        merged_solid_rects: List[pygame.Rect] | None = None,
+        stream_radius: int | None = None,
+        stream_min_columns: int = 0,
+    ) -> None:
+        # 2D array of tile values; grid[y][x] indexing works as with nested lists
+        self.grid = _as_grid_array(grid)
+        # True where the cell is a solid tile
+        self.solid_mask: np.ndarray = self.grid == 1
         self.solid_rects: List[pygame.Rect] = []
+        # Contiguous solid tiles merged into maximal rectangles (row runs, then vertical merges).
+        # May be passed in precomputed, e.g. from the compiled level cache.
+        self.merged_solid_rects: List[pygame.Rect] = list(merged_solid_rects or [])
+        # When set, collision queries return merged rects instead of per-tile rects
+        self.merge_solids = merge_solids
+        # Collision index: _collider_ids[y, x] indexes _colliders, or is -1 for empty cells
+        self._collider_ids: np.ndarray = np.full(self.grid.shape, -1, dtype=np.int32)
+        self._colliders: List[pygame.Rect] | dict[int, pygame.Rect] = []
+        # Streaming mode: only column chunks (CHUNK_TILES columns wide) within
+        # stream_radius chunks of the camera keep colliders, baked tiles and
+        # entities; see update_stream(). solid_rects stays empty in this mode.
+        # Levels narrower than stream_min_columns are always loaded whole.
+        self.stream_radius = stream_radius if self.grid.shape[1] >= stream_min_columns else None
+        self._resident_columns: set[int] = set()
+        self._column_colliders: dict[int, List[int]] = {}
+        self._next_collider_id = 0
+        # Sprites parked while their column is unloaded: column -> [(sprite, groups)]
+        self._parked: dict[int, list[tuple[pygame.sprite.Sprite, list]]] = {}
         self.tileset = tileset
         self.background_surface = None
         self.background_far = None  # Far background layer (moves slowest)
         self.background_mid = None  # Mid background layer (moves medium)
         self.tile_size = TILE_SIZE
         # Calculate level dimensions
-        self.height = len(grid) if grid else 0
-        self.width = len(grid[0]) if grid and grid[0] else 0
+        self.height, self.width = self.grid.shape
+        # Pre-rendered foreground chunks keyed by (chunk_x, chunk_y); empty chunks are omitted
+        self._chunks: dict[tuple[int, int], pygame.Surface] = {}
         self._build_cache()
         self._build_background()
+        self._build_chunks()
 
     @staticmethod
-    def from_csv(path: str | Path, tileset_path: str | Path | None = None) -> "Level":
+    def from_csv(
+        path: str | Path,
+        tileset_path: str | Path | None = None,
+        merge_solids: bool = False,
+        stream_radius: int | None = None,
+        stream_min_columns: int = 0,
+    ) -> "Level":
+        # Use the tileset folder if provided, or auto-detect from assets/tiles
+        tiles_dir = Path(tileset_path) if tileset_path else Path("assets/tiles")
+        csv_bytes = Path(path).read_bytes()
+        key = level_cache.source_key(csv_bytes, tiles_dir)
+
+        # Fast path: grid, colliders and tileset choice from the compiled cache
+        compiled = level_cache.load(path, key, TILE_SIZE)
+        if compiled is not None:
+            tileset = None
+            if compiled.tileset_path:
+                tileset = Tileset(compiled.tileset_path, TILE_SIZE, TILE_SIZE)
+            return Level(compiled.grid, tileset, merge_solids=merge_solids,
+                         merged_solid_rects=compiled.merged_rects, stream_radius=stream_radius,
+                         stream_min_columns=stream_min_columns)
+
         rows: List[List[int]] = []
-        with open(path, newline="") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if not row:
-                    continue
-                rows.append([int(cell) for cell in row])
-        
-        # Load tileset if path provided, or auto-detect
+        reader = csv.reader(csv_bytes.decode("utf-8").splitlines())
+        for row in reader:
+            if not row:
+                continue
+            rows.append([int(cell) for cell in row])
+
         tileset = None
-        if tileset_path:
-            tileset_img = find_tileset_in_folder(Path(tileset_path))
-            if tileset_img:
-                tileset = Tileset(tileset_img, TILE_SIZE, TILE_SIZE)
-        else:
-            # Auto-detect from assets/tiles
-            tiles_dir = Path("assets/tiles")
-            tileset_img = find_tileset_in_folder(tiles_dir)
-            if tileset_img:
-                tileset = Tileset(tileset_img, TILE_SIZE, TILE_SIZE)
-        
-        return Level(rows, tileset)
+        tileset_img = find_tileset_in_folder(tiles_dir)
+        if tileset_img:
+            tileset = Tileset(tileset_img, TILE_SIZE, TILE_SIZE)
+
+        level = Level(rows, tileset, merge_solids=merge_solids, stream_radius=stream_radius,
+                      stream_min_columns=stream_min_columns)
+        # Streamed levels mesh colliders per column, so mesh the whole grid for the cache
+        merged_rects = level.merged_solid_rects if level.stream_radius is None else _mesh_solids(level.solid_mask)
+        level_cache.save(path, key, level.grid, merged_rects, tileset_img, TILE_SIZE)
+        return level
 
     def _build_cache(self) -> None:
-        self.solid_rects.clear()
-        for y, row in enumerate(self.grid):
-            for x, cell in enumerate(row):
-                if cell == 1:
-                    rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    self.solid_rects.append(rect)
+        self._collider_ids.fill(-1)
+        if self.stream_radius is not None:
+            # Colliders are built per column chunk as they stream in
+            self._colliders = {}
+            return
+        ys, xs = np.nonzero(self.solid_mask)
+        self.solid_rects = [
+            pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            for y, x in zip(ys.tolist(), xs.tolist())
+        ]
+        if not self.merged_solid_rects:
+            self._build_merged_rects()
+
+        if self.merge_solids:
+            self._colliders = self.merged_solid_rects
+            for i, rect in enumerate(self._colliders):
+                self._collider_ids[rect.top // TILE_SIZE:rect.bottom // TILE_SIZE,
+                                   rect.left // TILE_SIZE:rect.right // TILE_SIZE] = i
+        else:
+            # nonzero() is row-major, so ids follow the solid_rects order
+            self._colliders = self.solid_rects
+            self._collider_ids[self.solid_mask] = np.arange(len(self.solid_rects), dtype=np.int32)
+
+    def _build_merged_rects(self) -> None:
+        self.merged_solid_rects = _mesh_solids(self.solid_mask)
+
+    def query_solids(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Return the solid colliders overlapping rect, by direct grid lookup.
+
+        Cost depends only on how many cells rect covers, not on level size.
+        Results are in row-major order; with merge_solids each merged rect
+        is returned once.
+        """
+        first_col = max(0, rect.left // TILE_SIZE)
+        first_row = max(0, rect.top // TILE_SIZE)
+        end_col = min(self.width, (rect.right - 1) // TILE_SIZE + 1)
+        end_row = min(self.height, (rect.bottom - 1) // TILE_SIZE + 1)
+        if rect.width <= 0 or rect.height <= 0 or end_col <= first_col or end_row <= first_row:
+            return []
+        ids = self._collider_ids[first_row:end_row, first_col:end_col]
+        ids = ids[ids >= 0].tolist()
+        if self.merge_solids and len(ids) > 1:
+            ids = list(dict.fromkeys(ids))
+        colliders = self._colliders
+        return [colliders[i] for i in ids]
+
+    def minimap_mask(self, width: int, height: int) -> np.ndarray:
+        """Solid mask resampled to width x height cells (nearest neighbour), shape (height, width)."""
+        if not self.width or not self.height:
+            return np.zeros((height, width), dtype=bool)
+        rows = np.arange(height) * self.height // height
+        cols = np.arange(width) * self.width // width
+        return self.solid_mask[np.ix_(rows, cols)]
     
+    def update_stream(self, view_rect: pygame.Rect, *groups: pygame.sprite.Group, keep=()) -> None:
+        """Load column chunks near the view and evict the rest (streaming mode only).
+
+        Columns within stream_radius chunks of view_rect, or of any sprite in
+        keep, are resident. Sprites from groups that stand in a column that
+        is not resident are removed from all their groups and re-added when
+        the column loads again.
+        """
+        if self.stream_radius is None or not self.width:
+            return
+        chunk_px = CHUNK_TILES * TILE_SIZE
+        column_count = (self.width - 1) // CHUNK_TILES + 1
+        area = view_rect.unionall([sprite.rect for sprite in keep]) if keep else view_rect
+        first = max(0, area.left // chunk_px - self.stream_radius)
+        end = min(column_count, (area.right - 1) // chunk_px + 1 + self.stream_radius)
+        wanted = set(range(first, end))
+
+        for column in self._resident_columns - wanted:
+            self._evict_column(column)
+        for column in sorted(wanted - self._resident_columns):
+            self._load_column(column)
+
+        for group in groups:
+            for sprite in group.sprites():
+                if sprite in keep:
+                    continue
+                column = min(max(sprite.rect.centerx // chunk_px, 0), column_count - 1)
+                if column not in self._resident_columns:
+                    self._parked.setdefault(column, []).append((sprite, sprite.groups()))
+                    sprite.kill()
+
+    def parked_in(self, group: pygame.sprite.Group) -> List[pygame.sprite.Sprite]:
+        """Sprites of group that are parked in unloaded columns."""
+        return [sprite for parked in self._parked.values() for sprite, groups in parked if group in groups]
+
+    def _load_column(self, column: int) -> None:
+        first_col = column * CHUNK_TILES
+        mask = self.solid_mask[:, first_col:first_col + CHUNK_TILES]
+        if self.merge_solids:
+            rects = _mesh_solids(mask, first_col)
+        else:
+            ys, xs = np.nonzero(mask)
+            rects = [
+                pygame.Rect((first_col + x) * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                for y, x in zip(ys.tolist(), xs.tolist())
+            ]
+        ids = []
+        for rect in rects:
+            collider_id = self._next_collider_id
+            self._next_collider_id += 1
+            self._colliders[collider_id] = rect
+            self._collider_ids[rect.top // TILE_SIZE:rect.bottom // TILE_SIZE,
+                               rect.left // TILE_SIZE:rect.right // TILE_SIZE] = collider_id
+            ids.append(collider_id)
+        self._column_colliders[column] = ids
+
+        block = self.grid[:, first_col:first_col + CHUNK_TILES]
+        occupied = block > 0 if self.tileset else block == 1
+        for chunk_y in np.unique(np.nonzero(occupied)[0] // CHUNK_TILES).tolist():
+            self._chunks[(column, chunk_y)] = self._bake_chunk(column, chunk_y)
+
+        self._resident_columns.add(column)
+        for sprite, groups in self._parked.pop(column, []):
+            sprite.add(*groups)
+
+    def _evict_column(self, column: int) -> None:
+        first_col = column * CHUNK_TILES
+        self._collider_ids[:, first_col:first_col + CHUNK_TILES] = -1
+        for collider_id in self._column_colliders.pop(column, []):
+            del self._colliders[collider_id]
+        for key in [key for key in self._chunks if key[0] == column]:
+            del self._chunks[key]
+        self._resident_columns.discard(column)
+
     def _build_background(self) -> None:
-        """Create multiple background layers with parallax effect."""
-        # Calculate level dimensions
-        if not self.grid:
+        """Create the parallax background layers as small repeating textures.
+
+        Each layer is BACKGROUND_TILE_WIDTH wide and as tall as the level. It
+        wraps horizontally as the camera scrolls, so memory does not grow with
+        the level width.
+        """
+        if not self.width or not self.height:
             return
-        level_width = len(self.grid[0]) * TILE_SIZE
-        level_height = len(self.grid) * TILE_SIZE
+        tex_w = BACKGROUND_TILE_WIDTH
+        tex_h = self.height * TILE_SIZE
         
         import random
         random.seed(42)  # Consistent pattern
         
         # Far background layer (moves slowest - 10% parallax)
-        self.background_far = pygame.Surface((level_width, level_height))
+        self.background_far = pygame.Surface((tex_w, tex_h))
         # Darkest layer - sky/void
-        for y in range(level_height):
-            ratio = y / level_height
+        for y in range(tex_h):
+            ratio = y / tex_h
             r = int(10 + ratio * 5)  # 10 to 15
             g = int(10 + ratio * 5)
             b = int(15 + ratio * 5)
-            pygame.draw.line(self.background_far, (r, g, b), (0, y), (level_width, y))
+            pygame.draw.line(self.background_far, (r, g, b), (0, y), (tex_w, y))
         
         # Add distant stars/particles
-        for _ in range(30):
-            x = random.randint(0, level_width)
-            y = random.randint(0, level_height)
+        for _ in range(16):
+            x = random.randint(0, tex_w - 1)
+            y = random.randint(0, tex_h - 1)
             brightness = random.randint(20, 40)
             pygame.draw.circle(self.background_far, (brightness, brightness, brightness), (x, y), 1)
         
         # Mid background layer (moves medium - 20% parallax)
-        self.background_mid = pygame.Surface((level_width, level_height), pygame.SRCALPHA)
+        self.background_mid = pygame.Surface((tex_w, tex_h))
         # Medium dark layer with patterns
-        for y in range(level_height):
-            ratio = y / level_height
+        for y in range(tex_h):
+            ratio = y / tex_h
             r = int(12 + ratio * 8)  # 12 to 20
             g = int(12 + ratio * 8)
             b = int(18 + ratio * 8)
-            pygame.draw.line(self.background_mid, (r, g, b), (0, y), (level_width, y))
+            pygame.draw.line(self.background_mid, (r, g, b), (0, y), (tex_w, y))
         
         # Add Bitcoin-themed patterns (circular patterns like coins)
-        for _ in range(15):
-            x = random.randint(0, level_width)
-            y = random.randint(0, level_height)
+        for _ in range(8):
+            x = random.randint(0, tex_w - 1)
+            y = random.randint(0, tex_h - 1)
             radius = random.randint(40, 100)
-            # Subtle circles with alpha
-            color = (25, 25, 30, 40)
-            pygame.draw.circle(self.background_mid, color[:3], (x, y), radius, 2)
+            _draw_wrapped_circle(self.background_mid, (25, 25, 30), (x, y), radius, 2)
         
         # Near background layer (moves faster - 30% parallax) - main background
-        self.background_surface = pygame.Surface((level_width, level_height))
+        self.background_surface = pygame.Surface((tex_w, tex_h))
         # Base gradient from dark gray to darker gray
-        for y in range(level_height):
-            # Vertical gradient
-            ratio = y / level_height
+        for y in range(tex_h):
+            ratio = y / tex_h
             r = int(15 + ratio * 10)  # 15 to 25
             g = int(15 + ratio * 10)
             b = int(20 + ratio * 10)
-            pygame.draw.line(self.background_surface, (r, g, b), (0, y), (level_width, y))
+            pygame.draw.line(self.background_surface, (r, g, b), (0, y), (tex_w, y))
         
         # Add more Bitcoin-themed patterns
-        for _ in range(20):
-            x = random.randint(0, level_width)
-            y = random.randint(0, level_height)
+        for _ in range(10):
+            x = random.randint(0, tex_w - 1)
+            y = random.randint(0, tex_h - 1)
             radius = random.randint(30, 80)
-            # Subtle circles
-            color = (25, 25, 30, 30)
-            pygame.draw.circle(self.background_surface, color[:3], (x, y), radius, 1)
+            _draw_wrapped_circle(self.background_surface, (25, 25, 30), (x, y), radius, 1)
         
         # Add some horizontal lines for depth
         for i in range(5):
-            y_pos = (i + 1) * (level_height // 6)
-            pygame.draw.line(self.background_surface, (20, 20, 25), (0, y_pos), (level_width, y_pos), 1)
+            y_pos = (i + 1) * (tex_h // 6)
+            pygame.draw.line(self.background_surface, (20, 20, 25), (0, y_pos), (tex_w, y_pos), 1)
+
+    @staticmethod
+    def _blit_repeating(
+        surface: pygame.Surface,
+        texture: pygame.Surface,
+        scroll: tuple[int, int],
+        area: pygame.Rect,
+    ) -> None:
+        """Tile texture across area, shifted by scroll.
+
+        The texture wraps horizontally; vertically the scroll is clamped so
+        the texture always covers the area, as the full-level layers did.
+        """
+        tex_w, tex_h = texture.get_size()
+        src_y = max(0, min(scroll[1], tex_h - area.height))
+        source = pygame.Rect(0, src_y, tex_w, min(area.height, tex_h - src_y))
+        previous_clip = surface.get_clip()
+        surface.set_clip(area.clip(previous_clip))
+        start_x = area.left - scroll[0] % tex_w
+        surface.blits(
+            [(texture, (x, area.top), source) for x in range(start_x, area.right, tex_w)],
+            doreturn=False,
+        )
+        surface.set_clip(previous_clip)
 
-    def draw(self, surface: pygame.Surface, camera_offset: tuple[int, int] = (0, 0)) -> None:
-        """Draw the level with optional camera offset and multi-layer parallax."""
+    def _find_visible_tile_index(self) -> int:
+        """Pick the tileset tile used for plain solid cells (skips transparent tiles)."""
+        # Use the first tile if any of its sample points is visible, otherwise
+        # the first tile from index 2 on with at least 2 mostly opaque samples
+        if self.tileset.get_tile_info(0).opaque_samples() > 0:
+            return 0
+        for index in range(2, min(100, self.tileset.get_tile_count())):
+            if self.tileset.get_tile_info(index).opaque_samples(100) >= 2:
+                return index
+        return 2  # Default to 2
+
+    def _build_chunks(self) -> None:
+        """Bake the static foreground into CHUNK_TILES x CHUNK_TILES surfaces.
+
+        Tiles are scaled to TILE_SIZE once here instead of on every draw, so
+        drawing costs one blit per visible chunk rather than one per cell.
+        """
+        self._chunks.clear()
+        self._visible_tile_index = self._find_visible_tile_index() if self.tileset else 0
+        if self.stream_radius is not None:
+            # Chunks are baked per column as they stream in
+            return
+        # Without a tileset only plain solid cells are drawn
+        occupied = self.grid > 0 if self.tileset else self.solid_mask
+        ys, xs = np.nonzero(occupied)
+        for key in set(zip((xs // CHUNK_TILES).tolist(), (ys // CHUNK_TILES).tolist())):
+            self._chunks[key] = self._bake_chunk(*key)
+
+    def _bake_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        chunk_px = CHUNK_TILES * TILE_SIZE
+        chunk = pygame.Surface((chunk_px, chunk_px), pygame.SRCALPHA)
+        first_row, first_col = chunk_y * CHUNK_TILES, chunk_x * CHUNK_TILES
+        block = self.grid[first_row:first_row + CHUNK_TILES, first_col:first_col + CHUNK_TILES]
+
+        if not self.tileset:
+            # Fallback: simple colored rectangles, written as one alpha mask per chunk
+            chunk.fill((30, 30, 30, 0))
+            solid = np.repeat(np.repeat(block.T == 1, TILE_SIZE, axis=0), TILE_SIZE, axis=1)
+            alpha = pygame.surfarray.pixels_alpha(chunk)
+            alpha[:solid.shape[0], :solid.shape[1]] = solid * 255
+            del alpha  # Unlock the surface
+            return chunk
+
+        ys, xs = np.nonzero(block)
+        for y, x, cell in zip(ys.tolist(), xs.tolist(), block[ys, xs].tolist()):
+            # Map cell value to tile index
+            # cell=1 -> use first visible tile
+            # cell=2 -> tile index 1, etc.
+            tile_index = max(0, cell - 1)
+            if tile_index == 0:
+                tile_index = self._visible_tile_index
+            # Tileset tiles are already scaled to TILE_SIZE
+            chunk.blit(self.tileset.get_tile(tile_index), (x * TILE_SIZE, y * TILE_SIZE))
+        return chunk
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        camera_offset: tuple[int, int] = (0, 0),
+        visible_tiles: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        """Draw the level with optional camera offset and multi-layer parallax.
+
+        visible_tiles is the (first_col, first_row, end_col, end_row) range from
+        Camera.get_visible_tile_range(); without it the range is derived from
+        the offset and the surface size.
+        """
         offset_x, offset_y = camera_offset
         screen_w, screen_h = surface.get_size()
         
-        # Draw far background layer (moves slowest - 10% parallax)
-        if self.background_far:
-            parallax_far_x = int(offset_x * 0.1)
-            parallax_far_y = int(offset_y * 0.1)
-            bg_w, bg_h = self.background_far.get_size()
-            src_x = max(0, min(parallax_far_x, bg_w - screen_w))
-            src_y = max(0, min(parallax_far_y, bg_h - screen_h))
-            src_rect = pygame.Rect(src_x, src_y, min(screen_w, bg_w - src_x), min(screen_h, bg_h - src_y))
-            if src_rect.width > 0 and src_rect.height > 0:
-                surface.blit(self.background_far, (0, 0), src_rect)
-        
-        # Draw mid background layer (moves medium - 20% parallax)
-        if self.background_mid:
-            parallax_mid_x = int(offset_x * 0.2)
-            parallax_mid_y = int(offset_y * 0.2)
-            bg_w, bg_h = self.background_mid.get_size()
-            src_x = max(0, min(parallax_mid_x, bg_w - screen_w))
-            src_y = max(0, min(parallax_mid_y, bg_h - screen_h))
-            src_rect = pygame.Rect(src_x, src_y, min(screen_w, bg_w - src_x), min(screen_h, bg_h - src_y))
-            if src_rect.width > 0 and src_rect.height > 0:
-                surface.blit(self.background_mid, (0, 0), src_rect)
+        # Background layers cover the level's extent on screen; each wraps
+        # horizontally and scrolls on both axes at its own parallax rate
+        background_area = pygame.Rect(0, 0, min(screen_w, self.width * TILE_SIZE), min(screen_h, self.height * TILE_SIZE))
+        for layer, parallax in (
+            (self.background_far, 0.1),  # Far layer (moves slowest - 10% parallax)
+            (self.background_mid, 0.2),  # Mid layer (moves medium - 20% parallax)
+            (self.background_surface, 0.3),  # Near layer (moves faster - 30% parallax)
+        ):
+            if layer:
+                self._blit_repeating(
+                    surface, layer, (int(-offset_x * parallax), int(-offset_y * parallax)), background_area
+                )
         
-        # Draw near background layer (moves faster - 30% parallax)
-        if self.background_surface:
-            parallax_offset_x = int(offset_x * 0.3)  # 30% of camera movement
-            parallax_offset_y = int(offset_y * 0.3)
-            bg_w, bg_h = self.background_surface.get_size()
-            src_x = max(0, min(parallax_offset_x, bg_w - screen_w))
-            src_y = max(0, min(parallax_offset_y, bg_h - screen_h))
-            src_rect = pygame.Rect(src_x, src_y, min(screen_w, bg_w - src_x), min(screen_h, bg_h - src_y))
-            if src_rect.width > 0 and src_rect.height > 0:
-                surface.blit(self.background_surface, (0, 0), src_rect)
-        
-        # Draw foreground tiles
-        if self.tileset:
-            # Cache the first visible tile index to avoid recalculating every time
-            if not hasattr(self, '_cached_visible_tile_index'):
-                # Find first visible tile (skip transparent ones)
-                test_tile = self.tileset.get_tile(0)
-                test_w, test_h = test_tile.get_width(), test_tile.get_height()
-                is_transparent = True
-                for tx in [test_w//4, test_w//2, 3*test_w//4]:
-                    for ty in [test_h//4, test_h//2, 3*test_h//4]:
-                        if test_tile.get_at((tx, ty))[3] > 0:
-                            is_transparent = False
-                            break
-                    if not is_transparent:
-                        break
-                
-                if is_transparent:
-                    # Find first tile with substantial visible content
-                    self._cached_visible_tile_index = 2  # Default to 2
-                    for i in range(2, min(100, self.tileset.get_tile_count())):
-                        candidate = self.tileset.get_tile(i)
-                        cand_w, cand_h = candidate.get_width(), candidate.get_height()
-                        opaque_count = 0
-                        for tx in [cand_w//4, cand_w//2, 3*cand_w//4]:
-                            for ty in [cand_h//4, cand_h//2, 3*cand_h//4]:
-                                if candidate.get_at((tx, ty))[3] > 100:
-                                    opaque_count += 1
-                        if opaque_count >= 2:
-                            self._cached_visible_tile_index = i
-                            break
-                else:
-                    self._cached_visible_tile_index = 0
-            
-            # Draw tiles using tileset images
-            for y, row in enumerate(self.grid):
-                for x, cell in enumerate(row):
-                    if cell > 0:
-                        # Map cell value to tile index
-                        # cell=1 -> use first visible tile
-                        # cell=2 -> tile index 1, etc.
-                        tile_index = max(0, cell - 1)
-                        # If using tile 0, use cached visible tile instead
-                        if tile_index == 0:
-                            tile_index = self._cached_visible_tile_index
-                        
-                        tile_img = self.tileset.get_tile(tile_index)
-                        dest = (x * TILE_SIZE + offset_x, y * TILE_SIZE + offset_y)
-                        # Always scale tile to match game's TILE_SIZE
-                        # (tileset may have different native size like 32x32)
-                        if tile_img.get_size() != (TILE_SIZE, TILE_SIZE):
-                            tile_img = pygame.transform.scale(tile_img, (TILE_SIZE, TILE_SIZE))
-                        surface.blit(tile_img, dest)
-        else:
-            # Fallback: simple colored rectangles
-            color = (30, 30, 30)
-            for rect in self.solid_rects:
-                offset_rect = rect.move(offset_x, offset_y)
-                pygame.draw.rect(surface, color, offset_rect)
-
-
+        # Draw foreground tiles from the pre-rendered chunks that intersect the screen
+        chunk_px = CHUNK_TILES * TILE_SIZE
+        if visible_tiles is None:
+            visible_tiles = (
+                -offset_x // TILE_SIZE,
+                -offset_y // TILE_SIZE,
+                (screen_w - offset_x - 1) // TILE_SIZE + 1,
+                (screen_h - offset_y - 1) // TILE_SIZE + 1,
+            )
+        first_col, first_row, end_col, end_row = visible_tiles
+        if end_col <= first_col or end_row <= first_row:
+            return
+        for cy in range(max(0, first_row // CHUNK_TILES), (end_row - 1) // CHUNK_TILES + 1):
+            for cx in range(max(0, first_col // CHUNK_TILES), (end_col - 1) // CHUNK_TILES + 1):
+                chunk = self._chunks.get((cx, cy))
+                if chunk is not None:
+                    surface.blit(chunk, (cx * chunk_px + offset_x, cy * chunk_px + offset_y))
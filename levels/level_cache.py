@@ -0,0 +1,121 @@
+"""Compiled level cache.
+
+Parsing a CSV level, meshing its colliders and scanning for a tileset is
+repeated on every load (including retries). The result is written once to
+a small binary file next to the level (levels/.cache/<name>.lvlc) and read
+back through mmap. The file is keyed on a hash of the CSV bytes and the
+tileset folder, so editing either invalidates it automatically.
+
+Layout (little-endian):
+    header    magic, version, width, height, cell size, rect count,
+              tileset path length, sha256 key
+    tileset   UTF-8 path of the chosen tileset image (empty for none)
+    rects     merged collision rects as 4 x uint16 tile units (x, y, w, h)
+    grid      width * height cells of `cell size` bytes, row-major
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pygame
+
+
+MAGIC = b"PXLV"
+VERSION = 1
+CACHE_DIR_NAME = ".cache"
+
+_HEADER = struct.Struct("<4sHHHBIH32s")
+_RECT = struct.Struct("<4H")
+_CELL_DTYPES = {1: np.dtype("<u1"), 2: np.dtype("<u2")}
+
+
+@dataclass
+class CompiledLevel:
+    """Level data restored from the cache, ready to hand to Level()."""
+    grid: np.ndarray
+    merged_rects: List[pygame.Rect]
+    tileset_path: Path | None
+
+
+def cache_path_for(csv_path: str | Path) -> Path:
+    """Where the compiled form of csv_path is stored."""
+    csv_path = Path(csv_path)
+    return csv_path.parent / CACHE_DIR_NAME / f"{csv_path.stem}.lvlc"
+
+
+def source_key(csv_bytes: bytes, tiles_dir: str | Path) -> bytes:
+    """Hash of everything the compiled level depends on."""
+    digest = hashlib.sha256(csv_bytes)
+    tiles_dir = Path(tiles_dir)
+    digest.update(str(tiles_dir).encode("utf-8"))
+    # The folder mtime changes when tileset images are added or removed
+    try:
+        digest.update(str(tiles_dir.stat().st_mtime_ns).encode("ascii"))
+    except OSError:
+        pass
+    return digest.digest()
+
+
+def load(csv_path: str | Path, key: bytes, tile_size: int) -> CompiledLevel | None:
+    """Return the cached level for csv_path, or None if missing or stale."""
+    path = cache_path_for(csv_path)
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _decode(data, key, tile_size)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _decode(data: mmap.mmap, key: bytes, tile_size: int) -> CompiledLevel | None:
+    magic, version, width, height, cell_size, rect_count, path_len, stored_key = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION or stored_key != key or cell_size not in _CELL_DTYPES:
+        return None
+    offset = _HEADER.size
+    tileset_name = bytes(data[offset:offset + path_len]).decode("utf-8")
+    offset += path_len
+
+    merged_rects = []
+    for x, y, w, h in _RECT.iter_unpack(data[offset:offset + rect_count * _RECT.size]):
+        merged_rects.append(pygame.Rect(x * tile_size, y * tile_size, w * tile_size, h * tile_size))
+    offset += rect_count * _RECT.size
+
+    if len(data) - offset < width * height * cell_size:
+        return None
+    # Copy out of the mapping so the file can be closed
+    cells = np.frombuffer(data, dtype=_CELL_DTYPES[cell_size], count=width * height, offset=offset)
+    grid = cells.reshape(height, width).astype(cells.dtype.newbyteorder("="))
+    return CompiledLevel(grid, merged_rects, Path(tileset_name) if tileset_name else None)
+
+
+def save(csv_path: str | Path, key: bytes, grid: np.ndarray, merged_rects: List[pygame.Rect],
+         tileset_path: str | Path | None, tile_size: int) -> bool:
+    """Write the compiled form of a level (grid is Level.grid). Returns False on failure."""
+    height, width = grid.shape
+    cell_size = grid.dtype.itemsize
+    if cell_size not in _CELL_DTYPES:
+        return False
+    cells = grid.astype(_CELL_DTYPES[cell_size]).tobytes()
+
+    tileset_name = str(tileset_path).encode("utf-8") if tileset_path else b""
+    path = cache_path_for(csv_path)
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        # Levels too large for the header or rect fields are simply not cached
+        parts = [_HEADER.pack(MAGIC, VERSION, width, height, cell_size, len(merged_rects), len(tileset_name), key),
+                 tileset_name]
+        for rect in merged_rects:
+            parts.append(_RECT.pack(rect.x // tile_size, rect.y // tile_size, rect.w // tile_size, rect.h // tile_size))
+        parts.append(cells)
+
+        path.parent.mkdir(exist_ok=True)
+        tmp_path.write_bytes(b"".join(parts))
+        tmp_path.replace(path)
+    except (OSError, struct.error):
+        return False
+    return True
@@ -17,12 +17,17 @@ from entities.collectibles import Coin, Key
 from entities.weapon_pickup import WeaponPickup
 from entities.weapon import Weapon, Pistol
 from ui.hud import HUD
-from ui.menus import draw_start_menu, draw_pause_menu, draw_animated_background, draw_level_select_menu, get_available_levels, draw_level_complete_menu, draw_game_over_menu, draw_about_menu
+from ui.menus import draw_start_menu, draw_pause_menu, draw_animated_background, draw_level_select_menu, get_available_levels, draw_level_complete_menu, draw_game_over_menu, draw_about_menu, get_start_title
+from ui.menu_layers import MenuLayers
 from ui.shop import draw_shop_menu
 from ui.sfx import load_sounds
-from ui.transitions import blur_and_dim, fade_overlay
+from ui.transitions import fade_overlay, make_backdrop
+from utils.animations import get_image_stats
 from utils.camera import Camera
-from utils.particles import ParticleSystem
+from utils.display import RenderTarget
+from utils.lighting import Lightmap
+from utils.particles import ParticleSystem, PRIORITY_HIGH
+from utils.render_queue import RenderQueue, LAYER_ACTORS, LAYER_BULLETS, LAYER_ITEMS, LAYER_PROPS
 from utils.save_system import get_save_data
 from utils.achievements import get_achievement_system
 from utils.difficulty import DifficultySettings
@@ -35,14 +40,29 @@ from utils.object_pool import BulletPool
 from utils.screenshot import save_screenshot
 
 
+# Overlay states drawn over a frozen copy of the last gameplay frame
+BACKDROP_STYLES = {
+    "paused": {"blur_scale": 0.2, "dim_alpha": 140},
+    "level_complete": {"dim_alpha": 140},
+    "game_over": {"dim_alpha": 140},
+}
+
+# Menu states drawn from a cached static layer, updating only the changed areas
+CACHED_MENUS = ("start", "about", "level_select", "paused", "level_complete", "game_over")
+
+
 def main() -> None:
     pygame.init()
     screen = pygame.display.set_mode((S.WIDTH, S.HEIGHT))
+    # The world is drawn into render_target.surface at the internal resolution
+    render_target = RenderTarget(screen.get_size())
+    world = render_target.surface
     pygame.display.set_caption(S.TITLE)
     clock = pygame.time.Clock()
 
     def new_game(level_path: str = "levels/level1.csv"):
-        lvl = Level.from_csv(level_path)
+        lvl = Level.from_csv(level_path, merge_solids=True, stream_radius=S.LEVEL_STREAM_RADIUS,
+                             stream_min_columns=S.LEVEL_STREAM_MIN_COLUMNS)
         # Set player starting position based on level
         if "level3" in level_path:
             # Level 3: Start on high platform (row 8, Y = 240)
@@ -252,6 +272,7 @@ def main() -> None:
             enms.add(Enemy(300, 100, left_bound=260, right_bound=420, speed=2.0))
             pkups.add(AmmoPickup(500, 100, ammo_amount=30))
         
+        hud.set_level(lvl)  # Bake the minimap
         grp = pygame.sprite.Group(ply, *enms.sprites(), *pkups.sprites(), *trps.sprites(), *platforms.sprites(), *collectibles.sprites(), *weapon_pickups.sprites(), *checkpoints.sprites())
         return lvl, ply, blts, enms, pkups, trps, platforms, collectibles, weapon_pickups, checkpoints, grp, secret_areas, bonus_rooms
 
@@ -265,8 +286,12 @@ def main() -> None:
     # Initialize bullet pool for performance
     bullet_pool = BulletPool(initial_size=30, max_size=200)
 
+    hud = HUD()
+
     # Initialize with default level
     level, player, bullets, enemies, pickups, traps, platforms, collectibles, weapon_pickups, checkpoints, all_sprites, secret_areas, bonus_rooms = new_game()
+    image_stats = get_image_stats()
+    print(f"🖼️ Converted {image_stats['converted']}/{image_stats['loaded']} loaded images to display format ({image_stats['rle']} RLE)")
     
     # Apply difficulty settings to player
     difficulty_settings.apply_to_player(player)
@@ -274,11 +299,12 @@ def main() -> None:
     # Apply difficulty to enemies
     for enemy in enemies:
         difficulty_settings.apply_to_enemy(enemy)
-    
-    hud = HUD()
-    camera = Camera()
+
+    camera = Camera(*world.get_size())
     camera.set_target(player)
     particles = ParticleSystem()
+    lightmap = Lightmap(world.get_size())
+    render_queue = RenderQueue()
     score = 0
     coins = save_data.get_coins()  # Load coins from save
     last_checkpoint = None  # Store last activated checkpoint
@@ -293,6 +319,9 @@ def main() -> None:
     level_start_time = pygame.time.get_ticks()
     achievement_notifications = []  # List of (text, timer) tuples
 
+    backdrop = None  # (state, surface) shown under overlay menus
+    menu_layers = MenuLayers()
+    dirty_rects = None  # Screen areas changed this frame, None for the whole window
     running = True
     hover_rects: dict[str, pygame.Rect] | None = None
     last_hover_key: str | None = None
@@ -300,6 +329,9 @@ def main() -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The window contents may be lost; repaint the menu in full
+                menu_layers.invalidate()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if state == "playing":
                     if player.shoot(bullets):
@@ -578,18 +610,20 @@ def main() -> None:
             # Track previous player state for dust particles
             was_on_ground = player.on_ground
             
+            # Keep level chunks (colliders, tiles, entities) loaded around the camera
+            level.update_stream(camera.get_view_rect(), all_sprites, collectibles, keep=(player,))
+
             # Update enemies with player and bullets for AI
             for enemy in enemies:
                 if isinstance(enemy, Boss):
-                    enemy.update(keys, level.solid_rects, player=player, bullets_group=bullets)
+                    enemy.update(keys, level, player=player, bullets_group=bullets)
                 else:
-                    enemy.update(keys, level.solid_rects, player=player, bullets_group=bullets)
+                    enemy.update(keys, level, player=player, bullets_group=bullets)
             # Update moving platforms first
             platforms.update()
             # Update player and other sprites
-            # Combine level solids with platform rects for collision
-            all_solids = level.solid_rects + [p.rect for p in platforms]
-            player.update(keys, all_solids, moving_platforms=list(platforms))
+            # The level's tile index is queried for collisions; platform rects are checked alongside it
+            player.update(keys, level, moving_platforms=list(platforms))
             pickups.update()  # Animate pickups (bobbing motion)
             collectibles.update()  # Animate collectibles
             weapon_pickups.update()  # Animate weapon pickups
@@ -598,6 +632,7 @@ def main() -> None:
             bullets.update()
             particles.update()  # Update particle system
             camera.update()  # Update camera to follow player
+            particles.set_view(camera.get_view_rect())  # Cull offscreen emitters
             
             # Create dust particles when player lands
             if player.on_ground and not was_on_ground:
@@ -656,23 +691,21 @@ def main() -> None:
                         sounds.play_hit()
                         # Enhanced impact particles
                         particles.create_impact(bullet.rect.centerx, bullet.rect.centery)
-                        particles.create_impact_sparks(bullet.rect.centerx, bullet.rect.centery, color=(255, 100, 100))
+                        particles.create_impact_sparks(bullet.rect.centerx, bullet.rect.centery, color=(255, 100, 100),
+                                                       priority=PRIORITY_HIGH)
                         bullet.kill()
             
             # Bullets hit walls/solids (ASIC Miners explode)
             for bullet in bullets.copy():
                 if bullet.is_rocket and not bullet.is_enemy:
                     # Check collision with solid tiles
-                    bullet_rect = bullet.rect
-                    for solid in level.solid_rects:
-                        if bullet_rect.colliderect(solid):
-                            # ASIC Miner explosion on wall hit
-                            particles.create_big_explosion(bullet.rect.centerx, bullet.rect.centery, S.BITCOIN_ORANGE, count=20)
-                            particles.create_impact_sparks(bullet.rect.centerx, bullet.rect.centery, count=12)
-                            camera.add_screen_shake(6.0)
-                            sounds.play_explode()
-                            bullet.kill()
-                            break
+                    if level.query_solids(bullet.rect):
+                        # ASIC Miner explosion on wall hit
+                        particles.create_big_explosion(bullet.rect.centerx, bullet.rect.centery, S.BITCOIN_ORANGE, count=20)
+                        particles.create_impact_sparks(bullet.rect.centerx, bullet.rect.centery, count=12)
+                        camera.add_screen_shake(6.0)
+                        sounds.play_explode()
+                        bullet.kill()
             
             # Check if all enemies (including boss) are defeated
             alive_enemies = [e for e in enemies if e.hp > 0]
@@ -681,7 +714,8 @@ def main() -> None:
             boss_alive = any(isinstance(e, Boss) and e.hp > 0 for e in enemies)
             boss_defeated = has_boss and not boss_alive
             
-            if len(enemies) == 0 or len(alive_enemies) == 0:
+            # Enemies parked in unloaded level chunks still count
+            if (len(enemies) == 0 or len(alive_enemies) == 0) and not level.parked_in(enemies):
                 if state == "playing":  # Only trigger once
                     print(f"🎉 Level Complete! All enemies defeated. Score: {score}")
                     # Apply difficulty score multiplier
@@ -867,60 +901,57 @@ def main() -> None:
                 state = "game_over"
                 sounds.play_explode()  # Death sound
 
-        screen.fill(S.GRAY)
-        if state in ("start", "paused", "level_select"):
-            draw_animated_background(screen, pygame.time.get_ticks())
+        # Overlay screens show the last gameplay frame, blurred/dimmed once on entry
+        if state not in BACKDROP_STYLES:
+            backdrop = None
+        elif backdrop is None or backdrop[0] != state:
+            backdrop = (state, make_backdrop(world, screen.get_size(), **BACKDROP_STYLES[state]))
+        
+        dirty_rects = None
+        if state not in CACHED_MENUS:
+            menu_layers.invalidate()
+            if state != "playing":  # Gameplay frames cover the window
+                screen.fill(S.GRAY)
         if state == "playing":
             # Draw with camera offset
             camera_offset = camera.get_offset()
-            level.draw(screen, camera_offset)
-            
-            # Glow effects removed - user requested no circles on items or enemies
+            visible_tiles = camera.get_visible_tile_range(level.tile_size, level.width, level.height)
+            world.fill(S.GRAY)
+            level.draw(world, camera_offset, visible_tiles)
             
-            # Draw sprites with camera offset
-            for sprite in all_sprites:
-                offset_rect = sprite.rect.move(camera_offset)
-                screen.blit(sprite.image, offset_rect)
-            
-            for bullet in bullets:
-                offset_rect = bullet.rect.move(camera_offset)
-                screen.blit(bullet.image, offset_rect)
-            
-            for pickup in pickups:
-                offset_rect = pickup.rect.move(camera_offset)
-                screen.blit(pickup.image, offset_rect)
-            
-            # Draw collectibles
-            for collectible in collectibles:
-                offset_rect = collectible.rect.move(camera_offset)
-                screen.blit(collectible.image, offset_rect)
-            
-            # Draw weapon pickups
-            for weapon_pickup in weapon_pickups:
-                offset_rect = weapon_pickup.rect.move(camera_offset)
-                screen.blit(weapon_pickup.image, offset_rect)
-            
-            # Draw checkpoints
-            for checkpoint in checkpoints:
-                offset_rect = checkpoint.rect.move(camera_offset)
-                screen.blit(checkpoint.image, offset_rect)
-            
-            # Draw moving platforms
-            for platform in platforms:
-                offset_rect = platform.rect.move(camera_offset)
-                screen.blit(platform.image, offset_rect)
-            
-            # Draw traps
-            for trap in traps:
-                offset_rect = trap.rect.move(camera_offset)
-                screen.blit(trap.image, offset_rect)
+            # Draw on-screen sprites with camera offset, one batched blit call per layer
+            render_queue.add_sprites(camera.get_visible_sprites((player,), enemies), camera_offset, LAYER_ACTORS)
+            render_queue.add_sprites(camera.get_visible_sprites(bullets), camera_offset, LAYER_BULLETS)
+            render_queue.add_sprites(camera.get_visible_sprites(pickups, collectibles, weapon_pickups, checkpoints), camera_offset, LAYER_ITEMS)
+            render_queue.add_sprites(camera.get_visible_sprites(platforms, traps), camera_offset, LAYER_PROPS)
+            render_queue.flush(world)
             
             # Draw secret area indicators
             for secret_area in secret_areas:
-                secret_area.draw_indicator(screen, camera_offset)
+                secret_area.draw_indicator(world, camera_offset)
+            
+            # Lighting pass (particles are drawn after it so they stay bright)
+            if S.LIGHTING_ENABLED:
+                lightmap.begin(camera_offset)
+                lightmap.add_light(player.rect.centerx, player.rect.centery, 260, (255, 235, 200), 0.5)
+                for item in (*pickups, *weapon_pickups, *collectibles):
+                    lightmap.add_light(item.rect.centerx, item.rect.centery, 50, S.BITCOIN_GOLD, 0.5)
+                for bullet in bullets:
+                    if bullet.is_rocket:
+                        lightmap.add_light(bullet.rect.centerx, bullet.rect.centery, 140, S.BITCOIN_ORANGE)
+                    else:
+                        lightmap.add_light(bullet.rect.centerx, bullet.rect.centery, 60,
+                                           (255, 120, 120) if bullet.is_enemy else (255, 240, 170), 0.8)
+                for trap in traps:
+                    if isinstance(trap, Lava):
+                        lightmap.add_light(trap.rect.centerx, trap.rect.centery, trap.rect.width + 60, (255, 110, 30))
+                lightmap.apply(world)
             
             # Draw particles
-            particles.draw(screen, camera_offset)
+            particles.draw(world, camera_offset)
+            
+            # Scale the world up to the window; UI is drawn at full resolution on top
+            render_target.present(screen)
             
             # HUD (no camera offset - always on screen)
             current_weapon = player.get_current_weapon()
@@ -930,9 +961,6 @@ def main() -> None:
                 if isinstance(e, Boss) and e.hp > 0:
                     boss = e
                     break
-            # Get level size for minimap
-            level_size = (level.width * level.tile_size if hasattr(level, 'width') else S.WIDTH * 2, 
-                         level.height * level.tile_size if hasattr(level, 'height') else S.HEIGHT * 2)
             player_pos = (player.rect.centerx, player.rect.centery)
             
             # Load volume settings from save
@@ -943,7 +971,7 @@ def main() -> None:
             
             hud.draw(screen, hp=player.hp, max_hp=player.max_hp, ammo_text=f"{player.ammo_in_mag}/{player.reserve_ammo}", 
                     score=score, current_weapon=current_weapon, boss=boss, 
-                    player_pos=player_pos, level_size=level_size, enemies=enemies)
+                    player_pos=player_pos, enemies=enemies)
             
             # Draw professional achievement notifications
             if achievement_notifications:
@@ -1061,21 +1089,12 @@ def main() -> None:
             mouse_pos = pygame.mouse.get_pos()
             hover_rects = draw_shop_menu(screen, coins, player.hp, player.max_hp, mouse_pos)
         elif state == "level_complete":
-            # Draw animated background first
-            draw_animated_background(screen, pygame.time.get_ticks())
-            # Draw the level behind the complete screen (frozen frame)
-            level.draw(screen)
-            all_sprites.draw(screen)
-            bullets.draw(screen)
-            # Apply dim overlay (lighter so menu is visible)
-            overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 140))  # Lighter dim
-            screen.blit(overlay, (0, 0))
-            # Draw the level complete menu on top
-            print(f"Drawing level complete menu, score={score}")
+            # Frozen, dimmed gameplay frame behind the menu
+            def draw_menu(surface, mouse_pos, frame=backdrop[1], score=score):
+                surface.blit(frame, (0, 0))
+                return draw_level_complete_menu(surface, score, mouse_pos)
             mouse_pos = pygame.mouse.get_pos()
-            hover_rects = draw_level_complete_menu(screen, score, mouse_pos)
-            print(f"Menu drawn, buttons: {list(hover_rects.keys())}")
+            hover_rects, dirty_rects = menu_layers.show(screen, ("level_complete", score, id(backdrop[1])), draw_menu, mouse_pos)
             # hover sound detection
             current = None
             if hover_rects.get("continue") and hover_rects["continue"].collidepoint(mouse_pos):
@@ -1087,7 +1106,12 @@ def main() -> None:
             last_hover_key = current
         elif state == "start":
             mouse_pos = pygame.mouse.get_pos()
-            hover_rects = draw_start_menu(screen, mouse_pos, pygame.time.get_ticks())
+            # The pulsing title is the only animated part
+            hover_rects, dirty_rects = menu_layers.show(
+                screen, ("start",),
+                lambda surface, mouse_pos: draw_start_menu(surface, mouse_pos, draw_title=False),
+                mouse_pos,
+                lambda size: get_start_title(size, pygame.time.get_ticks()))
             # hover sound detection
             current = None
             if hover_rects.get("select_level") and hover_rects["select_level"].collidepoint(mouse_pos):
@@ -1100,9 +1124,8 @@ def main() -> None:
                 sounds.play_hover()
             last_hover_key = current
         elif state == "about":
-            draw_animated_background(screen, pygame.time.get_ticks())
             mouse_pos = pygame.mouse.get_pos()
-            hover_rects = draw_about_menu(screen, mouse_pos)
+            hover_rects, dirty_rects = menu_layers.show(screen, ("about",), draw_about_menu, mouse_pos)
             # hover sound detection
             current = None
             if hover_rects.get("back") and hover_rects["back"].collidepoint(mouse_pos):
@@ -1112,7 +1135,10 @@ def main() -> None:
             last_hover_key = current
         elif state == "level_select":
             mouse_pos = pygame.mouse.get_pos()
-            hover_rects = draw_level_select_menu(screen, available_levels, mouse_pos, selected_level_index)
+            def draw_menu(surface, mouse_pos, index=selected_level_index):
+                return draw_level_select_menu(surface, available_levels, mouse_pos, index)
+            hover_rects, dirty_rects = menu_layers.show(
+                screen, ("level_select", selected_level_index, tuple(available_levels)), draw_menu, mouse_pos)
             # hover sound detection
             current = None
             for level_name, _ in available_levels:
@@ -1125,11 +1151,12 @@ def main() -> None:
                 sounds.play_hover()
             last_hover_key = current
         elif state == "paused":
-            from ui.menus import draw_pause_menu
             mouse_pos = pygame.mouse.get_pos()
-            # apply blur+dim to gameplay frame before drawing menu
-            blur_and_dim(screen, scale_factor=0.2, dim_alpha=140)
-            hover_rects = draw_pause_menu(screen, mouse_pos, pygame.time.get_ticks())
+            # Blurred and dimmed gameplay frame behind the menu
+            def draw_menu(surface, mouse_pos, frame=backdrop[1]):
+                surface.blit(frame, (0, 0))
+                return draw_pause_menu(surface, mouse_pos)
+            hover_rects, dirty_rects = menu_layers.show(screen, ("paused", id(backdrop[1])), draw_menu, mouse_pos)
             current = None
             if hover_rects.get("resume") and hover_rects["resume"].collidepoint(mouse_pos):
                 current = "resume"
@@ -1139,19 +1166,12 @@ def main() -> None:
                 sounds.play_hover()
             last_hover_key = current
         elif state == "game_over":
-            # Draw animated background first
-            draw_animated_background(screen, pygame.time.get_ticks())
-            # Draw the level behind the game over screen (frozen frame)
-            level.draw(screen)
-            all_sprites.draw(screen)
-            bullets.draw(screen)
-            # Apply dim overlay
-            overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 140))
-            screen.blit(overlay, (0, 0))
-            # Draw the game over menu on top
+            # Frozen, dimmed gameplay frame behind the menu
+            def draw_menu(surface, mouse_pos, frame=backdrop[1], score=score):
+                surface.blit(frame, (0, 0))
+                return draw_game_over_menu(surface, score, mouse_pos)
             mouse_pos = pygame.mouse.get_pos()
-            hover_rects = draw_game_over_menu(screen, score, mouse_pos)
+            hover_rects, dirty_rects = menu_layers.show(screen, ("game_over", score, id(backdrop[1])), draw_menu, mouse_pos)
             # hover sound detection
             current = None
             if hover_rects.get("retry") and hover_rects["retry"].collidepoint(mouse_pos):
@@ -1165,7 +1185,10 @@ def main() -> None:
             hover_rects = None
             last_hover_key = None
 
-        pygame.display.flip()
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
         clock.tick(S.FPS)
 
     pygame.quit()
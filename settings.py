@@ -1,5 +1,9 @@
 WIDTH = 1920
 HEIGHT = 1080
+# The world is rendered at this resolution and scaled up to the window
+# (set to WIDTH x HEIGHT to render at native resolution)
+RENDER_WIDTH = 960
+RENDER_HEIGHT = 540
 FPS = 60
 TITLE = "Bitcoin Miner Platformer"
 
@@ -20,3 +24,22 @@ ORANGE = BITCOIN_ORANGE
 GOLD = BITCOIN_GOLD
 
 
+
+# Level streaming, opt-in for very long levels: set LEVEL_STREAM_RADIUS to
+# the column chunks to keep loaded on each side of the camera view (None
+# loads whole levels up front). Only levels at least LEVEL_STREAM_MIN_COLUMNS
+# wide are streamed; shorter ones gain nothing from it.
+LEVEL_STREAM_RADIUS = None
+LEVEL_STREAM_MIN_COLUMNS = 512
+
+# Use RLE acceleration for colorkeyed sprites when converting loaded images
+RLE_COLORKEY_SPRITES = True
+
+# Live particles allowed before effects start degrading (see utils/particles)
+PARTICLE_BUDGET = 1500
+
+# Lighting pass: the scene is dimmed to AMBIENT, then lights (accumulated into
+# a lightmap at 1/LIGHTMAP_SCALE resolution) add up to as much again on top
+LIGHTING_ENABLED = True
+LIGHTMAP_SCALE = 4
+LIGHTMAP_AMBIENT = (225, 225, 235)
@@ -0,0 +1,51 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from pathlib import Path
+
+import pygame
+
+from utils import asset_manifest
+from utils.sprites import SPRITES_PATH, find_enemy_sheets
+from utils.tileset import scan_tileset_folder
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    asset_manifest.use_manifest(None)
+    pygame.quit()
+
+
+def test_manifest_matches_folder_scans():
+    manifest = asset_manifest.build_manifest()
+    asset_manifest.use_manifest(manifest)
+
+    enemy_path = SPRITES_PATH / "enemy"
+    scanned = [[path.as_posix() for path in group] for group in find_enemy_sheets(enemy_path)]
+    assert asset_manifest.lookup_enemy_sheets(enemy_path) == scanned
+    assert asset_manifest.lookup_tileset(Path("assets/tiles")) == scan_tileset_folder(Path("assets/tiles"))
+    assert asset_manifest.find_level_files(Path("levels")) == sorted(Path("levels").glob("*.csv"))
+
+
+def test_entries_for_missing_files_fall_back_to_scanning():
+    asset_manifest.use_manifest({"version": asset_manifest.MANIFEST_VERSION,
+                                 "levels": {"levels": ["levels/missing.csv"]}})
+    assert asset_manifest.find_level_files(Path("levels")) == sorted(Path("levels").glob("*.csv"))
+
+
+def test_frozen_builds_trust_the_manifest(monkeypatch):
+    monkeypatch.setattr(asset_manifest, "TRUST_MANIFEST", True)
+    asset_manifest.use_manifest({"version": asset_manifest.MANIFEST_VERSION,
+                                 "levels": {"levels": ["levels/packaged.csv"]}})
+    assert asset_manifest.find_level_files(Path("levels")) == [Path("levels/packaged.csv")]
+
+
+def test_entries_are_keyed_by_logical_id():
+    manifest = asset_manifest.build_manifest()
+    assert set(manifest["levels"]) == {"levels"}
+    assert set(manifest["tilesets"]) == {"tiles"}
+    assert all(key.startswith("player/") for key in manifest["animations"])
@@ -0,0 +1,40 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from utils.camera import Camera
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def make_sprite(x, y):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((10, 10))
+    sprite.rect = sprite.image.get_rect(topleft=(x, y))
+    return sprite
+
+
+def test_visible_tile_range_is_clamped_to_level():
+    camera = Camera(300, 200)
+    camera.rect.topleft = (-50, 95)
+    assert camera.get_visible_tile_range(30, 20, 10) == (0, 3, 9, 10)
+
+
+def test_visible_sprites_skip_offscreen_and_duplicates():
+    camera = Camera(300, 200)
+    onscreen = make_sprite(50, 50)
+    offscreen = make_sprite(1000, 50)
+    shared = make_sprite(100, 100)
+    everything = pygame.sprite.Group(onscreen, offscreen, shared)
+    pickups = pygame.sprite.Group(shared)
+    visible = camera.get_visible_sprites(everything, pickups)
+    # Shared sprite is drawn once, in the later group's slot
+    assert visible == [onscreen, shared]
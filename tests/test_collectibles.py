@@ -0,0 +1,52 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from entities.collectibles import Coin, COIN_ROTATION_STEPS, get_coin_rotation_strip
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_coins_spin_through_shared_rotation_strip():
+    strip = get_coin_rotation_strip()
+    assert len(strip) == COIN_ROTATION_STEPS
+    coins = [Coin(100 + i * 20, 100) for i in range(3)]
+    for _ in range(50):
+        for coin in coins:
+            coin.update()
+    for coin in coins:
+        assert coin.image is coins[0].image
+        assert any(coin.image is frame for frame in strip)
+        assert coin.rect.size == coin.image.get_size()
+
+
+def test_procedural_images_are_shared_per_parameter_set():
+    from entities.checkpoint import Checkpoint
+    from entities.collectibles import Key
+    from entities.pickup import HealthPickup
+    from entities.traps import Spike
+    from entities.weapon_pickup import WeaponPickup
+
+    assert Key(0, 0).image is Key(50, 50, key_id="other").image
+    assert HealthPickup(0, 0).image is HealthPickup(10, 10).image
+    assert Checkpoint(0, 0).image is Checkpoint(100, 0).image
+    assert Spike(0, 0, width=60).image is Spike(90, 0, width=60).image
+    assert Spike(0, 0, width=60).image is not Spike(0, 0, width=90).image
+    assert WeaponPickup(0, 0, "laser").image is not WeaponPickup(0, 0, "rocket").image
+
+
+def test_damage_boost_spawns_where_it_is_placed():
+    from entities.pickup import DamageBoostPickup
+
+    # The old star drawing loop overwrote x and y with its last point
+    pickup = DamageBoostPickup(400, 250)
+    assert pickup.rect.center == (400, 250)
+    assert pickup.image is DamageBoostPickup(0, 0).image
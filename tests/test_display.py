@@ -0,0 +1,25 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from utils.display import RenderTarget
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_world_is_scaled_up_to_fill_the_window():
+    target = RenderTarget((200, 100), (100, 50))
+    target.surface.fill((0, 0, 0))
+    target.surface.fill((255, 0, 0), pygame.Rect(50, 25, 1, 1))
+    window = pygame.Surface((200, 100))
+    target.present(window)
+    assert window.get_at((101, 51))[:3] == (255, 0, 0)
+    assert window.get_at((99, 49))[:3] == (0, 0, 0)
@@ -54,3 +54,11 @@ def test_enemy_requires_two_bullets_to_die():
     fire_and_hit()
     assert e.hp == 0
 
+
+def test_enemies_share_cached_transformed_frames():
+    a = Enemy(100, 100, left_bound=0, right_bound=400, speed=2.0, enemy_type_index=0)
+    b = Enemy(200, 100, left_bound=0, right_bound=400, speed=2.0, enemy_type_index=0)
+    a.update(None, [])
+    b.update(None, [])
+    # Same frame, scale, tint and facing -> the very same surface, built once
+    assert a.image is b.image
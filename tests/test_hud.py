@@ -0,0 +1,49 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from ui.hud import HUD
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+class _Weapon:
+    name = "Lightning"
+
+
+def _draw(hud, surface, **values):
+    kwargs = dict(hp=80, max_hp=100, ammo_text="5/30", score=10, current_weapon=_Weapon())
+    kwargs.update(values)
+    hud.draw(surface, **kwargs)
+
+
+def test_widgets_are_rerendered_only_when_their_values_change():
+    hud = HUD()
+    surface = pygame.Surface((640, 360))
+    _draw(hud, surface)
+    first = {name: widget[1] for name, widget in hud._widgets.items()}
+    assert {"health", "ammo", "score", "weapon"} <= set(first)
+
+    _draw(hud, surface, score=25)
+    second = {name: widget[1] for name, widget in hud._widgets.items()}
+    assert second["score"] is not first["score"]
+    assert all(second[name] is first[name] for name in ("health", "ammo", "weapon"))
+
+
+def test_health_bar_width_follows_hp():
+    hud = HUD()
+    full = pygame.Surface((640, 360))
+    low = pygame.Surface((640, 360))
+    _draw(hud, full, hp=100)
+    _draw(hud, low, hp=20)
+    # Right end of the bar, away from the hp text
+    assert full.get_at((210, 20))[:3] != (20, 20, 20)
+    assert low.get_at((210, 20))[:3] == (20, 20, 20)
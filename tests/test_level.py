@@ -0,0 +1,154 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from levels import level_cache
+from levels.level import Level, TILE_SIZE, CHUNK_TILES
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_foreground_is_baked_into_chunks():
+    # 40 columns span three chunks horizontally, but only chunks holding
+    # solid tiles are kept
+    rows = [[0] * 40 for _ in range(20)]
+    rows[19] = [1] * 20 + [0] * 20
+    level = Level(rows)
+    assert set(level._chunks) == {(0, 1), (1, 1)}
+
+
+def test_draw_blits_chunks_with_camera_offset():
+    rows = [[0] * 40 for _ in range(20)]
+    rows[2][CHUNK_TILES + 1] = 1
+    level = Level(rows)
+    surface = pygame.Surface((200, 200))
+    surface.fill((255, 255, 255))
+    offset = (-CHUNK_TILES * TILE_SIZE, 0)
+    level.draw(surface, offset)
+    # The single solid tile lands one tile in from the left edge of the screen
+    assert surface.get_at((TILE_SIZE + 5, 2 * TILE_SIZE + 5))[:3] == (30, 30, 30)
+
+
+def test_query_solids_matches_brute_force():
+    rows = [[(x * 7 + y * 3) % 4 == 0 for x in range(12)] for y in range(10)]
+    level = Level([[int(cell) for cell in row] for row in rows])
+    for probe in (pygame.Rect(0, 0, 1, 1), pygame.Rect(25, 40, 50, 70),
+                  pygame.Rect(-20, -20, 60, 60), pygame.Rect(300, 250, 100, 100),
+                  pygame.Rect(30, 30, 30, 30)):
+        expected = [r for r in level.solid_rects if probe.colliderect(r)]
+        assert level.query_solids(probe) == expected
+
+
+def test_merged_solids_cover_the_same_tiles():
+    rows = [[0] * 10 for _ in range(6)]
+    rows[5] = [1] * 10
+    for y in range(2, 5):
+        rows[y][3] = rows[y][4] = 1
+    level = Level(rows, merge_solids=True)
+    # 2x3 pillar plus the floor
+    assert len(level.merged_solid_rects) == 2
+    covered = {(x, y) for r in level.merged_solid_rects
+               for x in range(r.left // TILE_SIZE, r.right // TILE_SIZE)
+               for y in range(r.top // TILE_SIZE, r.bottom // TILE_SIZE)}
+    assert covered == {(r.x // TILE_SIZE, r.y // TILE_SIZE) for r in level.solid_rects}
+    # A probe spanning many floor tiles sees the floor once
+    assert level.query_solids(pygame.Rect(0, 5 * TILE_SIZE, 300, 10)) == [level.merged_solid_rects[1]]
+
+
+def test_from_csv_round_trips_through_compiled_cache(tmp_path):
+    csv_path = tmp_path / "level.csv"
+    csv_path.write_text("0,0,0\n1,0,1\n1,1,1\n")
+    first = Level.from_csv(csv_path, tileset_path=tmp_path, merge_solids=True)
+    assert level_cache.cache_path_for(csv_path).exists()
+
+    cached = Level.from_csv(csv_path, tileset_path=tmp_path, merge_solids=True)
+    assert (cached.grid == first.grid).all()
+    assert cached.merged_solid_rects == first.merged_solid_rects
+
+    # Editing the CSV invalidates the compiled form
+    csv_path.write_text("0,0,0\n0,0,0\n1,1,1\n")
+    edited = Level.from_csv(csv_path, tileset_path=tmp_path)
+    assert edited.grid[1].tolist() == [0, 0, 0]
+
+
+def test_grid_is_a_compact_array_with_nested_indexing():
+    level = Level([[0, 1], [300, 1]])
+    assert level.grid.dtype == np.uint16
+    assert level.grid[1][0] == 300
+    assert level.solid_mask.tolist() == [[False, True], [False, True]]
+    assert level.minimap_mask(4, 4)[:, 2:].all()
+
+
+def test_background_textures_do_not_scale_with_level_width():
+    narrow = Level([[0] * 40 for _ in range(18)])
+    wide = Level([[0] * 4000 for _ in range(18)])
+    assert wide.background_far.get_size() == narrow.background_far.get_size()
+    surface = pygame.Surface((640, 360))
+    wide.draw(surface, (-50000, 0))
+
+
+def test_background_scrolls_vertically_on_tall_levels():
+    tall = Level([[0] * 40 for _ in range(60)])
+    assert tall.background_surface.get_height() == 60 * TILE_SIZE
+    top, lower = pygame.Surface((320, 180)), pygame.Surface((320, 180))
+    tall.draw(top, (0, 0))
+    tall.draw(lower, (0, -1000))
+    # The near layer's gradient gets lighter further down the level
+    assert lower.get_at((5, 5))[0] > top.get_at((5, 5))[0]
+
+
+def test_streaming_keeps_only_nearby_columns_resident():
+    chunk_px = CHUNK_TILES * TILE_SIZE
+    rows = [[0] * (CHUNK_TILES * 8) for _ in range(10)]
+    rows[9] = [1] * (CHUNK_TILES * 8)
+    level = Level(rows, merge_solids=True, stream_radius=1)
+    floor_probe = pygame.Rect(5 * chunk_px, 9 * TILE_SIZE, 10, 10)
+    assert level.query_solids(floor_probe) == []
+
+    group = pygame.sprite.Group()
+    far_sprite = pygame.sprite.Sprite(group)
+    far_sprite.rect = pygame.Rect(6 * chunk_px, 0, 10, 10)
+
+    level.update_stream(pygame.Rect(0, 0, chunk_px, 300), group)
+    assert set(level._chunks) == {(0, 0), (1, 0)}
+    assert not group.has(far_sprite) and level.parked_in(group) == [far_sprite]
+
+    # Scrolling right loads the columns ahead, evicts those behind and
+    # brings parked sprites back
+    level.update_stream(pygame.Rect(5 * chunk_px, 0, chunk_px, 300), group)
+    assert {key[0] for key in level._chunks} == {4, 5, 6}
+    assert level.query_solids(floor_probe)
+    assert level.query_solids(pygame.Rect(10, 9 * TILE_SIZE, 10, 10)) == []
+    assert group.has(far_sprite) and level.parked_in(group) == []
+
+
+def test_streaming_is_skipped_for_narrow_levels():
+    rows = [[0] * (CHUNK_TILES * 2) for _ in range(10)]
+    rows[9] = [1] * (CHUNK_TILES * 2)
+    narrow = Level(rows, merge_solids=True, stream_radius=1, stream_min_columns=CHUNK_TILES * 4)
+    assert narrow.stream_radius is None
+    assert narrow.solid_rects and narrow.query_solids(pygame.Rect(10, 9 * TILE_SIZE, 10, 10))
+
+
+def test_cache_is_skipped_for_levels_too_large_for_it(tmp_path):
+    csv_path = tmp_path / "huge.csv"
+    grid = np.zeros((1, 70000), dtype=np.uint8)
+    assert level_cache.save(csv_path, b"k" * 32, grid, [], None, TILE_SIZE) is False
+    assert not level_cache.cache_path_for(csv_path).exists()
+
+
+def test_streamed_level_caches_full_collision_data(tmp_path):
+    csv_path = tmp_path / "long.csv"
+    csv_path.write_text("0,0,0,0\n1,1,1,1\n")
+    Level.from_csv(csv_path, tileset_path=tmp_path, merge_solids=True, stream_radius=1)
+    cached = Level.from_csv(csv_path, tileset_path=tmp_path, merge_solids=True)
+    assert cached.merged_solid_rects == [pygame.Rect(0, TILE_SIZE, 4 * TILE_SIZE, TILE_SIZE)]
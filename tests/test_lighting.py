@@ -0,0 +1,61 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from utils.lighting import GlowEffect, Lightmap, _cached_glow, create_glow_surface, get_glow_surface
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_glow_fades_from_center_to_edge():
+    glow = create_glow_surface(16, (255, 128, 0))
+    assert glow.get_size() == (32, 32)
+    assert glow.get_at((16, 16)) == (255, 128, 0, 255)
+    assert glow.get_at((0, 0)).a == 0
+    assert 0 < glow.get_at((16, 4)).a < glow.get_at((16, 12)).a
+
+
+def test_pulsing_glow_reuses_cached_surfaces():
+    assert get_glow_surface(31, (255, 0, 0), 0.61) is get_glow_surface(32, (255, 0, 0), 0.6)
+    _cached_glow.cache_clear()
+    effect = GlowEffect((0, 255, 0), 32, pulse_speed=0.5)
+    surface = pygame.Surface((200, 200))
+    for _ in range(200):
+        effect.update()
+        effect.draw(surface, 100, 100)
+    info = _cached_glow.cache_info()
+    assert info.currsize < 20 and info.hits > 180
+
+
+def test_lightmap_darkens_to_ambient_and_brightens_around_lights():
+    lightmap = Lightmap((160, 80), scale=4, ambient=(100, 100, 100))
+    assert lightmap.surface.get_size() == (40, 20)
+    scene = pygame.Surface((160, 80))
+    scene.fill((255, 255, 255))
+    lightmap.begin(camera_offset=(-1000, 0))
+    lightmap.add_light(1040, 40, 40, (255, 255, 255))
+    lightmap.add_light(5000, 40, 40, (255, 255, 255))  # Offscreen, skipped
+    lightmap.apply(scene)
+    assert len(lightmap._lights) == 1
+    assert scene.get_at((150, 5))[0] < 110
+    assert scene.get_at((40, 40))[0] > 200
+
+
+def test_lights_brighten_the_scene_past_its_unlit_colour():
+    lightmap = Lightmap((160, 80), scale=4, ambient=(230, 230, 230))
+    scene = pygame.Surface((160, 80))
+    scene.fill((100, 80, 60))
+    lightmap.begin()
+    lightmap.add_light(40, 40, 40, (255, 255, 255))
+    lightmap.apply(scene)
+    lit = scene.get_at((40, 40))
+    assert lit.r > 150 and lit.g > 120 and lit.b > 90
+    assert scene.get_at((150, 5))[:3] == (90, 72, 54)
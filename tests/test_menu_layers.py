@@ -0,0 +1,66 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from ui.menu_layers import MenuLayers
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def _draw_menu(calls):
+    button = pygame.Rect(40, 40, 50, 20)
+
+    def draw(surface, mouse_pos):
+        calls.append(mouse_pos)
+        surface.fill((10, 10, 10))
+        color = (200, 200, 0) if mouse_pos and button.collidepoint(mouse_pos) else (60, 60, 60)
+        pygame.draw.rect(surface, color, button)
+        return {"play": button}
+    return draw
+
+
+def test_static_layer_is_drawn_once_and_only_hover_changes_are_dirty():
+    calls = []
+    layers = MenuLayers()
+    screen = pygame.Surface((200, 150))
+    draw = _draw_menu(calls)
+
+    buttons, dirty = layers.show(screen, ("menu",), draw, (0, 0))
+    assert dirty == [screen.get_rect()] and buttons["play"].topleft == (40, 40)
+    assert layers.show(screen, ("menu",), draw, (1, 1))[1] == []
+
+    # Hovering blits the button's patch, rendered once
+    dirty = layers.show(screen, ("menu",), draw, (50, 50))[1]
+    assert len(dirty) == 1 and dirty[0].contains(buttons["play"]) and dirty[0].width < 100
+    assert screen.get_at((45, 45))[:3] == (200, 200, 0)
+    layers.show(screen, ("menu",), draw, (0, 0))
+    assert screen.get_at((45, 45))[:3] == (60, 60, 60)
+    layers.show(screen, ("menu",), draw, (50, 50))
+    assert len(calls) == 2
+
+    # A new key redraws the whole screen
+    assert layers.show(screen, ("menu", 1), draw, (0, 0))[1] == [screen.get_rect()]
+
+
+def test_animated_sprite_is_redrawn_only_when_it_changes():
+    layers = MenuLayers()
+    screen = pygame.Surface((200, 150))
+    frames = [pygame.Surface((10, 10)), pygame.Surface((10, 10))]
+    frames[1].fill((255, 0, 0))
+    current = [frames[0]]
+    draw = _draw_menu([])
+
+    layers.show(screen, ("menu",), draw, None, lambda size: (current[0], (5, 5)))
+    assert layers.show(screen, ("menu",), draw, None, lambda size: (current[0], (5, 5)))[1] == []
+    current[0] = frames[1]
+    dirty = layers.show(screen, ("menu",), draw, None, lambda size: (current[0], (5, 5)))[1]
+    assert pygame.Rect(5, 5, 10, 10) in dirty
+    assert screen.get_at((6, 6))[:3] == (255, 0, 0)
@@ -0,0 +1,50 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from levels.level import Level, TILE_SIZE
+from ui.minimap import FOG_CELL, FOG_COLOR, LABEL_HEIGHT, SOLID_COLOR, Minimap
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def _baked_minimap():
+    rows = [[0] * 40 for _ in range(20)]
+    rows[19] = [1] * 40
+    level = Level(rows)
+    minimap = Minimap()
+    minimap.bake((level.width * TILE_SIZE, level.height * TILE_SIZE), level.minimap_mask(minimap.size, minimap.size))
+    return minimap
+
+
+def test_terrain_is_baked_and_fogged_until_revealed():
+    minimap = _baked_minimap()
+    floor = (minimap.size // 2, minimap.size - 3)
+    assert minimap.terrain.get_at(floor)[:3] == SOLID_COLOR
+    assert minimap.image.get_at((floor[0], LABEL_HEIGHT + floor[1]))[:3] == FOG_COLOR
+
+    # Standing on the floor in the middle of the level reveals it there only
+    assert minimap.reveal((20 * TILE_SIZE, 18 * TILE_SIZE)) > 0
+    assert minimap.image.get_at((floor[0], LABEL_HEIGHT + floor[1]))[:3] == SOLID_COLOR
+    assert minimap.image.get_at((10, LABEL_HEIGHT + floor[1]))[:3] == FOG_COLOR
+
+
+def test_reveal_only_updates_new_cells():
+    minimap = _baked_minimap()
+    first = minimap.reveal((100, 100))
+    assert first > 0 and minimap.explored_count() == first
+    # One bit per cell
+    assert minimap.explored.nbytes == minimap.cells * ((minimap.cells + 7) // 8)
+    # Same cell: nothing to do
+    assert minimap.reveal((101, 101)) == 0
+    # Moving one cell over uncovers a thin edge, not the whole area again
+    step = FOG_CELL * 40 * TILE_SIZE / minimap.size
+    assert 0 < minimap.reveal((100 + step, 100)) < first
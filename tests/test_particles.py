@@ -0,0 +1,89 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from utils.particles import (ALPHA_BUCKETS, PRIORITY_HIGH, PRIORITY_LOW, Particle, ParticleSystem,
+                             particle_atlas)
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_particles_integrate_with_gravity_and_expire():
+    system = ParticleSystem(capacity=8)
+    system.add_particle(Particle(10, 20, 1.0, -1.0, (255, 0, 0), lifetime=3))
+    reference = Particle(10, 20, 1.0, -1.0, (255, 0, 0), lifetime=3)
+    system.update()
+    reference.update()
+    slot = int(system.alive.nonzero()[0][0])
+    assert (system.x[slot], system.y[slot]) == (reference.x, reference.y)
+    assert abs(system.vy[slot] - reference.vy) < 1e-6
+    system.update()
+    system.update()
+    assert len(system) == 0
+
+
+def test_dead_slots_are_recycled_and_capacity_is_bounded():
+    system = ParticleSystem(capacity=100, budget=100)
+    for _ in range(10):
+        system.create_big_explosion(50, 50, count=30)
+    assert len(system) == 100
+    for _ in range(60):
+        system.update()
+    assert len(system) == 0
+    system.create_explosion(0, 0, count=15)
+    assert len(system) == 15
+    surface = pygame.Surface((100, 100))
+    system.draw(surface, (10, 10))
+    system.clear()
+    assert len(system) == 0
+
+
+def test_draw_blits_from_shared_atlas_strips():
+    particle_atlas.clear()
+    system = ParticleSystem(capacity=16)
+    system.add_particle(Particle(20, 20, 0, 0, (255, 0, 0), lifetime=10, size=3, fade=False))
+    system.add_particle(Particle(40, 20, 0, 0, (255, 0, 0), lifetime=10, size=3))
+    strip = particle_atlas.get_strip((255, 0, 0), 3)
+    assert strip.get_size() == (6 * ALPHA_BUCKETS, 6)
+
+    surface = pygame.Surface((64, 64))
+    system.draw(surface)
+    system.draw(surface)
+    assert particle_atlas.get_strip((255, 0, 0), 3) is strip
+    # The non-fading particle is drawn fully opaque around its position
+    assert surface.get_at((20, 20))[:3] == (255, 0, 0)
+    assert surface.get_at((40, 20))[0] > 0
+
+
+def test_budget_degrades_low_priority_emitters_first():
+    system = ParticleSystem(capacity=400, budget=200)
+    for _ in range(20):
+        system.create_dust(0, 0, count=20)
+    # Cosmetic dust stops well short of the budget
+    assert len(system) <= 0.8 * system.budget
+    assert system.lod_scale(PRIORITY_LOW) < 0.1
+    before = len(system)
+    system.create_dust(0, 0, count=20)
+    assert len(system) == before
+
+    # Gameplay effects still get through, past the budget if needed
+    for _ in range(5):
+        system.create_big_explosion(0, 0, count=40, priority=PRIORITY_HIGH)
+    assert len(system) > system.budget
+
+
+def test_offscreen_emitters_are_culled():
+    system = ParticleSystem(capacity=64)
+    system.set_view(pygame.Rect(0, 0, 640, 360))
+    system.create_impact(5000, 100)
+    assert len(system) == 0
+    system.create_impact(320, 180)
+    assert len(system) == 8
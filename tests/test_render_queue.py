@@ -0,0 +1,39 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from utils.render_queue import RenderQueue
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def _sprite(color, rect):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface(rect.size)
+    sprite.image.fill(color)
+    sprite.rect = rect
+    return sprite
+
+
+def test_layers_draw_in_order_with_offset():
+    red = _sprite((255, 0, 0), pygame.Rect(100, 100, 10, 10))
+    blue = _sprite((0, 0, 255), pygame.Rect(105, 100, 10, 10))
+    queue = RenderQueue()
+    # Queued top layer first; flush still draws layer 0 underneath
+    queue.add_sprites([red], (-100, -100), layer=1)
+    queue.add_sprites([blue], (-100, -100), layer=0)
+    assert len(queue) == 2
+
+    surface = pygame.Surface((50, 50))
+    queue.flush(surface)
+    assert surface.get_at((7, 5))[:3] == (255, 0, 0)
+    assert surface.get_at((12, 5))[:3] == (0, 0, 255)
+    assert len(queue) == 0
@@ -56,3 +56,20 @@ def test_enemy_frames_are_not_empty():
         for anim in anims.values():
             for frame in anim.frames:
                 assert frame.get_bounding_rect().width > 0
+
+
+def test_loaded_images_are_converted_to_display_format():
+    from utils.animations import get_image_stats, prepare_surface
+
+    keyed = pygame.Surface((8, 8), depth=8)
+    keyed.set_colorkey(0)
+    before = get_image_stats()
+    img = prepare_surface(keyed, rle=True)
+    after = get_image_stats()
+    assert img.get_flags() & pygame.RLEACCELOK
+    assert img.get_bitsize() == pygame.display.get_surface().get_bitsize()
+    assert (after["converted"], after["rle"]) == (before["converted"] + 1, before["rle"] + 1)
+
+    frame = SpriteLoader().player_animations["idle"].frames[0]
+    assert frame.get_flags() & pygame.SRCALPHA
+    assert frame.get_bitsize() == pygame.display.get_surface().get_bitsize()
@@ -0,0 +1,60 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from utils.tileset import Tileset, metadata_path_for
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_tiles_are_prescaled_with_cached_metadata(tmp_path):
+    # 4x4 sheet of 16px tiles: tile 0 is empty, tile 1 has a 4x8 opaque block
+    sheet = pygame.Surface((64, 64), pygame.SRCALPHA)
+    sheet.fill((255, 0, 0, 255), (16 + 2, 4, 4, 8))
+    image_path = tmp_path / "tileset.png"
+    pygame.image.save(sheet, str(image_path))
+
+    tileset = Tileset(image_path, 30, 30)
+    assert tileset.get_tile_count() == 16
+    assert tileset.get_tile(1).get_size() == (30, 30)
+    assert tileset.get_tile_info(0).transparent
+    assert tileset.get_tile_info(1).bbox == (2, 4, 4, 8)
+    assert tileset.get_tile_info(1).coverage == 32 / 256
+    assert metadata_path_for(image_path).exists()
+
+    # A second load reads the same metadata back from disk
+    assert Tileset(image_path, 30, 30).tile_info == tileset.tile_info
+
+
+def test_visible_tile_choice_uses_the_sampled_alpha(tmp_path):
+    from levels.level import Level
+
+    # Tile 0 only has a dot at its centre sample: far below half coverage, but
+    # visible at a sample point, so it is used for plain solid cells
+    sheet = pygame.Surface((64, 64), pygame.SRCALPHA)
+    sheet.fill((255, 0, 0, 255), (8, 8, 1, 1))
+    image_path = tmp_path / "dot.png"
+    pygame.image.save(sheet, str(image_path))
+    tileset = Tileset(image_path, 30, 30)
+    assert tileset.get_tile_info(0).opaque_samples() == 1
+    assert Level([[1]], tileset=tileset)._visible_tile_index == 0
+
+    # Empty tile 0: tile 2 is fully covered but too faint, tile 3 is a thin
+    # opaque line through three of its samples, and wins
+    sheet = pygame.Surface((64, 64), pygame.SRCALPHA)
+    sheet.fill((255, 0, 0, 90), (32, 0, 16, 16))
+    sheet.fill((255, 0, 0, 255), (48 + 8, 0, 1, 16))
+    image_path = tmp_path / "sparse.png"
+    pygame.image.save(sheet, str(image_path))
+    tileset = Tileset(image_path, 30, 30)
+    assert tileset.get_tile_info(2).coverage == 1.0
+    assert tileset.get_tile_info(3).opaque_samples(100) == 3
+    assert Level([[1]], tileset=tileset)._visible_tile_index == 3
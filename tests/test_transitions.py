@@ -0,0 +1,26 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from ui.transitions import make_backdrop
+
+
+def setup_module(module):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def teardown_module(module):
+    pygame.quit()
+
+
+def test_backdrop_is_scaled_and_dimmed_copy_of_frame():
+    frame = pygame.Surface((40, 20))
+    frame.fill((200, 200, 200))
+    backdrop = make_backdrop(frame, (80, 40), dim_alpha=140)
+    assert backdrop.get_size() == (80, 40)
+    assert 85 <= backdrop.get_at((10, 10))[0] <= 95
+    assert frame.get_at((10, 10))[0] == 200
+    blurred = make_backdrop(frame, (80, 40), blur_scale=0.25, dim_alpha=0)
+    assert blurred.get_at((40, 20))[:3] == (200, 200, 200)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import math
+
 import pygame
 import settings as S
+from ui.minimap import MINIMAP_SIZE, Minimap
 
 
 def draw_gradient_rect(surface: pygame.Surface, rect: pygame.Rect, color1: tuple[int, int, int], color2: tuple[int, int, int], vertical: bool = True) -> None:
@@ -22,7 +25,26 @@ def draw_gradient_rect(surface: pygame.Surface, rect: pygame.Rect, color1: tuple
             pygame.draw.line(surface, (r, g, b), (rect.x + x, rect.y), (rect.x + x, rect.y + rect.height))
 
 
+# Colors of the weapon icon next to the weapon name
+WEAPON_ICON_COLORS = {
+    "Hash Power": (200, 200, 200),
+    "Mining Rig": (255, 200, 0),
+    "Lightning": (100, 200, 255),
+    "ASIC Miner": S.BITCOIN_ORANGE,
+    "Rapid Miner": (255, 100, 100),
+    "Precision Miner": (100, 255, 100),
+    "Explosive Miner": (255, 50, 50),
+}
+
+
 class HUD:
+    """Retained-mode HUD.
+    
+    Each widget (health bar, boss bar, ammo, score, weapon) is rendered into
+    its own surface and only re-rendered when the values it shows change.
+    draw() then puts all widgets on screen with a single blits() call.
+    """
+    
     def __init__(self) -> None:
         # Lazy import freetype; if unavailable, fall back to no-text mode
         self.font_small = None
@@ -34,30 +56,89 @@ class HUD:
         except Exception:
             self.font_small = None
             self.font_medium = None
+        # name -> (bound value, surface or None, position)
+        self._widgets: dict[str, tuple[object, pygame.Surface | None, tuple[int, int]]] = {}
+        self.minimap = Minimap(self.font_small)
+
+    def set_level(self, level) -> None:
+        """Bake the minimap for a newly loaded level."""
+        level_size = (level.width * level.tile_size, level.height * level.tile_size)
+        mask = level.minimap_mask(MINIMAP_SIZE, MINIMAP_SIZE) if hasattr(level, 'minimap_mask') else None
+        self.minimap.bake(level_size, mask)
 
-    def draw(self, surface: pygame.Surface, *, hp: int, max_hp: int, ammo_text: str, score: int, current_weapon=None, boss=None, player_pos=None, level_size=None, enemies=None) -> None:
+    def _widget(self, name: str, value, build) -> tuple[pygame.Surface | None, tuple[int, int]]:
+        """Surface and position of widget name, calling build(value) only when value changed."""
+        cached = self._widgets.get(name)
+        if cached is None or cached[0] != value:
+            image, pos = build(value)
+            cached = (value, image, pos)
+            self._widgets[name] = cached
+        return cached[1], cached[2]
+
+    def _blit_shadowed(self, image: pygame.Surface, font, text: str, color, offset: int, pos=None, right=None, centery=None, centerx=None) -> None:
+        """Blit text with a black drop shadow offset pixels down and right.
+        
+        The text goes at pos, or is placed by right/centerx and centery.
+        """
+        text_surf, _ = font.render(text, color)
+        shadow_surf, _ = font.render(text, (0, 0, 0))
+        if pos is None:
+            x = right - text_surf.get_width() if right is not None else centerx - text_surf.get_width() // 2
+            pos = (x, centery - text_surf.get_height() // 2)
+        image.blit(shadow_surf, (pos[0] + offset, pos[1] + offset))
+        image.blit(text_surf, pos)
+
+    def draw(self, surface: pygame.Surface, *, hp: int, max_hp: int, ammo_text: str, score: int, current_weapon=None, boss=None, player_pos=None, enemies=None) -> None:
         w, h = surface.get_size()
+        blits = []
         
-        # Professional Health bar with gradient and shadow
+        def add(name, value, build):
+            image, pos = self._widget(name, value, build)
+            if image is not None:
+                blits.append((image, pos))
+        
+        add("health", (hp, max_hp), self._build_health)
+        
+        # Boss health bar (if boss exists)
+        if boss and boss.hp > 0:
+            pulse = int(30 * abs(math.sin(pygame.time.get_ticks() / 100)))
+            add("boss_frame", w, self._build_boss_frame)
+            add("boss_bar", (w, boss.hp, boss.max_hp, boss.phase, pulse), self._build_boss_bar)
+            add("boss_text", (w, boss.hp, boss.max_hp, boss.phase), self._build_boss_text)
+
+        # Ammo/Score text (if font available)
+        if self.font_medium is not None:
+            add("ammo", ammo_text, lambda text: (self.font_medium.render(f"Ammo: {text}", (240, 240, 240))[0], (10, 35)))
+            add("score", score, lambda value: (self.font_medium.render(f"Score: {value}", (240, 240, 240))[0], (10, 60)))
+            if current_weapon:
+                add("weapon", current_weapon.name, self._build_weapon)
+        
+        surface.blits(blits, doreturn=False)
+        
+        # Mini-map (top right corner), once set_level() has baked it
+        if player_pos:
+            self.minimap.draw(surface, player_pos, enemies or [])
+
+    def _build_health(self, value: tuple[int, int]) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Professional health bar with gradient and shadow."""
+        hp, max_hp = value
         bar_w = 200
         bar_h = 24
-        x = 15
-        y = 15
+        image = pygame.Surface((bar_w + 2, bar_h + 2), pygame.SRCALPHA)
         
-        # Shadow
-        shadow_rect = pygame.Rect(x + 2, y + 2, bar_w, bar_h)
-        pygame.draw.rect(surface, (0, 0, 0, 100), shadow_rect, border_radius=6)
+        # Shadow (opaque, as it always came out on the display surface)
+        pygame.draw.rect(image, (0, 0, 0), pygame.Rect(2, 2, bar_w, bar_h), border_radius=6)
         
         # Background frame
-        frame_rect = pygame.Rect(x, y, bar_w, bar_h)
-        pygame.draw.rect(surface, (20, 20, 20), frame_rect, border_radius=6)
-        pygame.draw.rect(surface, (40, 40, 40), frame_rect, width=2, border_radius=6)
+        frame_rect = pygame.Rect(0, 0, bar_w, bar_h)
+        pygame.draw.rect(image, (20, 20, 20), frame_rect, border_radius=6)
+        pygame.draw.rect(image, (40, 40, 40), frame_rect, width=2, border_radius=6)
         
         ratio = max(0.0, min(1.0, hp / max_hp if max_hp else 0))
         
         # Gradient health bar (green -> yellow -> red)
         if ratio > 0:
-            health_rect = pygame.Rect(x + 3, y + 3, int((bar_w - 6) * ratio), bar_h - 6)
+            health_rect = pygame.Rect(3, 3, int((bar_w - 6) * ratio), bar_h - 6)
             if ratio > 0.6:
                 health_color1 = (50, 220, 60)
                 health_color2 = (200, 220, 60)
@@ -68,165 +149,101 @@ class HUD:
                 health_color1 = (255, 100, 60)
                 health_color2 = (220, 60, 60)
             
-            draw_gradient_rect(surface, health_rect, health_color1, health_color2, vertical=False)
+            draw_gradient_rect(image, health_rect, health_color1, health_color2, vertical=False)
             
             # Inner highlight
             if ratio > 0.3:
-                highlight_rect = pygame.Rect(health_rect.x, health_rect.y, health_rect.width, 3)
-                highlight_surf = pygame.Surface((highlight_rect.width, highlight_rect.height), pygame.SRCALPHA)
+                highlight_surf = pygame.Surface((health_rect.width, 3), pygame.SRCALPHA)
                 highlight_surf.fill((255, 255, 255, 60))
-                surface.blit(highlight_surf, highlight_rect)
+                image.blit(highlight_surf, health_rect.topleft)
         
         # Health text overlay with shadow
         if self.font_small:
-            hp_text = f"{hp}/{max_hp}"
-            hp_shadow, _ = self.font_small.render(hp_text, (0, 0, 0))
-            hp_surf, _ = self.font_small.render(hp_text, (255, 255, 255))
-            text_x = x + bar_w // 2 - hp_surf.get_width() // 2
-            text_y = y + bar_h // 2 - hp_surf.get_height() // 2
-            surface.blit(hp_shadow, (text_x + 1, text_y + 1))
-            surface.blit(hp_surf, (text_x, text_y))
-        
-        # Professional Boss health bar (if boss exists)
-        if boss and boss.hp > 0:
-            boss_bar_w = 500
-            boss_bar_h = 32
-            boss_x = w // 2 - boss_bar_w // 2
-            boss_y = 25
-            
-            # Multi-layer shadow
-            for shadow_layer in range(2):
-                shadow_alpha = 50 - (shadow_layer * 20)
-                shadow_surf = pygame.Surface((boss_bar_w, boss_bar_h), pygame.SRCALPHA)
-                shadow_surf.fill((0, 0, 0, shadow_alpha))
-                surface.blit(shadow_surf, (boss_x + 3 - shadow_layer, boss_y + 3 - shadow_layer))
-            
-            # Background frame
-            frame_rect = pygame.Rect(boss_x, boss_y, boss_bar_w, boss_bar_h)
-            pygame.draw.rect(surface, (20, 20, 20), frame_rect, border_radius=8)
-            pygame.draw.rect(surface, (60, 60, 60), frame_rect, width=3, border_radius=8)
-            
-            boss_ratio = max(0.0, min(1.0, boss.hp / boss.max_hp if boss.max_hp else 0))
-            
-            # Color changes by phase with pulsing effect
-            import math
-            pulse = int(30 * abs(math.sin(pygame.time.get_ticks() / 100)))
-            if boss.phase == 3:
-                boss_color1 = (255, 50 + pulse, 50 + pulse)
-                boss_color2 = (255, 100 + pulse, 100 + pulse)
-            elif boss.phase == 2:
-                boss_color1 = (255, 100 + pulse, 50 + pulse)
-                boss_color2 = (255, 150 + pulse, 100 + pulse)
-            else:
-                boss_color1 = (200 + pulse, 0, 0)
-                boss_color2 = (255, 50 + pulse, 50 + pulse)
-            
-            if boss_ratio > 0:
-                health_rect = pygame.Rect(boss_x + 4, boss_y + 4, int((boss_bar_w - 8) * boss_ratio), boss_bar_h - 8)
-                draw_gradient_rect(surface, health_rect, boss_color1, boss_color2, vertical=False)
-                
-                # Pulsing glow effect
-                if pulse > 10:
-                    glow_surf = pygame.Surface((health_rect.width, health_rect.height), pygame.SRCALPHA)
-                    glow_surf.fill((255, 255, 255, pulse // 3))
-                    surface.blit(glow_surf, health_rect)
-            
-            # Boss label with phase indicator
-            if self.font_small:
-                boss_label = f"BOSS - Phase {boss.phase}"
-                boss_shadow, _ = self.font_small.render(boss_label, (0, 0, 0))
-                boss_surf, _ = self.font_small.render(boss_label, S.BITCOIN_GOLD)
-                surface.blit(boss_shadow, (boss_x + 2, boss_y - 22 + 2))
-                surface.blit(boss_surf, (boss_x, boss_y - 22))
-                
-                # HP text with shadow
-                boss_hp_text = f"{boss.hp}/{boss.max_hp}"
-                hp_shadow, _ = self.font_small.render(boss_hp_text, (0, 0, 0))
-                hp_surf, _ = self.font_small.render(boss_hp_text, (255, 255, 255))
-                hp_text_x = boss_x + boss_bar_w - hp_surf.get_width() - 8
-                hp_text_y = boss_y + boss_bar_h // 2 - hp_surf.get_height() // 2
-                surface.blit(hp_shadow, (hp_text_x + 1, hp_text_y + 1))
-                surface.blit(hp_surf, (hp_text_x, hp_text_y))
-
-        # Ammo/Score text (if font available) - Enhanced layout
-        if self.font_medium is not None:
-            ammo_surf, _ = self.font_medium.render(f"Ammo: {ammo_text}", (240, 240, 240))
-            surface.blit(ammo_surf, (10, 35))
-            score_surf, _ = self.font_medium.render(f"Score: {score}", (240, 240, 240))
-            surface.blit(score_surf, (10, 60))
-            
-            # Weapon name with icon indicator
-            if current_weapon:
-                weapon_surf, _ = self.font_small.render(f"Miner: {current_weapon.name}", S.BITCOIN_GOLD)
-                surface.blit(weapon_surf, (10, 85))
-                
-                # Weapon icon (simple colored square)
-                icon_size = 12
-                icon_x = 10
-                icon_y = 87
-                weapon_colors = {
-                    "Hash Power": (200, 200, 200),
-                    "Mining Rig": (255, 200, 0),
-                    "Lightning": (100, 200, 255),
-                    "ASIC Miner": S.BITCOIN_ORANGE,
-                    "Rapid Miner": (255, 100, 100),
-                    "Precision Miner": (100, 255, 100),
-                    "Explosive Miner": (255, 50, 50),
-                }
-                icon_color = weapon_colors.get(current_weapon.name, (255, 255, 255))
-                pygame.draw.rect(surface, icon_color, (icon_x, icon_y, icon_size, icon_size))
-                pygame.draw.rect(surface, (255, 255, 255), (icon_x, icon_y, icon_size, icon_size), 1)
-        
-        # Mini-map (top right corner)
-        if player_pos and level_size:
-            self._draw_minimap(surface, player_pos, level_size, enemies or [])
-    
-    def _draw_minimap(self, surface: pygame.Surface, player_pos: tuple, level_size: tuple, enemies: list) -> None:
-        """Draw a professional mini-map in the top right corner."""
-        w, h = surface.get_size()
-        minimap_size = 140
-        minimap_x = w - minimap_size - 15
-        minimap_y = 15
-        minimap_rect = pygame.Rect(minimap_x, minimap_y, minimap_size, minimap_size)
-        
-        # Shadow
-        shadow_rect = pygame.Rect(minimap_x + 3, minimap_y + 3, minimap_size, minimap_size)
-        shadow_surf = pygame.Surface((minimap_size, minimap_size), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 100))
-        surface.blit(shadow_surf, shadow_rect)
-        
-        # Background with gradient
-        draw_gradient_rect(surface, minimap_rect, (25, 25, 30), (35, 35, 40), vertical=True)
-        pygame.draw.rect(surface, (80, 80, 100), minimap_rect, width=2, border_radius=6)
-        
-        # Inner border highlight
-        inner_rect = pygame.Rect(minimap_rect.x + 2, minimap_rect.y + 2, minimap_rect.width - 4, 3)
-        highlight_surf = pygame.Surface((inner_rect.width, inner_rect.height), pygame.SRCALPHA)
-        highlight_surf.fill((255, 255, 255, 30))
-        surface.blit(highlight_surf, inner_rect)
-        
-        # Scale factors
-        scale_x = minimap_size / level_size[0] if level_size[0] > 0 else 1
-        scale_y = minimap_size / level_size[1] if level_size[1] > 0 else 1
-        
-        # Draw player position
-        player_map_x = minimap_x + int(player_pos[0] * scale_x)
-        player_map_y = minimap_y + int(player_pos[1] * scale_y)
-        if minimap_rect.collidepoint(player_map_x, player_map_y):
-            pygame.draw.circle(surface, (0, 255, 0), (player_map_x, player_map_y), 3)
-            pygame.draw.circle(surface, (255, 255, 255), (player_map_x, player_map_y), 3, 1)
-        
-        # Draw enemy positions
-        for enemy in enemies:
-            if hasattr(enemy, 'rect'):
-                enemy_map_x = minimap_x + int(enemy.rect.centerx * scale_x)
-                enemy_map_y = minimap_y + int(enemy.rect.centery * scale_y)
-                if minimap_rect.collidepoint(enemy_map_x, enemy_map_y):
-                    pygame.draw.circle(surface, (255, 0, 0), (enemy_map_x, enemy_map_y), 2)
-        
-        # Label
-        if self.font_small:
-            label, _ = self.font_small.render("Map", (200, 200, 200))
-            surface.blit(label, (minimap_x, minimap_y - 18))
+            self._blit_shadowed(image, self.font_small, f"{hp}/{max_hp}", (255, 255, 255), 1, centerx=bar_w // 2, centery=bar_h // 2)
+        return image, (15, 15)
 
+    def _build_boss_frame(self, w: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Boss bar shadow and frame."""
+        boss_bar_w = 500
+        boss_bar_h = 32
+        image = pygame.Surface((boss_bar_w + 3, boss_bar_h + 3), pygame.SRCALPHA)
+        
+        # Multi-layer shadow
+        for shadow_layer in range(2):
+            shadow_alpha = 50 - (shadow_layer * 20)
+            shadow_surf = pygame.Surface((boss_bar_w, boss_bar_h), pygame.SRCALPHA)
+            shadow_surf.fill((0, 0, 0, shadow_alpha))
+            image.blit(shadow_surf, (3 - shadow_layer, 3 - shadow_layer))
+        
+        # Background frame
+        frame_rect = pygame.Rect(0, 0, boss_bar_w, boss_bar_h)
+        pygame.draw.rect(image, (20, 20, 20), frame_rect, border_radius=8)
+        pygame.draw.rect(image, (60, 60, 60), frame_rect, width=3, border_radius=8)
+        return image, (w // 2 - boss_bar_w // 2, 25)
 
+    def _build_boss_bar(self, value: tuple[int, int, int, int, int]) -> tuple[pygame.Surface | None, tuple[int, int]]:
+        """Boss health bar, colored by phase with a pulsing glow."""
+        w, boss_hp, boss_max_hp, phase, pulse = value
+        boss_bar_w = 500
+        boss_bar_h = 32
+        boss_x = w // 2 - boss_bar_w // 2
+        boss_y = 25
+        boss_ratio = max(0.0, min(1.0, boss_hp / boss_max_hp if boss_max_hp else 0))
+        bar_width = int((boss_bar_w - 8) * boss_ratio)
+        pos = (boss_x + 4, boss_y + 4)
+        if bar_width <= 0:
+            return None, pos
+        
+        if phase == 3:
+            boss_color1 = (255, 50 + pulse, 50 + pulse)
+            boss_color2 = (255, 100 + pulse, 100 + pulse)
+        elif phase == 2:
+            boss_color1 = (255, 100 + pulse, 50 + pulse)
+            boss_color2 = (255, 150 + pulse, 100 + pulse)
+        else:
+            boss_color1 = (200 + pulse, 0, 0)
+            boss_color2 = (255, 50 + pulse, 50 + pulse)
+        
+        # draw_gradient_rect's lines reach one pixel below the rect
+        health_rect = pygame.Rect(0, 0, bar_width, boss_bar_h - 8)
+        image = pygame.Surface((health_rect.width, health_rect.height + 1))
+        draw_gradient_rect(image, health_rect, boss_color1, boss_color2, vertical=False)
+        
+        # Pulsing glow effect
+        if pulse > 10:
+            glow_surf = pygame.Surface(health_rect.size, pygame.SRCALPHA)
+            glow_surf.fill((255, 255, 255, pulse // 3))
+            image.blit(glow_surf, (0, 0))
+        
+        return image, pos
+
+    def _build_boss_text(self, value: tuple[int, int, int, int]) -> tuple[pygame.Surface | None, tuple[int, int]]:
+        """Boss label with phase indicator and hp text."""
+        w, boss_hp, boss_max_hp, phase = value
+        boss_bar_w = 500
+        boss_bar_h = 32
+        pos = (w // 2 - boss_bar_w // 2, 25 - 22)
+        if not self.font_small:
+            return None, pos
+        image = pygame.Surface((boss_bar_w, boss_bar_h + 22), pygame.SRCALPHA)
+        
+        self._blit_shadowed(image, self.font_small, f"BOSS - Phase {phase}", S.BITCOIN_GOLD, 2, pos=(0, 0))
+        
+        # HP text with shadow, right-aligned inside the bar
+        self._blit_shadowed(image, self.font_small, f"{boss_hp}/{boss_max_hp}", (255, 255, 255), 1,
+                            right=boss_bar_w - 8, centery=22 + boss_bar_h // 2)
+        return image, pos
+
+    def _build_weapon(self, name: str) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Weapon name with icon indicator."""
+        weapon_surf, _ = self.font_small.render(f"Miner: {name}", S.BITCOIN_GOLD)
+        icon_size = 12
+        icon_y = 2
+        image = pygame.Surface((max(weapon_surf.get_width(), icon_size), max(weapon_surf.get_height(), icon_y + icon_size)), pygame.SRCALPHA)
+        image.blit(weapon_surf, (0, 0))
+        
+        # Weapon icon (simple colored square)
+        icon_color = WEAPON_ICON_COLORS.get(name, (255, 255, 255))
+        pygame.draw.rect(image, icon_color, (0, icon_y, icon_size, icon_size))
+        pygame.draw.rect(image, (255, 255, 255), (0, icon_y, icon_size, icon_size), 1)
+        return image, (10, 85)
@@ -0,0 +1,124 @@
+"""Cached static layers for menu screens.
+
+Menu screens used to redraw every gradient, shadow and label each frame even
+though almost nothing changes while one is open. MenuLayers renders a menu
+once into a static layer and, from then on, only repaints what changes: the
+button under the mouse (from a hover patch rendered once per button) and an
+optional animated sprite such as the pulsing title. show() returns the
+changed screen areas for pygame.display.update().
+"""
+from __future__ import annotations
+
+from typing import Callable, Hashable
+
+import pygame
+
+
+# Extra pixels around a button rect kept in its hover patch, for borders
+# drawn on the rect's edge
+PATCH_MARGIN = 4
+
+# draw(surface, mouse_pos) draws the whole menu and returns its button rects
+MenuDraw = Callable[[pygame.Surface, "tuple[int, int] | None"], "dict[str, pygame.Rect]"]
+# animate(screen_size) returns the sprite to show this frame and its position
+MenuAnimation = Callable[[tuple[int, int]], "tuple[pygame.Surface, tuple[int, int]] | None"]
+
+
+class MenuLayers:
+    """Static layer, hover patches and animated sprite of the menu on screen.
+
+    The cached layer is keyed by whatever the caller passes as key (menu name
+    plus anything its static content depends on, e.g. the score shown).
+    """
+
+    def __init__(self):
+        self._key: Hashable | None = None
+        self._static: pygame.Surface | None = None
+        self._buttons: dict[str, pygame.Rect] = {}
+        self._patches: dict[str, tuple[pygame.Surface, pygame.Rect]] = {}
+        self._hovered: str | None = None
+        self._sprite: pygame.Surface | None = None
+        self._sprite_rect: pygame.Rect | None = None
+
+    def invalidate(self) -> None:
+        """Forget the cached menu; the next show() redraws the whole screen."""
+        self._key = None
+        self._static = None
+        self._patches.clear()
+
+    def show(
+        self,
+        screen: pygame.Surface,
+        key: Hashable,
+        draw: MenuDraw,
+        mouse_pos: tuple[int, int] | None,
+        animate: MenuAnimation | None = None
+    ) -> tuple[dict[str, pygame.Rect], list[pygame.Rect]]:
+        """Bring the menu on screen up to date. Returns (button rects, changed rects).
+
+        A new key (or screen size) renders the static layer and returns the
+        whole screen as changed; otherwise only hover and animation changes
+        are drawn.
+        """
+        size = screen.get_size()
+        dirty: list[pygame.Rect] = []
+        if self._static is None or self._key != (key, size):
+            self._build(size, key, draw)
+            screen.blit(self._static, (0, 0))
+            dirty.append(screen.get_rect())
+
+        hovered = None
+        if mouse_pos is not None:
+            for name, rect in self._buttons.items():
+                if rect.collidepoint(mouse_pos):
+                    hovered = name
+                    break
+        if hovered != self._hovered:
+            if self._hovered is not None:
+                dirty.append(self._restore(screen, self._patch(self._hovered, draw)[1]))
+            if hovered is not None:
+                patch, area = self._patch(hovered, draw)
+                dirty.append(screen.blit(patch, area))
+            self._hovered = hovered
+
+        if animate is not None:
+            frame = animate(size)
+            sprite, pos = frame if frame is not None else (None, None)
+            moved = self._sprite_rect is not None and pos != self._sprite_rect.topleft
+            # A hover patch drawn over the sprite means it has to be put back on top
+            covered = self._sprite_rect is not None and self._sprite_rect.collidelist(dirty) != -1
+            if sprite is not self._sprite or moved or covered:
+                if self._sprite_rect is not None:
+                    dirty.append(self._restore(screen, self._sprite_rect))
+                self._sprite_rect = screen.blit(sprite, pos) if sprite is not None else None
+                if self._sprite_rect is not None:
+                    dirty.append(self._sprite_rect)
+                self._sprite = sprite
+        return self._buttons, dirty
+
+    def _build(self, size: tuple[int, int], key: Hashable, draw: MenuDraw) -> None:
+        static = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            static = static.convert()
+        self._buttons = dict(draw(static, None) or {})
+        self._static = static
+        self._key = (key, size)
+        self._patches.clear()
+        self._hovered = None
+        self._sprite = None
+        self._sprite_rect = None
+
+    def _patch(self, name: str, draw: MenuDraw) -> tuple[pygame.Surface, pygame.Rect]:
+        """The screen area around button name as drawn while hovered, rendered once."""
+        patch = self._patches.get(name)
+        if patch is None:
+            scratch = self._static.copy()
+            draw(scratch, self._buttons[name].center)
+            area = self._buttons[name].inflate(PATCH_MARGIN * 2, PATCH_MARGIN * 2).clip(scratch.get_rect())
+            patch = (scratch.subsurface(area).copy(), area)
+            self._patches[name] = patch
+        return patch
+
+    def _restore(self, screen: pygame.Surface, area: pygame.Rect) -> pygame.Rect:
+        """Copy the static layer back over area."""
+        return screen.blit(self._static, area.topleft, area)
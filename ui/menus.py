@@ -5,6 +5,7 @@ import pygame
 from pathlib import Path
 
 import settings as S
+from utils.asset_manifest import find_level_files
 
 
 def draw_dim(surface: pygame.Surface, alpha: int = 160) -> None:
@@ -31,7 +32,45 @@ def draw_gradient_rect(surface: pygame.Surface, rect: pygame.Rect, color1: tuple
             pygame.draw.line(surface, (r, g, b), (rect.x + x, rect.y), (rect.x + x, rect.y + rect.height))
 
 
-def draw_center_text(surface: pygame.Surface, lines: list[str], tick_ms: int = 0) -> None:
+# Rendered pulsing titles (text and shadow) keyed by (text, green value)
+_pulsing_titles: dict[tuple[str, int], pygame.Surface] = {}
+_title_font = None
+
+
+def _render_pulsing_title(text: str, tick_ms: int) -> pygame.Surface | None:
+    """Title text with its drop shadow in the color for tick_ms, rendered once per color."""
+    global _title_font
+    # Pulsing glow color
+    pulse = (math.sin(tick_ms / 500.0) + 1) / 2
+    glow_intensity = int(50 + pulse * 30)
+    # Clamp color values to valid range [0, 255]
+    green_val = min(255, max(0, 200 + glow_intensity))
+    key = (text, green_val)
+    title = _pulsing_titles.get(key)
+    if title is None:
+        try:
+            import pygame.freetype as ft
+            if _title_font is None:
+                _title_font = ft.Font(None, 90)
+        except Exception:
+            return None
+        shadow_surf, _ = _title_font.render(text, (0, 0, 0))
+        text_surf, _ = _title_font.render(text, (255, green_val, 50))
+        title = pygame.Surface((text_surf.get_width() + 3, text_surf.get_height() + 3), pygame.SRCALPHA)
+        title.blit(shadow_surf, (3, 3))
+        title.blit(text_surf, (0, 0))
+        _pulsing_titles[key] = title
+    return title
+
+
+def draw_pulsing_title(surface: pygame.Surface, text: str, y: int, tick_ms: int = 0) -> None:
+    """Draw a horizontally centered pulsing title at y."""
+    title = _render_pulsing_title(text, tick_ms)
+    if title is not None:
+        surface.blit(title, (surface.get_width() // 2 - (title.get_width() - 3) // 2, y))
+
+
+def draw_center_text(surface: pygame.Surface, lines: list[str], tick_ms: int = 0, draw_title: bool = True) -> None:
     try:
         import pygame.freetype as ft
         font_title = ft.Font(None, 90)
@@ -48,22 +87,9 @@ def draw_center_text(surface: pygame.Surface, lines: list[str], tick_ms: int = 0
         return
     
     if lines:
-        # Title with glow effect
-        title_text = lines[0]
-        # Pulsing glow color
-        pulse = (math.sin(tick_ms / 500.0) + 1) / 2
-        glow_intensity = int(50 + pulse * 30)
-        # Clamp color values to valid range [0, 255]
-        green_val = min(255, max(0, 200 + glow_intensity))
-        title_color = (255, green_val, 50)
-        
-        # Shadow
-        shadow_surf, _ = font_title.render(title_text, (0, 0, 0))
-        surface.blit(shadow_surf, (w // 2 - shadow_surf.get_width() // 2 + 3, y + 3))
-        
-        # Main text
-        title_surf, _ = font_title.render(title_text, title_color)
-        surface.blit(title_surf, (w // 2 - title_surf.get_width() // 2, y))
+        # Title with pulsing glow (left out when it is animated separately)
+        if draw_title:
+            draw_pulsing_title(surface, lines[0], y, tick_ms)
         y += 90
     
     for line in lines[1:]:
@@ -136,8 +162,26 @@ def _draw_button(surface: pygame.Surface, rect: pygame.Rect, text: str, hovered:
             pygame.draw.line(surface, fg, (rect.left + 10, cy), (rect.right - 10, cy), 2)
 
 
-def draw_start_menu(surface: pygame.Surface, mouse_pos: tuple[int, int] | None = None, tick_ms: int = 0) -> dict[str, pygame.Rect]:
-    """Draw Bitcoin-themed start menu with improved design."""
+START_MENU_TITLE = "Bitcoin Miner Platformer"
+
+
+def get_start_title(size: tuple[int, int], tick_ms: int = 0) -> tuple[pygame.Surface, tuple[int, int]] | None:
+    """The start menu's pulsing title for tick_ms and where it goes on a size screen.
+    
+    The same surface is returned for as long as the title color does not change.
+    """
+    title = _render_pulsing_title(START_MENU_TITLE, tick_ms)
+    if title is None:
+        return None
+    w, h = size
+    return title, (w // 2 - (title.get_width() - 3) // 2, h // 2 - 140)
+
+
+def draw_start_menu(surface: pygame.Surface, mouse_pos: tuple[int, int] | None = None, tick_ms: int = 0, draw_title: bool = True) -> dict[str, pygame.Rect]:
+    """Draw Bitcoin-themed start menu with improved design.
+    
+    draw_title=False leaves out the pulsing title (see get_start_title).
+    """
     # Enhanced background with gradient
     w, h = surface.get_size()
     
@@ -173,11 +217,11 @@ def draw_start_menu(surface: pygame.Surface, mouse_pos: tuple[int, int] | None =
             pygame.draw.circle(surface, S.BITCOIN_ORANGE, (i, j), 2)
     
     draw_center_text(surface, [
-        "Bitcoin Miner Platformer",
+        START_MENU_TITLE,
         "Mine Bitcoin and defeat hackers!",
         "F to Mine • Arrows/A/D to Move • Space to Jump",
         "Q/E to Switch Weapons • Esc/P to Pause",
-    ], tick_ms)
+    ], tick_ms, draw_title)
     
     buttons: dict[str, pygame.Rect] = {}
     btn_w, btn_h = 320, 55
@@ -399,11 +443,8 @@ def get_available_levels() -> list[tuple[str, Path]]:
     levels_dir = Path("levels")
     levels: list[tuple[str, Path]] = []
     
-    if not levels_dir.exists():
-        return levels
-    
-    # Find all CSV files
-    for csv_file in sorted(levels_dir.glob("*.csv")):
+    # Find all CSV files (listed in the asset manifest when available)
+    for csv_file in find_level_files(levels_dir):
         # Extract level name (e.g., "level1.csv" -> "Level 1")
         name = csv_file.stem
         # Format nicely: "level1" -> "Level 1", "level_2" -> "Level 2"
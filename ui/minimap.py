@@ -0,0 +1,158 @@
+"""HUD minimap with fog of war.
+
+The map of the level's solid tiles is baked once per level into a terrain
+surface. What is shown is a copy of it covered in fog; as the player moves,
+only the cells newly revealed around them are copied over from the terrain.
+Per frame the finished map is one blit, plus the dots for the player and
+the enemies.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+
+MINIMAP_SIZE = 140
+MINIMAP_MARGIN = 15
+FOG_CELL = 4  # Minimap pixels per fog-of-war cell
+REVEAL_RADIUS = 300  # World pixels around the player revealed on the map
+LABEL_HEIGHT = 18
+SHADOW_OFFSET = 3
+
+BACKGROUND_TOP = (25, 25, 30)
+BACKGROUND_BOTTOM = (35, 35, 40)
+BORDER_COLOR = (80, 80, 100)
+SOLID_COLOR = (95, 95, 120)
+FOG_COLOR = (12, 12, 16)
+
+
+class Minimap:
+    """Baked terrain map of one level plus the explored cells of it."""
+
+    def __init__(self, font=None) -> None:
+        self.font = font
+        self.size = MINIMAP_SIZE
+        self.level_size = (0, 0)
+        self.terrain: pygame.Surface | None = None
+        # Label, shadow and map, drawn with a single blit
+        self.image: pygame.Surface | None = None
+        # Bitset of explored FOG_CELL x FOG_CELL blocks of the map: one bit per
+        # cell, each row packed into bytes (np.packbits order, first cell in
+        # the high bit)
+        self.cells = (self.size + FOG_CELL - 1) // FOG_CELL
+        self.explored = np.zeros((self.cells, (self.cells + 7) // 8), dtype=np.uint8)
+        self._last_cell: tuple[int, int] | None = None
+
+    def bake(self, level_size: tuple[int, int], solid_mask: np.ndarray | None = None) -> None:
+        """Build the map for a level of level_size pixels and fog all of it.
+
+        solid_mask is the level's solid tiles resampled to the map size,
+        shape (size, size); without it the map has no terrain.
+        """
+        size = self.size
+        self.level_size = level_size
+        terrain = pygame.Surface((size, size))
+        # Background gradient
+        for y in range(size):
+            ratio = y / size
+            color = [int(top * (1 - ratio) + bottom * ratio) for top, bottom in zip(BACKGROUND_TOP, BACKGROUND_BOTTOM)]
+            pygame.draw.line(terrain, color, (0, y), (size, y))
+        if solid_mask is not None and solid_mask.any():
+            pixels = pygame.surfarray.pixels3d(terrain)
+            pixels[solid_mask.T] = SOLID_COLOR
+            del pixels
+        self._draw_frame(terrain)
+        self.terrain = terrain
+
+        image = pygame.Surface((size + SHADOW_OFFSET, LABEL_HEIGHT + size + SHADOW_OFFSET), pygame.SRCALPHA)
+        if self.font:
+            label, _ = self.font.render("Map", (200, 200, 200))
+            image.blit(label, (0, 0))
+        image.fill((0, 0, 0, 100), (SHADOW_OFFSET, LABEL_HEIGHT + SHADOW_OFFSET, size, size))
+        map_area = image.subsurface((0, LABEL_HEIGHT, size, size))
+        map_area.fill(FOG_COLOR)
+        self._draw_frame(map_area)
+        self.image = image
+        self.explored[:] = 0
+        self._last_cell = None
+
+    def _draw_frame(self, surface: pygame.Surface) -> None:
+        """Border and inner highlight, drawn over terrain and fog alike."""
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, BORDER_COLOR, rect, width=2, border_radius=6)
+        highlight_surf = pygame.Surface((rect.width - 4, 3), pygame.SRCALPHA)
+        highlight_surf.fill((255, 255, 255, 30))
+        surface.blit(highlight_surf, (2, 2))
+
+    def _scale(self) -> tuple[float, float]:
+        level_w, level_h = self.level_size
+        return (self.size / level_w if level_w > 0 else 1, self.size / level_h if level_h > 0 else 1)
+
+    def reveal(self, world_pos: tuple[float, float]) -> int:
+        """Uncover the cells within REVEAL_RADIUS of world_pos. Returns how many were new."""
+        if self.image is None:
+            return 0
+        scale_x, scale_y = self._scale()
+        cell = (int(world_pos[0] * scale_x) // FOG_CELL, int(world_pos[1] * scale_y) // FOG_CELL)
+        if cell == self._last_cell:
+            return 0
+        self._last_cell = cell
+
+        # Only the cells in the radius' bounding box need testing
+        cells_h = cells_w = self.cells
+        x0 = max(0, int((world_pos[0] - REVEAL_RADIUS) * scale_x) // FOG_CELL)
+        x1 = min(cells_w, int((world_pos[0] + REVEAL_RADIUS) * scale_x) // FOG_CELL + 1)
+        y0 = max(0, int((world_pos[1] - REVEAL_RADIUS) * scale_y) // FOG_CELL)
+        y1 = min(cells_h, int((world_pos[1] + REVEAL_RADIUS) * scale_y) // FOG_CELL + 1)
+        if x0 >= x1 or y0 >= y1:
+            return 0
+        centers_x = (np.arange(x0, x1) + 0.5) * FOG_CELL / scale_x
+        centers_y = (np.arange(y0, y1) + 0.5) * FOG_CELL / scale_y
+        near = ((centers_x[None, :] - world_pos[0]) ** 2 + (centers_y[:, None] - world_pos[1]) ** 2) <= REVEAL_RADIUS ** 2
+        rows_explored = np.unpackbits(self.explored[y0:y1], axis=1, count=cells_w).astype(bool)
+        new = near & ~rows_explored[:, x0:x1]
+        if not new.any():
+            return 0
+        rows_explored[:, x0:x1] |= new
+        self.explored[y0:y1] = np.packbits(rows_explored, axis=1)
+
+        rows, cols = np.nonzero(new)
+        self.image.blits([
+            (self.terrain, ((x0 + col) * FOG_CELL, LABEL_HEIGHT + (y0 + row) * FOG_CELL),
+             ((x0 + col) * FOG_CELL, (y0 + row) * FOG_CELL, FOG_CELL, FOG_CELL))
+            for row, col in zip(rows.tolist(), cols.tolist())
+        ], doreturn=False)
+        return len(rows)
+
+    def is_explored(self, map_pos: tuple[int, int]) -> bool:
+        """Whether the cell under a point in map coordinates has been revealed."""
+        col = map_pos[0] // FOG_CELL
+        return bool(self.explored[map_pos[1] // FOG_CELL, col >> 3] & (0x80 >> (col & 7)))
+
+    def explored_count(self) -> int:
+        """Number of cells revealed so far."""
+        return int(np.unpackbits(self.explored).sum())
+
+    def draw(self, surface: pygame.Surface, player_pos: tuple, enemies) -> None:
+        """Blit the map to the top right corner with the player and the enemies seen so far."""
+        if self.image is None:
+            return
+        self.reveal(player_pos)
+        minimap_x = surface.get_width() - self.size - MINIMAP_MARGIN
+        minimap_y = MINIMAP_MARGIN
+        surface.blit(self.image, (minimap_x, minimap_y - LABEL_HEIGHT))
+        bounds = pygame.Rect(0, 0, self.size, self.size)
+        scale_x, scale_y = self._scale()
+
+        # Enemies show up only in explored parts of the map
+        for enemy in enemies:
+            if hasattr(enemy, 'rect'):
+                map_pos = (int(enemy.rect.centerx * scale_x), int(enemy.rect.centery * scale_y))
+                if bounds.collidepoint(map_pos) and self.is_explored(map_pos):
+                    pygame.draw.circle(surface, (255, 0, 0), (minimap_x + map_pos[0], minimap_y + map_pos[1]), 2)
+
+        player_map_pos = (int(player_pos[0] * scale_x), int(player_pos[1] * scale_y))
+        if bounds.collidepoint(player_map_pos):
+            center = (minimap_x + player_map_pos[0], minimap_y + player_map_pos[1])
+            pygame.draw.circle(surface, (0, 255, 0), center, 3)
+            pygame.draw.circle(surface, (255, 255, 255), center, 3, 1)
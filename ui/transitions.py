@@ -24,3 +24,22 @@ def blur_and_dim(surface: pygame.Surface, *, scale_factor: float = 0.25, dim_alp
     fade_overlay(surface, dim_alpha)
 
 
+
+
+def make_backdrop(frame: pygame.Surface, size: tuple[int, int], *, blur_scale: float | None = None, dim_alpha: int = 140) -> pygame.Surface:
+    """Return a new surface of the given size holding frame scaled, optionally blurred, and dimmed.
+
+    Built once when an overlay screen opens, so the menu only has to blit it.
+    """
+    if blur_scale is not None:
+        w, h = frame.get_size()
+        small_size = (max(1, int(w * blur_scale)), max(1, int(h * blur_scale)))
+        backdrop = pygame.transform.smoothscale(pygame.transform.smoothscale(frame, small_size), size)
+    elif frame.get_size() != tuple(size):
+        backdrop = pygame.transform.scale(frame, size)
+    else:
+        backdrop = frame.copy()
+    # Darken by multiplying, the same as a black overlay at dim_alpha
+    keep = 255 - max(0, min(255, dim_alpha))
+    backdrop.fill((keep, keep, keep), special_flags=pygame.BLEND_MULT)
+    return backdrop
@@ -4,9 +4,49 @@ from __future__ import annotations
 from pathlib import Path
 import pygame
 
+import settings as S
+
+
+# Counts reported by get_image_stats()
+_image_stats = {"loaded": 0, "converted": 0, "rle": 0}
+
+
+def prepare_surface(img: pygame.Surface, rle: bool = S.RLE_COLORKEY_SPRITES) -> pygame.Surface:
+    """Convert a decoded image to the display pixel format.
+    
+    Images with per-pixel alpha use convert_alpha(), opaque ones convert().
+    Colorkeyed images keep their colorkey, with RLE acceleration if rle is
+    set. Before the display exists the image is returned unconverted, so
+    load images after pygame.display.set_mode().
+    """
+    _image_stats["loaded"] += 1
+    if pygame.display.get_surface() is None:
+        return img
+    colorkey = img.get_colorkey()
+    if colorkey is not None:
+        img = img.convert()
+        if rle:
+            img.set_colorkey(colorkey, pygame.RLEACCEL)
+            _image_stats["rle"] += 1
+        else:
+            img.set_colorkey(colorkey)
+    elif img.get_flags() & pygame.SRCALPHA:
+        img = img.convert_alpha()
+    else:
+        img = img.convert()
+    _image_stats["converted"] += 1
+    return img
+
+
+def get_image_stats() -> dict[str, int]:
+    """How many images load_image() returned, converted and RLE-accelerated."""
+    stats = dict(_image_stats)
+    stats["unconverted"] = stats["loaded"] - stats["converted"]
+    return stats
+
 
 def load_image(path: str | Path) -> pygame.Surface | None:
-    """Load an image file, return None if not found."""
+    """Load an image file in display format, return None if not found."""
     path_str = str(path)
     
     # Try PIL/Pillow first (more reliable for PNG)
@@ -15,6 +55,9 @@ def load_image(path: str | Path) -> pygame.Surface | None:
         pil_img = Image.open(path_str)
         if pil_img.mode != 'RGBA':
             pil_img = pil_img.convert('RGBA')
+        # Fully opaque images don't need an alpha channel
+        if pil_img.getextrema()[3][0] == 255:
+            pil_img = pil_img.convert('RGB')
         # Convert to pygame Surface
         mode = pil_img.mode
         size = pil_img.size
@@ -24,7 +67,8 @@ def load_image(path: str | Path) -> pygame.Surface | None:
             img = pygame.image.frombuffer(data, size, mode)
         except AttributeError:
             img = pygame.image.fromstring(data, size, mode)
-        return img
+        # Converting also copies the pixels out of the PIL buffer
+        return prepare_surface(img)
     except ImportError:
         # PIL not available, fall through to pygame
         pass
@@ -35,11 +79,9 @@ def load_image(path: str | Path) -> pygame.Surface | None:
     # Fallback to pygame
     try:
         img = pygame.image.load(path_str)
-        if img.get_flags() & pygame.SRCALPHA:
-            return img.convert_alpha()
-        return img.convert()
     except Exception:
         return None
+    return prepare_surface(img)
 
 
 class Animation:
@@ -90,100 +132,141 @@ def split_sprite_sheet(image: pygame.Surface, frame_width: int, frame_height: in
     return frames
 
 
-def load_animation_sequence(base_path: Path, pattern: str, frame_count: int | None = None) -> list[pygame.Surface]:
-    """Load animation frames from numbered files or sprite sheet.
+def _image_size(path: Path) -> tuple[int, int] | None:
+    """Pixel size of an image file, reading only its header when PIL is available."""
+    try:
+        from PIL import Image
+        with Image.open(path) as pil_img:
+            return pil_img.size
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    img = load_image(path)
+    return img.get_size() if img else None
+
+
+def describe_animation_sequence(base_path: Path, pattern: str, frame_count: int | None = None) -> dict | None:
+    """Find the files behind an animation without decoding them.
     
     Tries:
     1. Numbered files: pattern1.png, pattern2.png, ...
     2. Single sprite sheet: pattern.png (tries to auto-detect frame count from filename)
     3. Single image as one frame
     4. Case-insensitive search
-    """
-    frames = []
     
+    Returns {"files": [...], "frame_size": [w, h] or None}, or None if nothing
+    matches. With a frame size the single file is a sheet split into frames of
+    that size; otherwise every file is one frame. This is what the asset
+    manifest stores.
+    """
     # Try numbered files first
     if frame_count:
+        files = []
         for i in range(1, frame_count + 1):
             path = base_path / f"{pattern}{i}.png"
             if not path.exists():
                 path = base_path / f"{pattern}_{i}.png"
             if path.exists():
-                img = load_image(path)
-                if img:
-                    frames.append(img)
+                files.append(path.as_posix())
+        if files:
+            return {"files": files, "frame_size": None}
     
     # If no numbered files, try single file (might be sprite sheet)
-    if not frames:
-        # Try exact match first
-        single_path = base_path / f"{pattern}.png"
-        if not single_path.exists():
-            # Try case variations
-            single_path_lower = base_path / f"{pattern.lower()}.png"
-            single_path_upper = base_path / f"{pattern[0].upper() + pattern[1:]}.png"
-            if single_path_lower.exists():
-                single_path = single_path_lower
-            elif single_path_upper.exists():
-                single_path = single_path_upper
+    # Try exact match first
+    single_path = base_path / f"{pattern}.png"
+    if not single_path.exists():
+        # Try case variations
+        single_path_lower = base_path / f"{pattern.lower()}.png"
+        single_path_upper = base_path / f"{pattern[0].upper() + pattern[1:]}.png"
+        if single_path_lower.exists():
+            single_path = single_path_lower
+        elif single_path_upper.exists():
+            single_path = single_path_upper
+        else:
+            # Try finding any file that starts with pattern (case-insensitive)
+            pattern_lower = pattern.lower()
+            for file in base_path.glob("*.png"):
+                file_stem_lower = file.stem.lower()
+                if file_stem_lower.startswith(pattern_lower) or pattern_lower in file_stem_lower:
+                    single_path = file
+                    break
             else:
-                # Try finding any file that starts with pattern (case-insensitive)
-                pattern_lower = pattern.lower()
-                for file in base_path.glob("*.png"):
-                    file_stem_lower = file.stem.lower()
-                    if file_stem_lower.startswith(pattern_lower) or pattern_lower in file_stem_lower:
-                        single_path = file
-                        break
-                else:
-                    single_path = None  # No file found
-        
-        if single_path and single_path.exists():
-            try:
-                img = load_image(single_path)
-                if not img:
-                    frames = []
-                    return frames
-                w, h = img.get_size()
-                
-                # Check filename for frame count hint (e.g., "Walk_6.png" or "Idle_4.png")
-                frame_count_hint = None
-                # Try from pattern first
-                if "_" in pattern:
-                    parts = pattern.split("_")
-                    if parts[-1].isdigit():
-                        frame_count_hint = int(parts[-1])
-                # Also try from actual filename
-                if not frame_count_hint and single_path:
-                    filename_parts = single_path.stem.split("_")
-                    if filename_parts[-1].isdigit():
-                        frame_count_hint = int(filename_parts[-1])
-                
-                # If we have a hint, split sprite sheet horizontally
-                if frame_count_hint and frame_count_hint > 1:
-                    frame_w = w // frame_count_hint
-                    if frame_w > 0 and frame_w <= w:
-                        frames = split_sprite_sheet(img, frame_w, h)
-                
-                # If splitting failed or no hint, try common frame widths
-                if not frames:
-                    # Try common frame widths (16, 32, 48, 64)
-                    for test_w in [32, 48, 64, 16]:
-                        if w % test_w == 0:
-                            frame_count = w // test_w
-                            if frame_count > 1:
-                                frames = split_sprite_sheet(img, test_w, h)
-                                break
-                
-                # Last resort: single frame
-                if not frames:
-                    frames = [img]
-            except Exception as e:
-                # Silently fail - will use fallback
-                import sys
-                print(f"Warning: Could not load animation {pattern}: {e}", file=sys.stderr)
-                frames = []
+                return None  # No file found
+    
+    size = _image_size(single_path)
+    if not size:
+        return None
+    w, h = size
+    
+    # Check filename for frame count hint (e.g., "Walk_6.png" or "Idle_4.png")
+    frame_count_hint = None
+    # Try from pattern first
+    if "_" in pattern:
+        parts = pattern.split("_")
+        if parts[-1].isdigit():
+            frame_count_hint = int(parts[-1])
+    # Also try from actual filename
+    if not frame_count_hint:
+        filename_parts = single_path.stem.split("_")
+        if filename_parts[-1].isdigit():
+            frame_count_hint = int(filename_parts[-1])
+    
+    frame_size = None
+    # If we have a hint, split sprite sheet horizontally
+    if frame_count_hint and frame_count_hint > 1:
+        frame_w = w // frame_count_hint
+        if frame_w > 0 and frame_w <= w:
+            frame_size = [frame_w, h]
     
+    # If splitting failed or no hint, try common frame widths (16, 32, 48, 64)
+    if not frame_size:
+        for test_w in [32, 48, 64, 16]:
+            if w % test_w == 0 and w // test_w > 1:
+                frame_size = [test_w, h]
+                break
+    
+    # Last resort: single frame
+    return {"files": [single_path.as_posix()], "frame_size": frame_size}
+
+
+def load_described_animation(description: dict) -> list[pygame.Surface]:
+    """Load the frames for a description from describe_animation_sequence()."""
+    frames = []
+    frame_size = description.get("frame_size")
+    for file in description["files"]:
+        img = load_image(file)
+        if not img:
+            continue
+        if frame_size:
+            frames.extend(split_sprite_sheet(img, frame_size[0], frame_size[1]))
+        else:
+            frames.append(img)
     return frames
 
 
+def load_animation_sequence(base_path: Path, pattern: str, frame_count: int | None = None) -> list[pygame.Surface]:
+    """Load animation frames from numbered files or sprite sheet.
+    
+    Files are resolved from the asset manifest when it has an entry,
+    otherwise by searching base_path (see describe_animation_sequence).
+    """
+    from utils import asset_manifest
+    
+    try:
+        description = asset_manifest.lookup_animation(base_path, pattern, frame_count)
+        if description is None:
+            description = describe_animation_sequence(base_path, pattern, frame_count)
+        if description is None:
+            return []
+        return load_described_animation(description)
+    except Exception as e:
+        # Silently fail - will use fallback
+        import sys
+        print(f"Warning: Could not load animation {pattern}: {e}", file=sys.stderr)
+        return []
+
+
 class AnimationController:
     """Controls animations for an entity."""
     
@@ -0,0 +1,164 @@
+"""Build-time asset manifest.
+
+Loaders used to discover assets at startup by probing candidate paths and
+globbing folders. The manifest records what that discovery finds (resolved
+file paths and sprite sheet frame sizes) so the game can load assets
+directly. It is generated by build.py, or by running:
+
+    python -m utils.asset_manifest
+
+Entries are keyed by logical asset IDs rather than file paths: the name of
+the asset folder ("tiles", "levels", "enemy"), and "<folder>/<pattern>" for
+animations. Loaders fall back to scanning when there is no manifest or it
+has no entry for what they need. In development the files an entry lists
+are checked and the entry is ignored if any is missing. Frozen builds trust
+the manifest they were packaged with and skip the checks. Regenerate the
+manifest after adding assets or levels.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+
+MANIFEST_PATH = Path("assets") / "manifest.json"
+MANIFEST_VERSION = 2
+
+# Packaged builds ship their manifest next to the assets it lists
+TRUST_MANIFEST = bool(getattr(sys, "frozen", False))
+
+# Folders recorded at build time
+TILESET_FOLDERS = [Path("assets/tiles")]
+LEVEL_FOLDERS = [Path("levels")]
+
+_manifest: dict | None = None
+_manifest_loaded = False
+
+
+def load_manifest(path: str | Path = MANIFEST_PATH) -> dict | None:
+    """Return the manifest, reading it on first use. None if missing or outdated."""
+    global _manifest, _manifest_loaded
+    if not _manifest_loaded:
+        _manifest_loaded = True
+        try:
+            data = json.loads(Path(path).read_text())
+            _manifest = data if data.get("version") == MANIFEST_VERSION else None
+        except (OSError, ValueError, AttributeError):
+            _manifest = None
+    return _manifest
+
+
+def use_manifest(manifest: dict | None) -> None:
+    """Replace the manifest in use (None disables it until the next load)."""
+    global _manifest, _manifest_loaded
+    _manifest = manifest
+    _manifest_loaded = manifest is not None
+
+
+def _lookup(section: str, key: str):
+    manifest = load_manifest()
+    if manifest is None:
+        return None
+    return manifest.get(section, {}).get(key)
+
+
+def _all_exist(paths: list[str]) -> bool:
+    """Whether an entry's files are all there (assumed in frozen builds)."""
+    return TRUST_MANIFEST or all(Path(path).exists() for path in paths)
+
+
+def asset_id(folder: Path) -> str:
+    """Logical ID of an asset folder: its name, e.g. "tiles" for assets/tiles."""
+    return Path(folder).name
+
+
+def animation_id(base_path: Path, pattern: str, frame_count: int | None = None) -> str:
+    """Logical ID of an animation, e.g. "player/Owlet_Monster_Idle_4"."""
+    animation = f"{asset_id(base_path)}/{pattern}"
+    return f"{animation}@{frame_count}" if frame_count else animation
+
+
+def lookup_animation(base_path: Path, pattern: str, frame_count: int | None = None) -> dict | None:
+    """Manifest entry for load_animation_sequence(base_path, pattern, frame_count)."""
+    description = _lookup("animations", animation_id(base_path, pattern, frame_count))
+    if description and _all_exist(description["files"]):
+        return description
+    return None
+
+
+def lookup_enemy_sheets(enemy_path: Path) -> list[list[str]] | None:
+    """Farm-animal sheet paths under enemy_path, grouped by candidate folder."""
+    groups = _lookup("enemy_sheets", asset_id(enemy_path))
+    if groups is not None and _all_exist([path for group in groups for path in group]):
+        return groups
+    return None
+
+
+def lookup_tileset(folder: Path) -> Path | None | bool:
+    """Tileset image recorded for folder; None if it has none, False if unknown."""
+    entry = _lookup("tilesets", asset_id(folder))
+    if entry is None:
+        return False
+    if entry == "":
+        return None
+    return Path(entry) if _all_exist([entry]) else False
+
+
+def find_level_files(levels_dir: Path) -> list[Path]:
+    """Level CSV files in levels_dir, sorted by name."""
+    entry = _lookup("levels", asset_id(levels_dir))
+    if entry is not None and _all_exist(entry):
+        return [Path(path) for path in entry]
+    if not Path(levels_dir).exists():
+        return []
+    return sorted(Path(levels_dir).glob("*.csv"))
+
+
+def build_manifest() -> dict:
+    """Run every loader's discovery once and record the results."""
+    from utils.animations import describe_animation_sequence
+    from utils.sprites import PLAYER_ANIMATIONS, SPRITES_PATH, find_enemy_sheets
+    from utils.tileset import scan_tileset_folder
+
+    player_path = SPRITES_PATH / "player"
+    animations = {}
+    for _name, pattern, _fps in PLAYER_ANIMATIONS:
+        description = describe_animation_sequence(player_path, pattern)
+        if description is not None:
+            animations[animation_id(player_path, pattern)] = description
+
+    enemy_path = SPRITES_PATH / "enemy"
+    enemy_sheets = {asset_id(enemy_path): [[path.as_posix() for path in group] for group in find_enemy_sheets(enemy_path)]}
+
+    tilesets = {}
+    for folder in TILESET_FOLDERS:
+        image = scan_tileset_folder(folder)
+        tilesets[asset_id(folder)] = image.as_posix() if image else ""
+
+    levels = {}
+    for folder in LEVEL_FOLDERS:
+        levels[asset_id(folder)] = [path.as_posix() for path in sorted(folder.glob("*.csv"))]
+
+    return {
+        "version": MANIFEST_VERSION,
+        "animations": animations,
+        "enemy_sheets": enemy_sheets,
+        "tilesets": tilesets,
+        "levels": levels,
+    }
+
+
+def write_manifest(path: str | Path = MANIFEST_PATH) -> dict:
+    """Build the manifest, write it to path and start using it."""
+    manifest = build_manifest()
+    Path(path).write_text(json.dumps(manifest, indent=2))
+    use_manifest(manifest)
+    return manifest
+
+
+if __name__ == "__main__":
+    written = write_manifest()
+    print(f"Wrote {MANIFEST_PATH}: {len(written['animations'])} animations, "
+          f"{sum(len(group) for groups in written['enemy_sheets'].values() for group in groups)} enemy sheets, "
+          f"{sum(len(files) for files in written['levels'].values())} levels")
@@ -77,4 +77,32 @@ class Camera:
     def get_offset(self) -> tuple[int, int]:
         """Get the camera offset as (x, y), including screen shake."""
         return (int(-self.rect.x + self.shake_offset.x), int(-self.rect.y + self.shake_offset.y))
-
+    
+    def get_view_rect(self, margin: int = 0) -> pygame.Rect:
+        """Get the world-space area currently on screen (including shake), grown by margin."""
+        offset_x, offset_y = self.get_offset()
+        return pygame.Rect(-offset_x - margin, -offset_y - margin, self.width + margin * 2, self.height + margin * 2)
+    
+    def get_visible_tile_range(self, tile_size: int, cols: int, rows: int) -> tuple[int, int, int, int]:
+        """Get the on-screen tile range as (first_col, first_row, end_col, end_row), ends exclusive."""
+        view = self.get_view_rect()
+        first_col = max(0, view.left // tile_size)
+        first_row = max(0, view.top // tile_size)
+        end_col = min(cols, (view.right - 1) // tile_size + 1)
+        end_row = min(rows, (view.bottom - 1) // tile_size + 1)
+        return (first_col, first_row, max(first_col, end_col), max(first_row, end_row))
+    
+    def get_visible_sprites(self, *groups, margin: int = 0) -> list[pygame.sprite.Sprite]:
+        """Collect the on-screen sprites of several groups in draw order.
+        
+        A sprite that belongs to more than one of the groups is returned once,
+        at its last position in the sequence - the same stacking as drawing
+        every group in turn, without the repeated blits.
+        """
+        ordered: dict[pygame.sprite.Sprite, None] = {}
+        for group in groups:
+            for sprite in group:
+                ordered.pop(sprite, None)
+                ordered[sprite] = None
+        view = self.get_view_rect(margin)
+        return [sprite for sprite in ordered if view.colliderect(sprite.rect)]
@@ -0,0 +1,37 @@
+"""Internal render resolution.
+
+The world (level, sprites, lighting, particles) is drawn into an offscreen
+surface at RENDER_WIDTH x RENDER_HEIGHT, which matches the 30px tile grid the
+levels are authored for, and scaled up to the window once per frame. UI is
+drawn on the window afterwards so text stays sharp and mouse positions need
+no mapping.
+"""
+from __future__ import annotations
+
+import pygame
+
+import settings as S
+
+
+class RenderTarget:
+    """Offscreen world surface presented to the window at its size."""
+    
+    def __init__(self, display_size: tuple[int, int], render_size: tuple[int, int] | None = None):
+        self.display_size = tuple(display_size)
+        self.render_size = tuple(render_size or (S.RENDER_WIDTH, S.RENDER_HEIGHT))
+        surface = pygame.Surface(self.render_size)
+        # Match the display format so the per-frame scale doesn't convert pixels
+        self.surface = surface.convert() if pygame.display.get_surface() is not None else surface
+    
+    @property
+    def native(self) -> bool:
+        """True when rendering at the window resolution (no scaling)."""
+        return self.render_size == self.display_size
+    
+    def present(self, display: pygame.Surface) -> None:
+        """Copy the world surface onto display, scaled to fill it."""
+        self.display_size = display.get_size()
+        if self.native:
+            display.blit(self.surface, (0, 0))
+        else:
+            pygame.transform.scale(self.surface, self.display_size, display)
@@ -0,0 +1,56 @@
+"""Shared cache of transformed animation frames.
+
+Animated entities scale, tint and flip the current animation frame every
+update. The result only depends on the source frame and those parameters,
+so each variant is computed once here and shared by every entity using it.
+Returned surfaces are shared: copy one before drawing onto it.
+"""
+from __future__ import annotations
+
+import pygame
+
+
+# Variants are cheap to rebuild, so the cache is simply dropped when it gets this big
+MAX_CACHED_FRAMES = 2048
+
+# (id(frame), size, smooth, tint, tint_flags, flip_x) -> (frame, variant).
+# Keeping the source frame alive keeps its id from being reused.
+_cache: dict[tuple, tuple[pygame.Surface, pygame.Surface]] = {}
+
+
+def get_transformed_frame(
+    frame: pygame.Surface,
+    size: tuple[int, int] | None = None,
+    smooth: bool = False,
+    tint: tuple[int, int, int, int] | None = None,
+    tint_flags: int = pygame.BLEND_RGBA_MULT,
+    flip_x: bool = False,
+) -> pygame.Surface:
+    """Return frame scaled to size, multiplied by tint and mirrored, from the cache.
+
+    smooth selects smoothscale over scale. tint is applied as a fill with
+    tint_flags, after scaling and before flipping.
+    """
+    key = (id(frame), size, smooth, tint, tint_flags, flip_x)
+    entry = _cache.get(key)
+    if entry is not None:
+        return entry[1]
+
+    variant = frame
+    if size is not None and size != frame.get_size():
+        variant = pygame.transform.smoothscale(frame, size) if smooth else pygame.transform.scale(frame, size)
+    if tint is not None:
+        variant = variant.copy() if variant is frame else variant
+        variant.fill(tint, special_flags=tint_flags)
+    if flip_x:
+        variant = pygame.transform.flip(variant, True, False)
+
+    if len(_cache) >= MAX_CACHED_FRAMES:
+        _cache.clear()
+    _cache[key] = (frame, variant)
+    return variant
+
+
+def clear_frame_cache() -> None:
+    """Drop all cached variants."""
+    _cache.clear()
@@ -0,0 +1,41 @@
+"""Shared registry of procedurally drawn entity images.
+
+Pickups, traps, checkpoints and collectibles draw their sprite with
+pygame.draw calls. The result only depends on a few parameters (size,
+weapon type, ...), so each image is built once per parameter set and every
+instance references the same surface. Returned images are shared: copy one
+before drawing onto it.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable
+
+
+# (name, params) -> image built by the registered drawing function
+_images: dict[tuple[str, tuple[Hashable, ...]], Any] = {}
+
+
+def get_shared_image(name: str, build: Callable[..., Any], *params: Hashable) -> Any:
+    """Return build(*params), building it only the first time for this name and params.
+
+    name identifies the drawing function; params must be hashable. The value
+    is usually a pygame.Surface but can be anything derived from one (e.g. a
+    list of rotated frames).
+    """
+    key = (name, params)
+    image = _images.get(key)
+    if image is None:
+        image = build(*params)
+        _images[key] = image
+    return image
+
+
+def clear_image_registry() -> None:
+    """Drop all shared images (they are rebuilt on next use)."""
+    _images.clear()
+
+
+def shared_image_count() -> int:
+    """Number of distinct images currently held."""
+    return len(_images)
+
@@ -2,13 +2,22 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Tuple
 
+import numpy as np
 import pygame
 
 import settings as S
 
 
+# Glow sprites are cached per quantized radius and intensity, so pulsing
+# glows cycle through a small set of entries
+GLOW_RADIUS_STEP = 2
+GLOW_INTENSITY_STEPS = 20  # Intensity is rounded to 1/20ths
+GLOW_CACHE_SIZE = 128
+
+
 def create_glow_surface(
     radius: int,
     color: Tuple[int, int, int],
@@ -18,29 +27,77 @@ def create_glow_surface(
     """Create a glow surface with radial gradient."""
     size = radius * 2
     surface = pygame.Surface((size, size), pygame.SRCALPHA)
-    center = radius
-    
-    for y in range(size):
-        for x in range(size):
-            dx = x - center
-            dy = y - center
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance > radius:
-                continue
-            
-            # Calculate alpha based on distance (fade from center)
-            normalized_dist = distance / radius
-            alpha = int(255 * intensity * (1.0 - normalized_dist) ** falloff)
-            alpha = max(0, min(255, alpha))
-            
-            # Blend color with alpha
-            r, g, b = color
-            surface.set_at((x, y), (r, g, b, alpha))
+    if radius <= 0:
+        return surface
+    
+    # Distance of every pixel from the center, indexed [x, y] like surfarray
+    offsets = np.arange(size, dtype=np.float32) - radius
+    distance = np.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)
+    inside = distance <= radius
     
+    # Calculate alpha based on distance (fade from center)
+    normalized_dist = np.minimum(distance / radius, 1.0)
+    alpha = np.clip(255 * intensity * (1.0 - normalized_dist) ** falloff, 0, 255).astype(np.uint8)
+    
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[inside] = color
+    del pixels
+    pixels_alpha = pygame.surfarray.pixels_alpha(surface)
+    pixels_alpha[inside] = alpha[inside]
+    del pixels_alpha
     return surface
 
 
+@lru_cache(maxsize=GLOW_CACHE_SIZE)
+def _cached_glow(radius: int, color: Tuple[int, int, int], intensity_step: int, falloff: float) -> pygame.Surface:
+    return create_glow_surface(radius, color, intensity_step / GLOW_INTENSITY_STEPS, falloff)
+
+
+def get_glow_surface(
+    radius: int,
+    color: Tuple[int, int, int],
+    intensity: float = 1.0,
+    falloff: float = 0.5
+) -> pygame.Surface:
+    """Cached glow surface for the nearest quantized radius and intensity (shared, don't modify)."""
+    radius = max(GLOW_RADIUS_STEP, round(radius / GLOW_RADIUS_STEP) * GLOW_RADIUS_STEP)
+    return _cached_glow(radius, tuple(color), round(intensity * GLOW_INTENSITY_STEPS), falloff)
+
+
+def create_light_surface(
+    radius: int,
+    color: Tuple[int, int, int],
+    intensity: float = 1.0,
+    falloff: float = 1.0
+) -> pygame.Surface:
+    """Opaque light sprite for additive blending: color scaled by the radial falloff, black outside."""
+    size = max(1, radius * 2)
+    surface = pygame.Surface((size, size))
+    if radius <= 0:
+        return surface
+    offsets = np.arange(size, dtype=np.float32) - radius
+    distance = np.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)
+    strength = np.clip(intensity * (1.0 - np.minimum(distance / radius, 1.0)) ** falloff, 0.0, 1.0)
+    pygame.surfarray.blit_array(surface, (strength[:, :, None] * np.asarray(color, dtype=np.float32)).astype(np.uint8))
+    return surface
+
+
+@lru_cache(maxsize=GLOW_CACHE_SIZE)
+def _cached_light(radius: int, color: Tuple[int, int, int], intensity_step: int, falloff: float) -> pygame.Surface:
+    return create_light_surface(radius, color, intensity_step / GLOW_INTENSITY_STEPS, falloff)
+
+
+def get_light_surface(
+    radius: int,
+    color: Tuple[int, int, int],
+    intensity: float = 1.0,
+    falloff: float = 1.0
+) -> pygame.Surface:
+    """Cached light sprite, quantized like get_glow_surface (shared, don't modify)."""
+    radius = max(GLOW_RADIUS_STEP, round(radius / GLOW_RADIUS_STEP) * GLOW_RADIUS_STEP)
+    return _cached_light(radius, tuple(color), round(intensity * GLOW_INTENSITY_STEPS), falloff)
+
+
 def draw_glow(
     surface: pygame.Surface,
     x: int,
@@ -55,7 +112,7 @@ def draw_glow(
     pulse_radius = int(radius * (1.0 + pulse * 0.2))
     pulse_intensity = intensity * (1.0 + pulse * 0.3)
     
-    glow_surf = create_glow_surface(pulse_radius, color, pulse_intensity)
+    glow_surf = get_glow_surface(pulse_radius, color, pulse_intensity)
     glow_rect = glow_surf.get_rect(center=(x, y))
     surface.blit(glow_surf, glow_rect, special_flags=pygame.BLEND_ADD)
 
@@ -119,3 +176,78 @@ class GlowEffect:
 
 
 
+
+
+class Lightmap:
+    """Low-resolution lighting pass.
+    
+    Each frame, begin() clears the queued lights, add_light() queues lights
+    in world coordinates, and apply() adds them all into a map at 1/scale of
+    the screen resolution and upscales it once. The scene is then lit as
+    scene * ambient + scene * lights: everything is dimmed to the ambient
+    level, and each light adds its share of the original scene back on top,
+    so lit pixels can end up brighter than they were (up to double). Adding
+    a light only costs a small additive blit, however large its radius is
+    on screen.
+    """
+    
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        scale: int = S.LIGHTMAP_SCALE,
+        ambient: Tuple[int, int, int] = S.LIGHTMAP_AMBIENT
+    ):
+        self.scale = scale
+        self.ambient = ambient
+        self._offset = (0, 0)
+        self._lights: list[tuple] = []
+        self.resize(size)
+    
+    def resize(self, size: Tuple[int, int]) -> None:
+        """Match a new screen size."""
+        width, height = size
+        self.size = (width, height)
+        self.surface = pygame.Surface((-(-width // self.scale), -(-height // self.scale)))
+        self._upscaled = pygame.Surface(self.size)
+        # Scene copy the lights are multiplied onto before being added back
+        self._lit = pygame.Surface(self.size)
+    
+    def begin(self, camera_offset: Tuple[int, int] = (0, 0)) -> None:
+        """Start a new frame of lights."""
+        self._offset = camera_offset
+        self._lights.clear()
+    
+    def add_light(
+        self,
+        x: float,
+        y: float,
+        radius: int,
+        color: Tuple[int, int, int] = (255, 255, 255),
+        intensity: float = 1.0
+    ) -> None:
+        """Queue a light centered on world position (x, y)."""
+        scale = self.scale
+        map_radius = max(1, int(radius) // scale)
+        map_x = int((x + self._offset[0]) // scale)
+        map_y = int((y + self._offset[1]) // scale)
+        map_w, map_h = self.surface.get_size()
+        if (map_x + map_radius < 0 or map_y + map_radius < 0
+                or map_x - map_radius >= map_w or map_y - map_radius >= map_h):
+            return
+        light = get_light_surface(map_radius, color, intensity)
+        half = light.get_width() // 2
+        self._lights.append((light, (map_x - half, map_y - half), None, pygame.BLEND_ADD))
+    
+    def apply(self, surface: pygame.Surface) -> None:
+        """Dim surface to the ambient level and add the queued lights onto it."""
+        if surface.get_size() != self.size:
+            self.resize(surface.get_size())
+        if self._lights:
+            self.surface.fill((0, 0, 0))
+            self.surface.blits(self._lights, doreturn=False)
+            pygame.transform.smoothscale(self.surface, self.size, self._upscaled)
+            self._lit.blit(surface, (0, 0))
+            self._lit.blit(self._upscaled, (0, 0), special_flags=pygame.BLEND_MULT)
+        surface.fill(self.ambient, special_flags=pygame.BLEND_MULT)
+        if self._lights:
+            surface.blit(self._lit, (0, 0), special_flags=pygame.BLEND_ADD)
@@ -2,10 +2,79 @@
 from __future__ import annotations
 
 import math
-import random
 
+import numpy as np
 import pygame
 
+import settings as S
+
+
+# Maximum number of live particles; emission past this is dropped
+DEFAULT_CAPACITY = 4096
+GRAVITY = 0.2
+
+# Emitter priorities: cosmetic effects give way to gameplay feedback
+PRIORITY_LOW = 0     # Dust, trails, muzzle flashes
+PRIORITY_NORMAL = 1  # Bullet impacts
+PRIORITY_HIGH = 2    # Explosions, the player getting hit
+
+# Fraction of the budget in use at which emitters of each priority start
+# shrinking, and at which they stop emitting entirely. High priority is
+# only limited by capacity.
+LOD_THRESHOLDS = {
+    PRIORITY_LOW: (0.4, 0.8),
+    PRIORITY_NORMAL: (0.7, 1.0),
+}
+# Degraded particles keep at least this fraction of their lifetime
+MIN_LIFETIME_SCALE = 0.5
+# Emitters further than this outside the view are culled
+CULL_MARGIN = 120
+
+# Fading particles are drawn at one of this many pre-rendered opacity levels
+ALPHA_BUCKETS = 16
+
+
+def alpha_bucket(alpha: int) -> int:
+    """Atlas column holding the opacity closest above alpha (0-255)."""
+    return min(ALPHA_BUCKETS - 1, alpha * ALPHA_BUCKETS // 256)
+
+
+class ParticleAtlas:
+    """Pre-rendered particle circles.
+    
+    Each (color, size) pair gets one strip holding the circle at every alpha
+    bucket, side by side, so drawing a particle is a blit of a region of it.
+    """
+    
+    def __init__(self):
+        self._strips: dict[tuple[tuple[int, int, int], int], pygame.Surface] = {}
+    
+    def get_strip(self, color: tuple[int, int, int], size: int) -> pygame.Surface:
+        """Strip of ALPHA_BUCKETS cells, each size * 2 pixels square."""
+        key = (color, size)
+        strip = self._strips.get(key)
+        if strip is None:
+            cell = size * 2
+            strip = pygame.Surface((cell * ALPHA_BUCKETS, cell), pygame.SRCALPHA)
+            for bucket in range(ALPHA_BUCKETS):
+                alpha = (bucket + 1) * 256 // ALPHA_BUCKETS - 1
+                pygame.draw.circle(strip, (*color, alpha), (bucket * cell + size, size), size)
+            self._strips[key] = strip
+        return strip
+    
+    def region(self, size: int, alpha: int) -> tuple[int, int, int, int]:
+        """Area of a strip holding the circle at the given opacity."""
+        cell = size * 2
+        return (alpha_bucket(alpha) * cell, 0, cell, cell)
+    
+    def clear(self) -> None:
+        """Drop all pre-rendered strips."""
+        self._strips.clear()
+
+
+# Shared by every particle system
+particle_atlas = ParticleAtlas()
+
 
 class Particle:
     """Single particle in a particle effect."""
@@ -35,7 +104,7 @@ class Particle:
         """Update particle. Returns False if particle should be removed."""
         self.x += self.vx
         self.y += self.vy
-        self.vy += 0.2  # Gravity
+        self.vy += GRAVITY
         self.lifetime -= 1
         return self.lifetime > 0
     
@@ -49,26 +118,121 @@ class Particle:
         screen_y = int(self.y + offset_y)
         
         # Fade out over time
-        if self.fade:
-            alpha = int(255 * (self.lifetime / self.max_lifetime))
-            color = (*self.color, alpha)
-            # Create a surface with per-pixel alpha
-            particle_surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color, (self.size, self.size), self.size)
-            surface.blit(particle_surf, (screen_x - self.size, screen_y - self.size))
-        else:
-            pygame.draw.circle(surface, self.color, (screen_x, screen_y), self.size)
+        alpha = int(255 * (self.lifetime / self.max_lifetime)) if self.fade else 255
+        strip = particle_atlas.get_strip(tuple(self.color), self.size)
+        surface.blit(strip, (screen_x - self.size, screen_y - self.size), particle_atlas.region(self.size, alpha))
 
 
 class ParticleSystem:
-    """Manages a collection of particles."""
+    """Fixed-capacity particle engine.
     
-    def __init__(self):
-        self.particles: list[Particle] = []
+    Particle state lives in NumPy arrays (structure of arrays) so integration
+    is vectorized. Dead slots go back on a free list and are reused by later
+    emissions; nothing is allocated per particle.
+    
+    Emission is governed by a budget: as the live count approaches it,
+    lower-priority emitters spawn fewer, shorter-lived particles (see
+    LOD_THRESHOLDS), and emitters outside the view set with set_view() are
+    skipped.
+    """
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, budget: int | None = None):
+        self.capacity = capacity
+        self.budget = min(capacity, budget if budget is not None else S.PARTICLE_BUDGET)
+        self._view: pygame.Rect | None = None
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetime = np.ones(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.fade = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Stack of free slot indices; the top _free_count entries are available
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self._free_count = capacity
+        self._rng = np.random.default_rng()
+    
+    def __len__(self) -> int:
+        return self.capacity - self._free_count
+    
+    def set_view(self, view_rect: pygame.Rect | None) -> None:
+        """World-space area on screen; emitters well outside it are culled (None disables)."""
+        self._view = view_rect.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2) if view_rect is not None else None
+    
+    def lod_scale(self, priority: int) -> float:
+        """Fraction of a burst emitters of this priority may spawn right now."""
+        thresholds = LOD_THRESHOLDS.get(priority)
+        if thresholds is None:
+            return 1.0
+        start, end = thresholds
+        load = len(self) / self.budget
+        if load <= start:
+            return 1.0
+        if load >= end:
+            return 0.0
+        return (end - load) / (end - start)
+    
+    def emit(
+        self,
+        x: float,
+        y: float,
+        vx,
+        vy,
+        color,
+        lifetime,
+        size,
+        fade: bool = True,
+        priority: int = PRIORITY_NORMAL
+    ) -> None:
+        """Spawn a batch of particles at (x, y).
+        
+        vx, vy, lifetime and size are arrays of equal length (one entry per
+        particle); color is one (r, g, b) for the batch or an (n, 3) array.
+        The batch is trimmed according to priority and the current load.
+        """
+        if self._view is not None and not self._view.collidepoint(x, y):
+            return
+        vx = np.asarray(vx, dtype=np.float32)
+        lifetime = np.asarray(lifetime, dtype=np.int32)
+        count = len(vx)
+        scale = self.lod_scale(priority)
+        if scale < 1.0:
+            count = int(count * scale)
+            lifetime = np.maximum(1, (lifetime * max(MIN_LIFETIME_SCALE, scale)).astype(np.int32))
+        limit = self._free_count if priority >= PRIORITY_HIGH else self.budget - len(self)
+        count = min(count, limit)
+        if count <= 0:
+            return
+        top = self._free_count
+        slots = self._free[top - count:top]
+        self._free_count = top - count
+        
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = vx[:count]
+        self.vy[slots] = np.asarray(vy, dtype=np.float32)[:count]
+        color = np.asarray(color, dtype=np.uint8)
+        self.color[slots] = color[:count] if color.ndim == 2 else color
+        lifetime = lifetime[:count]
+        self.lifetime[slots] = lifetime
+        self.max_lifetime[slots] = lifetime
+        self.size[slots] = np.asarray(size, dtype=np.int32)[:count]
+        self.fade[slots] = fade
+        self.alive[slots] = True
     
     def add_particle(self, particle: Particle) -> None:
         """Add a particle to the system."""
-        self.particles.append(particle)
+        self.emit(particle.x, particle.y, [particle.vx], [particle.vy], particle.color,
+                  [particle.lifetime], [particle.size], particle.fade)
+    
+    def _radial(self, count: int, low: float, high: float) -> tuple[np.ndarray, np.ndarray]:
+        """Velocities in random directions with speeds uniform in [low, high)."""
+        angle = self._rng.uniform(0, 2 * math.pi, count)
+        speed = self._rng.uniform(low, high, count)
+        return np.cos(angle) * speed, np.sin(angle) * speed
     
     def create_explosion(
         self,
@@ -76,66 +240,55 @@ class ParticleSystem:
         y: float,
         color: tuple[int, int, int] = (255, 200, 0),
         count: int = 15,
-        speed: float = 3.0
+        speed: float = 3.0,
+        priority: int = PRIORITY_HIGH
     ) -> None:
         """Create an explosion effect at the given position."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed_variation = random.uniform(0.5, 1.5) * speed
-            vx = math.cos(angle) * speed_variation
-            vy = math.sin(angle) * speed_variation - 1.0  # Slight upward bias
-            lifetime = random.randint(20, 40)
-            size = random.randint(2, 4)
-            self.add_particle(Particle(x, y, vx, vy, color, lifetime, size))
+        rng = self._rng
+        vx, vy = self._radial(count, 0.5 * speed, 1.5 * speed)
+        vy -= 1.0  # Slight upward bias
+        self.emit(x, y, vx, vy, color, rng.integers(20, 41, count), rng.integers(2, 5, count), priority=priority)
     
     def create_dust(
         self,
         x: float,
         y: float,
         direction: int = 1,
-        count: int = 5
+        count: int = 5,
+        priority: int = PRIORITY_LOW
     ) -> None:
         """Create dust particles (for landing, running, etc.)."""
-        for _ in range(count):
-            vx = random.uniform(-1.0, 1.0) * direction + (direction * 0.5)
-            vy = random.uniform(-2.0, 0.0)
-            lifetime = random.randint(10, 20)
-            size = random.randint(1, 2)
-            color = (150, 150, 150)
-            self.add_particle(Particle(x, y, vx, vy, color, lifetime, size))
+        rng = self._rng
+        vx = rng.uniform(-1.0, 1.0, count) * direction + (direction * 0.5)
+        vy = rng.uniform(-2.0, 0.0, count)
+        self.emit(x, y, vx, vy, (150, 150, 150), rng.integers(10, 21, count), rng.integers(1, 3, count), priority=priority)
     
     def create_impact(
         self,
         x: float,
         y: float,
-        count: int = 8
+        count: int = 8,
+        priority: int = PRIORITY_NORMAL
     ) -> None:
         """Create impact particles (for bullet hits)."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1.0, 3.0)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lifetime = random.randint(8, 15)
-            size = random.randint(1, 2)
-            color = (200, 150, 100)
-            self.add_particle(Particle(x, y, vx, vy, color, lifetime, size))
+        rng = self._rng
+        vx, vy = self._radial(count, 1.0, 3.0)
+        self.emit(x, y, vx, vy, (200, 150, 100), rng.integers(8, 16, count), rng.integers(1, 3, count), priority=priority)
     
     def create_muzzle_flash(
         self,
         x: float,
         y: float,
         direction: int = 1,
-        count: int = 6
+        count: int = 6,
+        priority: int = PRIORITY_LOW
     ) -> None:
         """Create muzzle flash particles."""
-        for _ in range(count):
-            vx = direction * random.uniform(2.0, 4.0)
-            vy = random.uniform(-1.0, 1.0)
-            lifetime = random.randint(3, 8)
-            size = random.randint(2, 3)
-            color = (255, 255, 100)
-            self.add_particle(Particle(x, y, vx, vy, color, lifetime, size, fade=False))
+        rng = self._rng
+        vx = direction * rng.uniform(2.0, 4.0, count)
+        vy = rng.uniform(-1.0, 1.0, count)
+        self.emit(x, y, vx, vy, (255, 255, 100), rng.integers(3, 9, count), rng.integers(2, 4, count), fade=False,
+                  priority=priority)
     
     def create_bullet_trail(
         self,
@@ -143,32 +296,28 @@ class ParticleSystem:
         y: float,
         direction: int = 1,
         color: tuple[int, int, int] = (255, 255, 200),
-        count: int = 3
+        count: int = 3,
+        priority: int = PRIORITY_LOW
     ) -> None:
         """Create a trail effect behind a bullet."""
-        for _ in range(count):
-            vx = -direction * random.uniform(0.5, 1.5)
-            vy = random.uniform(-0.5, 0.5)
-            lifetime = random.randint(5, 10)
-            size = random.randint(1, 2)
-            self.add_particle(Particle(x, y, vx, vy, color, lifetime, size))
+        rng = self._rng
+        vx = -direction * rng.uniform(0.5, 1.5, count)
+        vy = rng.uniform(-0.5, 0.5, count)
+        self.emit(x, y, vx, vy, color, rng.integers(5, 11, count), rng.integers(1, 3, count), priority=priority)
     
     def create_impact_sparks(
         self,
         x: float,
         y: float,
         count: int = 12,
-        color: tuple[int, int, int] = (255, 200, 100)
+        color: tuple[int, int, int] = (255, 200, 100),
+        priority: int = PRIORITY_NORMAL
     ) -> None:
         """Create spark particles on impact."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1.5, 3.5)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 0.5  # Slight upward
-            lifetime = random.randint(8, 15)
-            size = random.randint(1, 2)
-            self.add_particle(Particle(x, y, vx, vy, color, lifetime, size))
+        rng = self._rng
+        vx, vy = self._radial(count, 1.5, 3.5)
+        vy -= 0.5  # Slight upward
+        self.emit(x, y, vx, vy, color, rng.integers(8, 16, count), rng.integers(1, 3, count), priority=priority)
     
     def create_big_explosion(
         self,
@@ -176,40 +325,65 @@ class ParticleSystem:
         y: float,
         color: tuple[int, int, int] = (255, 150, 0),
         count: int = 30,
-        speed: float = 5.0
+        speed: float = 5.0,
+        priority: int = PRIORITY_HIGH
     ) -> None:
         """Create a large explosion effect."""
+        rng = self._rng
         # Outer ring
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed_variation = random.uniform(0.5, 1.5) * speed
-            vx = math.cos(angle) * speed_variation
-            vy = math.sin(angle) * speed_variation - 1.5
-            lifetime = random.randint(25, 50)
-            size = random.randint(3, 5)
-            self.add_particle(Particle(x, y, vx, vy, color, lifetime, size))
+        vx, vy = self._radial(count, 0.5 * speed, 1.5 * speed)
+        vy -= 1.5
+        self.emit(x, y, vx, vy, color, rng.integers(25, 51, count), rng.integers(3, 6, count), priority=priority)
         
         # Inner bright flash
-        for _ in range(count // 2):
-            angle = random.uniform(0, 2 * math.pi)
-            speed_variation = random.uniform(0.3, 0.8) * speed
-            vx = math.cos(angle) * speed_variation
-            vy = math.sin(angle) * speed_variation
-            lifetime = random.randint(10, 20)
-            size = random.randint(4, 6)
-            bright_color = (255, 255, 200)
-            self.add_particle(Particle(x, y, vx, vy, bright_color, lifetime, size, fade=False))
+        inner = count // 2
+        vx, vy = self._radial(inner, 0.3 * speed, 0.8 * speed)
+        self.emit(x, y, vx, vy, (255, 255, 200), rng.integers(10, 21, inner), rng.integers(4, 7, inner), fade=False,
+                  priority=priority)
     
     def update(self) -> None:
-        """Update all particles."""
-        self.particles = [p for p in self.particles if p.update()]
+        """Advance all live particles one frame and recycle the expired ones."""
+        if self._free_count == self.capacity:
+            return
+        alive = self.alive
+        self.x[alive] += self.vx[alive]
+        self.y[alive] += self.vy[alive]
+        self.vy[alive] += GRAVITY
+        self.lifetime[alive] -= 1
+        
+        expired = np.flatnonzero(alive & (self.lifetime <= 0)).astype(np.int32)
+        if len(expired):
+            alive[expired] = False
+            top = self._free_count
+            self._free[top:top + len(expired)] = expired
+            self._free_count = top + len(expired)
     
     def draw(self, surface: pygame.Surface, camera_offset: tuple[int, int] = (0, 0)) -> None:
-        """Draw all particles."""
-        for particle in self.particles:
-            particle.draw(surface, camera_offset)
+        """Draw all particles as one batch of atlas blits."""
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return
+        offset_x, offset_y = camera_offset
+        sizes = self.size[live]
+        screen_x = (self.x[live] + offset_x).astype(np.int32) - sizes
+        screen_y = (self.y[live] + offset_y).astype(np.int32) - sizes
+        # Non-fading particles use the opaque bucket
+        alpha = np.where(self.fade[live], 255 * self.lifetime[live] // self.max_lifetime[live], 255)
+        cells = sizes * 2
+        area_x = np.minimum(ALPHA_BUCKETS - 1, alpha * ALPHA_BUCKETS // 256) * cells
+        
+        get_strip = particle_atlas.get_strip
+        surface.blits(
+            [(get_strip((r, g, b), size), (sx, sy), (ax, 0, cell, cell))
+             for (r, g, b), size, sx, sy, ax, cell in zip(
+                 self.color[live].tolist(), sizes.tolist(), screen_x.tolist(),
+                 screen_y.tolist(), area_x.tolist(), cells.tolist())],
+            doreturn=False,
+        )
     
     def clear(self) -> None:
         """Clear all particles."""
-        self.particles.clear()
-
+        self.alive[:] = False
+        self.lifetime[:] = 0
+        self._free[:] = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self._free_count = self.capacity
@@ -0,0 +1,63 @@
+"""Batched sprite drawing.
+
+Blitting sprites one at a time spends most of its time in Python call
+overhead. The render queue gathers (image, position) pairs per layer during
+the frame and submits each layer with a single Surface.blits() call.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import pygame
+
+
+# Draw order of the gameplay layers, bottom to top
+LAYER_ACTORS = 0       # Player and enemies
+LAYER_BULLETS = 1
+LAYER_ITEMS = 2        # Pickups, collectibles, weapon pickups, checkpoints
+LAYER_PROPS = 3        # Moving platforms and traps
+
+
+class RenderQueue:
+    """Collects blits by layer and draws them layer by layer in one call each.
+    
+    Within a layer, blits are drawn in the order they were queued.
+    """
+    
+    def __init__(self):
+        self._layers: dict[int, list[tuple[pygame.Surface, tuple[int, int]]]] = {}
+    
+    def add(self, image: pygame.Surface, dest: tuple[int, int], layer: int = 0) -> None:
+        """Queue one image at a screen position."""
+        self._layers.setdefault(layer, []).append((image, dest))
+    
+    def add_sprites(
+        self,
+        sprites: Iterable[pygame.sprite.Sprite],
+        offset: tuple[int, int] = (0, 0),
+        layer: int = 0
+    ) -> None:
+        """Queue each sprite's image at its rect moved by offset.
+        
+        Culling is up to the caller (see Camera.get_visible_sprites).
+        """
+        offset_x, offset_y = offset
+        self._layers.setdefault(layer, []).extend(
+            (sprite.image, (sprite.rect.x + offset_x, sprite.rect.y + offset_y)) for sprite in sprites
+        )
+    
+    def __len__(self) -> int:
+        return sum(len(blits) for blits in self._layers.values())
+    
+    def flush(self, surface: pygame.Surface) -> None:
+        """Draw every queued layer onto surface, lowest first, and empty the queue."""
+        for layer in sorted(self._layers):
+            blits = self._layers[layer]
+            if blits:
+                surface.blits(blits, doreturn=False)
+                blits.clear()
+    
+    def clear(self) -> None:
+        """Drop everything queued without drawing it."""
+        for blits in self._layers.values():
+            blits.clear()
@@ -4,6 +4,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pygame
+from utils import asset_manifest
 from utils.animations import load_animation_sequence, Animation, AnimationController, load_image as load_image_from_anim
 
 
@@ -16,6 +17,20 @@ FARM_GRID_ROWS = 8
 FARM_WALK_RIGHT_ROW = 3
 FARM_IDLE_RIGHT_ROW = 7
 
+SPRITES_PATH = Path("assets/sprites")
+
+# Player animations: (name, file pattern, fps)
+PLAYER_ANIMATIONS = [
+    ("idle", "Owlet_Monster_Idle_4", 6.0),
+    ("walk", "Owlet_Monster_Walk_6", 8.0),
+    ("run", "Owlet_Monster_Run_6", 10.0),
+    ("jump", "Owlet_Monster_Jump_8", 8.0),
+    ("attack", "Owlet_Monster_Attack1_4", 12.0),
+]
+
+# Available enemy types (farm animals)
+ENEMY_TYPES = ["Bull", "Calf", "Chick", "Lamb", "Piglet", "Rooster", "Sheep", "Turkey"]
+
 
 def _extract_row_frames(img: pygame.Surface, row: int, frame_w: int, frame_h: int) -> list[pygame.Surface]:
     """Extract non-empty frames from one row of a sprite sheet grid."""
@@ -27,11 +42,43 @@ def _extract_row_frames(img: pygame.Surface, row: int, frame_w: int, frame_h: in
     return frames
 
 
+def _enemy_locations(enemy_path: Path) -> list[Path]:
+    # Check common locations: PNG/With_shadow/, PNG/Without_shadow/, Tiled/
+    farm_path = enemy_path / "craftpix-net-291971-free-top-down-animals-farm-pixel-art-sprites"
+    return [
+        farm_path / "PNG" / "With_shadow",
+        farm_path / "PNG" / "Without_shadow",
+        farm_path / "Tiled",
+        enemy_path,  # Direct in enemy folder
+    ]
+
+
+def find_enemy_sheets(enemy_path: Path) -> list[list[Path]]:
+    """Find farm-animal animation sheets, one list per candidate folder that has any."""
+    groups = []
+    for loc in _enemy_locations(enemy_path):
+        if not loc.exists():
+            continue
+        sheets = []
+        for enemy_type in ENEMY_TYPES:
+            # Try with shadow first (looks better)
+            anim_file = loc / f"{enemy_type}_animation_with_shadow.png"
+            if not anim_file.exists():
+                anim_file = loc / f"{enemy_type}_animation_without_shadow.png"
+            if not anim_file.exists():
+                anim_file = loc / f"{enemy_type}_animation.png"
+            if anim_file.exists():
+                sheets.append(anim_file)
+        if sheets:
+            groups.append(sheets)
+    return groups
+
+
 class SpriteLoader:
     """Loads and manages sprite assets with animation support."""
 
     def __init__(self) -> None:
-        self.base_path = Path("assets/sprites")
+        self.base_path = SPRITES_PATH
         self.player_animations: dict[str, Animation] = {}
         self.enemy_animations: dict[str, Animation] = {}
         self.enemy_types: list[dict[str, Animation]] = []  # Multiple enemy types
@@ -44,22 +91,10 @@ class SpriteLoader:
         player_path = self.base_path / "player"
         if player_path.exists():
             # Load animations with frame detection from filename
-            idle_frames = load_animation_sequence(player_path, "Owlet_Monster_Idle_4")
-            walk_frames = load_animation_sequence(player_path, "Owlet_Monster_Walk_6")
-            run_frames = load_animation_sequence(player_path, "Owlet_Monster_Run_6")
-            jump_frames = load_animation_sequence(player_path, "Owlet_Monster_Jump_8")
-            attack_frames = load_animation_sequence(player_path, "Owlet_Monster_Attack1_4")
-            
-            if idle_frames:
-                self.player_animations["idle"] = Animation(idle_frames, fps=6.0)
-            if walk_frames:
-                self.player_animations["walk"] = Animation(walk_frames, fps=8.0)
-            if run_frames:
-                self.player_animations["run"] = Animation(run_frames, fps=10.0)
-            if jump_frames:
-                self.player_animations["jump"] = Animation(jump_frames, fps=8.0)
-            if attack_frames:
-                self.player_animations["attack"] = Animation(attack_frames, fps=12.0)
+            for name, pattern, fps in PLAYER_ANIMATIONS:
+                frames = load_animation_sequence(player_path, pattern)
+                if frames:
+                    self.player_animations[name] = Animation(frames, fps=fps)
             
             # Fallback single frame
             if not self.player_animations:
@@ -70,34 +105,14 @@ class SpriteLoader:
         # Enemy animations - new farm animal sprites
         enemy_path = self.base_path / "enemy"
         if enemy_path.exists():
-            # Look for farm animal animation spritesheets
-            # Check common locations: PNG/With_shadow/, PNG/Without_shadow/, Tiled/
-            possible_locations = [
-                enemy_path / "craftpix-net-291971-free-top-down-animals-farm-pixel-art-sprites" / "PNG" / "With_shadow",
-                enemy_path / "craftpix-net-291971-free-top-down-animals-farm-pixel-art-sprites" / "PNG" / "Without_shadow",
-                enemy_path / "craftpix-net-291971-free-top-down-animals-farm-pixel-art-sprites" / "Tiled",
-                enemy_path,  # Direct in enemy folder
-            ]
-            
-            # Available enemy types (farm animals)
-            enemy_types = ["Bull", "Calf", "Chick", "Lamb", "Piglet", "Rooster", "Sheep", "Turkey"]
+            # Look for farm animal animation spritesheets, from the manifest if it has them
+            sheet_groups = asset_manifest.lookup_enemy_sheets(enemy_path)
+            if sheet_groups is None:
+                sheet_groups = find_enemy_sheets(enemy_path)
             
             # Load all available enemy types
-            for loc in possible_locations:
-                if not loc.exists():
-                    continue
-
-                # Try to find enemy animation files for each type
-                for enemy_type in enemy_types:
-                    # Try with shadow first (looks better)
-                    anim_file = loc / f"{enemy_type}_animation_with_shadow.png"
-                    if not anim_file.exists():
-                        anim_file = loc / f"{enemy_type}_animation_without_shadow.png"
-                    if not anim_file.exists():
-                        anim_file = loc / f"{enemy_type}_animation.png"
-
-                    if not anim_file.exists():
-                        continue
+            for sheets in sheet_groups:
+                for anim_file in sheets:
                     img = load_image_from_anim(anim_file)
                     if not img:
                         continue
@@ -135,7 +150,7 @@ class SpriteLoader:
             
             # Fallback - try to load any PNG from enemy folder
             if not self.enemy_animations:
-                for loc in possible_locations:
+                for loc in _enemy_locations(enemy_path):
                     if loc.exists():
                         for png_file in loc.glob("*.png"):
                             # Skip shadow-only files and coupons
@@ -1,18 +1,92 @@
 """Tileset loading and rendering utilities."""
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
 from pathlib import Path
 import pygame
+from utils import asset_manifest
 from utils.animations import load_image
 
 
+METADATA_VERSION = 2
+
+
+@dataclass
+class TileInfo:
+    """Per-tile metadata computed from the tileset's alpha channel."""
+    coverage: float  # Fraction of pixels that are not fully transparent
+    bbox: tuple[int, int, int, int] | None  # (x, y, w, h) of visible pixels in native tile space
+    # Alpha at the 3x3 quarter points of the tile as scaled for drawing
+    samples: tuple[int, ...] = ()
+
+    @property
+    def transparent(self) -> bool:
+        return self.bbox is None
+
+    def opaque_samples(self, threshold: int = 0) -> int:
+        """How many of the sampled points have alpha above threshold."""
+        return sum(alpha > threshold for alpha in self.samples)
+
+
+def sample_tile_alpha(tile: pygame.Surface) -> tuple[int, ...]:
+    """Alpha at the quarter points of tile (3x3 samples, column by column)."""
+    w, h = tile.get_size()
+    return tuple(
+        tile.get_at((x, y))[3]
+        for x in (w // 4, w // 2, 3 * w // 4)
+        for y in (h // 4, h // 2, 3 * h // 4)
+    )
+
+
+def metadata_path_for(image_path: str | Path) -> Path:
+    """Where tile metadata for image_path is stored (next to the image)."""
+    image_path = Path(image_path)
+    return image_path.with_name(f"{image_path.stem}.tiles.json")
+
+
+def compute_tile_info(img: pygame.Surface, tile_w: int, tile_h: int) -> list[TileInfo]:
+    """Coverage and bounding box for every tile of a sheet, row by row."""
+    cols = img.get_width() // tile_w
+    rows = img.get_height() // tile_h
+    if not cols or not rows:
+        return []
+    # array_alpha is (x, y); arrange it as (row, col, y, x) tile blocks
+    alpha = pygame.surfarray.array_alpha(img)[:cols * tile_w, :rows * tile_h]
+    visible = alpha.reshape(cols, tile_w, rows, tile_h).transpose(2, 0, 3, 1) > 0
+    coverage = visible.mean(axis=(2, 3))
+    rows_any = visible.any(axis=3)  # (row, col, y)
+    cols_any = visible.any(axis=2)  # (row, col, x)
+    top = rows_any.argmax(axis=2)
+    bottom = tile_h - rows_any[:, :, ::-1].argmax(axis=2)
+    left = cols_any.argmax(axis=2)
+    right = tile_w - cols_any[:, :, ::-1].argmax(axis=2)
+
+    info = []
+    for row in range(rows):
+        for col in range(cols):
+            if coverage[row, col] > 0:
+                bbox = (int(left[row, col]), int(top[row, col]),
+                        int(right[row, col] - left[row, col]), int(bottom[row, col] - top[row, col]))
+            else:
+                bbox = None
+            info.append(TileInfo(float(coverage[row, col]), bbox))
+    return info
+
+
 class Tileset:
-    """Loads and manages a tileset spritesheet."""
+    """Loads and manages a tileset spritesheet.
+
+    Tiles are scaled to tile_width x tile_height once at load (the sheet's
+    native tile size is auto-detected) and converted to the display format
+    when a display exists. Per-tile metadata is cached next to the image.
+    """
     
     def __init__(self, image_path: str | Path, tile_width: int, tile_height: int) -> None:
         self.tile_width = tile_width
         self.tile_height = tile_height
         self.tiles: list[pygame.Surface] = []
+        self.tile_info: list[TileInfo] = []
         self._actual_tile_width = tile_width
         self._actual_tile_height = tile_height
         self._load_tileset(image_path)
@@ -38,12 +112,13 @@ class Tileset:
         return (self.tile_width, self.tile_height)
     
     def _load_tileset(self, image_path: str | Path) -> None:
-        """Load tileset image and split into individual tiles."""
+        """Load tileset image, split it into tiles and load or compute their metadata."""
         img = load_image(image_path)
         if not img:
             # Create a fallback single tile
             self.tiles = [pygame.Surface((self.tile_width, self.tile_height))]
             self.tiles[0].fill((100, 100, 100))
+            self.tile_info = [TileInfo(1.0, (0, 0, self.tile_width, self.tile_height), sample_tile_alpha(self.tiles[0]))]
             return
         
         img_w, img_h = img.get_size()
@@ -56,18 +131,74 @@ class Tileset:
         cols = img_w // actual_w
         rows = img_h // actual_h
         
+        can_convert = pygame.display.get_surface() is not None
+        target_size = (self.tile_width, self.tile_height)
         for row in range(rows):
             for col in range(cols):
                 x = col * actual_w
                 y = row * actual_h
                 tile = img.subsurface((x, y, actual_w, actual_h))
+                if tile.get_size() != target_size:
+                    tile = pygame.transform.scale(tile, target_size)
+                # Own copy in display format, so the full sheet can be released
+                tile = tile.convert_alpha() if can_convert else tile.copy()
                 self.tiles.append(tile)
+
+        self.tile_info = self._load_metadata(image_path, img, actual_w, actual_h)
+
+    def _load_metadata(self, image_path: str | Path, img: pygame.Surface, tile_w: int, tile_h: int) -> list[TileInfo]:
+        """Read cached tile metadata if it matches the image, else compute and save it."""
+        path = metadata_path_for(image_path)
+        try:
+            stat = Path(image_path).stat()
+            source = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "tile_size": [tile_w, tile_h],
+                "scaled_size": [self.tile_width, self.tile_height],
+            }
+        except OSError:
+            source = None
+        try:
+            data = json.loads(path.read_text())
+            if source is not None and data.get("version") == METADATA_VERSION and data.get("source") == source:
+                return [
+                    TileInfo(coverage, tuple(bbox) if bbox else None, tuple(samples))
+                    for coverage, bbox, samples in data["tiles"]
+                ]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        info = compute_tile_info(img, tile_w, tile_h)
+        # Samples come from the scaled tiles, the ones actually drawn
+        for tile, tile_info in zip(self.tiles, info):
+            tile_info.samples = sample_tile_alpha(tile)
+        if source is not None:
+            data = {
+                "version": METADATA_VERSION,
+                "source": source,
+                "tiles": [
+                    [round(tile.coverage, 4), list(tile.bbox) if tile.bbox else None, list(tile.samples)]
+                    for tile in info
+                ],
+            }
+            try:
+                path.write_text(json.dumps(data, separators=(",", ":")))
+            except OSError:
+                pass
+        return info
     
     def get_tile(self, index: int) -> pygame.Surface:
         """Get tile by index (0-based). Returns first tile if index out of range."""
         if index < 0 or index >= len(self.tiles):
             return self.tiles[0] if self.tiles else pygame.Surface((self.tile_width, self.tile_height))
         return self.tiles[index]
+
+    def get_tile_info(self, index: int) -> TileInfo:
+        """Get metadata for tile index. Out-of-range indices count as transparent."""
+        if 0 <= index < len(self.tile_info):
+            return self.tile_info[index]
+        return TileInfo(0.0, None)
     
     def get_tile_count(self) -> int:
         """Get total number of tiles in tileset."""
@@ -77,6 +208,19 @@ class Tileset:
 def find_tileset_in_folder(base_path: Path, preferred_names: list[str] = None) -> Path | None:
     """Find a tileset image file in the given folder.
     
+    Uses the asset manifest's entry for the folder when there is one,
+    otherwise scans it (see scan_tileset_folder).
+    """
+    if preferred_names is None:
+        recorded = asset_manifest.lookup_tileset(base_path)
+        if recorded is not False:
+            return recorded
+    return scan_tileset_folder(base_path, preferred_names)
+
+
+def scan_tileset_folder(base_path: Path, preferred_names: list[str] = None) -> Path | None:
+    """Search a folder for a tileset image.
+    
     Looks for common tileset filenames or any PNG file.
     """
     if preferred_names is None: